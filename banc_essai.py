@@ -0,0 +1,312 @@
+#!/usr/bin/python3
+""" Banc d'essai reproductible des moteurs d'évolution et de l'affichage
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Fait évoluer des structures représentatives (exemples de la bibliothèque interne et fichiers
+  choisis de la base de formes du site LifeWiki, s'ils sont installés) d'un nombre fixe de
+  générations, sur plusieurs tailles de plateau et avec les moteurs d'évolution demandés
+- Mesure séparément :
+    - les générations par seconde, d'après la durée des seuls appels au moteur d'évolution
+    - le pic de mémoire allouée (tracemalloc), lors d'une seconde exécution car le suivi des
+      allocations ralentit le calcul (la mémoire des processus du moteur parallèle n'est pas comptée)
+    - si c'est demandé, la durée moyenne du dessin des cases modifiées de chaque génération et du
+      plateau entier, avec les fonctions d'affichage du programme principal sur une fenêtre PyGame
+      factice (le transfert à l'écran n'est donc pas compté)
+- Chaque résultat est ajouté à un historique au format JSON Lines (une ligne JSON par mesure) avec
+  la version, la machine et la date, et comparé au précédent résultat de même configuration, ce qui
+  rend visibles les régressions d'une version à l'autre
+- N'importe PyGame que pour mesurer l'affichage
+Utilisation :
+  python3 banc_essai.py
+  python3 banc_essai.py -m python numpy binaire -t 200x200 1000x1000 -g 1000 --affichage
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from langues import *
+from bibliotheque import *
+from configuration import FICHIER_CONFIGURATION, charger_ou_creer_fichier_de_configuration
+from catalogue import REPERTOIRE_BIBLIOTHEQUE, lister_structures
+from fichiers import charger_regle_dans_fichier
+from regles import compiler_regle
+import moteur
+from moteur import CELLULE_MORTE, MOTEURS
+from vie_lot import charger_structure
+
+VERSION = "1.2"
+FICHIER_HISTORIQUE = "banc_essai.jsonl"
+GENERATIONS = 500
+TAILLES = ("200x200", "500x500", "1000x1000") # colonnes x lignes
+LARGEUR_CASE = 3 # pixels, dessin par tableau de pixels si NumPy est installé
+
+# Exemples de la bibliothèque interne
+STRUCTURES_INTERNES = (
+    "Canon : Canon à planeurs de Bill Gosper",
+    "Vaisseau : Suiveur de Paul Schick",
+    "Puffeur : Bill Gosper 1",
+    "Mathusalem : Pentomino R"
+)
+# Fichiers de la base de formes du site LifeWiki (sans extension)
+STRUCTURES_LIFEWIKI = ("gosperglidergun", "schickengine", "acorn", "rpentomino", "spacefiller1")
+
+########################################################################
+def lister_cellules(structure):
+    """ Retourne la largeur, la hauteur et la liste des coordonnées (colonne, ligne) des cellules
+    vivantes d'une structure (liste de lignes) """
+    cellules = []
+    for ligne, cases in enumerate(structure):
+        for colonne, case in enumerate(cases):
+            if case != CELLULE_MORTE:
+                cellules.append((colonne, ligne))
+    return (len(structure[0]) if structure else 0), len(structure), cellules
+
+########################################################################
+def choisir_structures(repertoire, chemins_fichiers, langue):
+    """ Retourne la liste des structures à mesurer sous forme de dictionnaires {"nom", "source",
+    "structure" (largeur, hauteur et cellules vivantes), "regle" (de l'en-tête du fichier ou None)} """
+    structures = []
+    for nom in STRUCTURES_INTERNES:
+        structures.append({"nom": nom, "source": "bibliotheque", "structure": lister_cellules(bibliotheque[nom]), "regle": None})
+
+    # Les fichiers de la base de formes sont cherchés sous leurs deux formats et dans ses archives
+    chemins = []
+    if os.path.isdir(repertoire):
+        fichiers = lister_structures(repertoire)
+        for nom in STRUCTURES_LIFEWIKI:
+            for nom_fichier in (nom + ".rle", nom + ".cells"):
+                if nom_fichier in fichiers:
+                    chemins.append(fichiers[nom_fichier][0])
+                    break
+    chemins += chemins_fichiers
+
+    for chemin_fichier in chemins:
+        structure = charger_structure(chemin_fichier, langue)
+        if structure is None:
+            print(texte1[langue]["AVERTISSEMENT"] + ": " + texte1[langue]["FICHIER"] + "=" + chemin_fichier)
+            continue
+        structures.append({"nom": os.path.basename(chemin_fichier), "source": chemin_fichier, "structure": structure, "regle": charger_regle_dans_fichier(chemin_fichier)})
+    return structures
+
+########################################################################
+def preparer_affichage(simulation, largeur_case):
+    """ Retourne le module du programme principal prêt à dessiner le plateau de la simulation sur
+    une fenêtre PyGame factice """
+    # Le pilote factice dessine en mémoire, sans ouvrir de fenêtre
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    import pygame
+    import vie
+
+    # Les fonctions d'affichage utilisent les variables globales du programme principal
+    pygame.display.init()
+    vie.parametres = {"LARGEUR_CASE": largeur_case, "MOTEUR": simulation["moteur"]}
+    vie.nb_lignes = simulation["nb_lignes"]
+    vie.nb_colonnes = simulation["nb_colonnes"]
+    vie.largeur_fenetre = vie.EPAISSEUR_LIGNE + (largeur_case + vie.EPAISSEUR_LIGNE) * vie.nb_colonnes
+    vie.hauteur_fenetre = vie.EPAISSEUR_LIGNE + (largeur_case + vie.EPAISSEUR_LIGNE) * vie.nb_lignes
+    vie.fenetre = pygame.display.set_mode((vie.largeur_fenetre, vie.hauteur_fenetre))
+    vie.fond = vie.creer_fond()
+    vie.sprites = vie.creer_sprites()
+    vie.pixels = vie.creer_pixels()
+    vie.plateau = simulation["plateau"]
+    return vie
+
+########################################################################
+def executer(structure, parametres, regle, nb_colonnes, nb_lignes, nb_generations, affichage=None):
+    """ Fait évoluer une structure centrée sur le plateau et retourne le nombre de générations
+    calculées, la durée totale des appels au moteur d'évolution, les durées totales du dessin des
+    cases modifiées et du plateau entier si la largeur des cases de l'affichage est indiquée (en
+    nanosecondes) et la population finale """
+    largeur, hauteur, cellules = structure
+    simulation = moteur.creer_simulation(parametres, regle, nb_lignes, nb_colonnes, affichage=affichage is not None)
+    moteur.coller_cellules(simulation, cellules, (nb_colonnes - largeur) // 2, (nb_lignes - hauteur) // 2)
+    simulation["chronometre"] = {}
+    if affichage is not None:
+        vie = preparer_affichage(simulation, affichage)
+
+    duree_moteur = 0
+    duree_cellules = 0
+    statut = moteur.demarrer(simulation)
+    while simulation["generation"] + simulation["generations_par_cycle"] <= nb_generations + 1 and statut["population"] > 0:
+        resultat = moteur.avancer(simulation)
+        statut = resultat["statut"]
+        duree_moteur += simulation["chronometre"]["moteur"]
+        if affichage is not None:
+            debut = time.perf_counter_ns()
+            vie.afficher_cellules(resultat["modifications"])
+            duree_cellules += time.perf_counter_ns() - debut
+
+    duree_plateau = 0
+    if affichage is not None:
+        debut = time.perf_counter_ns()
+        vie.afficher_plateau()
+        duree_plateau = time.perf_counter_ns() - debut
+    moteur.terminer(simulation)
+    return simulation["generation"] - 1, duree_moteur, duree_cellules, duree_plateau, statut["population"]
+
+########################################################################
+def mesurer_memoire(structure, parametres, regle, nb_colonnes, nb_lignes, nb_generations):
+    """ Retourne le pic de mémoire allouée en octets pendant l'évolution d'une structure """
+    tracemalloc.start()
+    try:
+        executer(structure, parametres, regle, nb_colonnes, nb_lignes, nb_generations)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+########################################################################
+def identifier_version():
+    """ Retourne la version du programme, suivie du commit Git courant s'il est connu """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+        return VERSION + "-" + commit
+    except (OSError, subprocess.CalledProcessError):
+        return VERSION
+
+########################################################################
+def charger_historique(chemin_fichier):
+    """ Retourne la liste des résultats de l'historique (vide s'il n'existe pas) """
+    resultats = []
+    if os.path.isfile(chemin_fichier):
+        with open(chemin_fichier, "r", encoding="utf-8") as fichier:
+            for ligne in fichier:
+                try:
+                    resultats.append(json.loads(ligne))
+                except ValueError:
+                    # Ligne tronquée par une interruption : elle est ignorée
+                    continue
+    return resultats
+
+########################################################################
+def configuration_resultat(resultat):
+    """ Retourne ce qui identifie la configuration mesurée par un résultat, pour le comparer aux
+    résultats précédents de même configuration (l'affichage changeant le travail de certains moteurs
+    d'évolution, qui tiennent alors le plateau à jour) """
+    return (resultat["structure"], resultat["moteur"], resultat["regle"], resultat["colonnes"], resultat["lignes"], resultat["generations"], resultat["largeur_case"], resultat["machine"])
+
+########################################################################
+def ajouter_resultat(chemin_fichier, resultat):
+    """ Ajoute un résultat à la fin de l'historique """
+    with open(chemin_fichier, "a", encoding="utf-8") as fichier:
+        fichier.write(json.dumps(resultat, ensure_ascii=False) + "\n")
+
+########################################################################
+def formater_ecart(valeur, precedente):
+    """ Retourne l'écart en pourcentage d'une mesure à la précédente, ou une chaîne vide """
+    if valeur is None or not precedente:
+        return ""
+    return format((valeur - precedente) / precedente * 100, "+.1f") + "%"
+
+### Programme principal ################################################
+
+# Protection nécessaire au moteur parallèle : sous Windows, ses processus de calcul réimportent ce
+# module
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Le jeu de la Vie, banc d'essai")
+    analyseur.add_argument("-m", "--moteurs", nargs="+", choices=MOTEURS, help="moteurs d'évolution (défaut : celui de la configuration)")
+    analyseur.add_argument("-t", "--tailles", nargs="+", default=TAILLES, help="tailles de plateau en colonnes x lignes (défaut : " + " ".join(TAILLES) + ")")
+    analyseur.add_argument("-g", "--generations", type=int, default=GENERATIONS, help="nombre de générations (défaut : " + str(GENERATIONS) + ")")
+    analyseur.add_argument("-s", "--structures", nargs="+", default=[], help="fichiers .cells ou .rle à mesurer en plus des structures représentatives")
+    analyseur.add_argument("-b", "--bibliotheque", default=REPERTOIRE_BIBLIOTHEQUE, help="répertoire de la base de formes (défaut : " + REPERTOIRE_BIBLIOTHEQUE + ")")
+    analyseur.add_argument("-o", "--historique", default=FICHIER_HISTORIQUE, help="historique des résultats au format JSON Lines (défaut : " + FICHIER_HISTORIQUE + ")")
+    analyseur.add_argument("-a", "--affichage", action="store_true", help="mesurer aussi l'affichage (nécessite PyGame)")
+    analyseur.add_argument("--case", type=int, default=LARGEUR_CASE, help="largeur des cases pour l'affichage en pixels (défaut : " + str(LARGEUR_CASE) + ")")
+    analyseur.add_argument("--sans-memoire", action="store_true", help="ne pas mesurer le pic de mémoire")
+    analyseur.add_argument("-c", "--configuration", default=FICHIER_CONFIGURATION, help="fichier de configuration (défaut : " + FICHIER_CONFIGURATION + ")")
+    arguments = analyseur.parse_args()
+
+    # Le fichier de configuration n'est pas créé s'il n'existe pas
+    parametres = charger_ou_creer_fichier_de_configuration(arguments.configuration, creer=False)
+    langue = parametres["LANGUE"]
+    moteurs = arguments.moteurs or [parametres["MOTEUR"]]
+    tailles = []
+    for taille in arguments.tailles:
+        try:
+            nb_colonnes, nb_lignes = (int(dimension) for dimension in taille.lower().split("x"))
+        except ValueError:
+            analyseur.error("--tailles " + taille)
+        tailles.append((nb_colonnes, nb_lignes))
+
+    structures = choisir_structures(arguments.bibliotheque, arguments.structures, langue)
+    historique = {}
+    for resultat in charger_historique(arguments.historique):
+        historique[configuration_resultat(resultat)] = resultat
+    contexte = {
+        "version": identifier_version(),
+        "python": platform.python_version(),
+        "machine": platform.node() + " " + platform.machine(),
+        "systeme": platform.platform()
+    }
+
+    print("structure".ljust(40) + " moteur     taille     gen/s     écart  mémoire (Ko)  affichage (ms)")
+    for nom_moteur in moteurs:
+        try:
+            moteur.charger_moteur(nom_moteur)
+        except ImportError:
+            print(texte1[langue]["AVERTISSEMENT"] + ": " + texte1[langue]["MOTEUR_INDISPONIBLE"] + nom_moteur)
+            continue
+        parametres_moteur = dict(parametres, MOTEUR=nom_moteur)
+        for description in structures:
+            # Règle de l'en-tête du fichier, sinon de la configuration
+            texte_regle = parametres["REGLE"]
+            if description["regle"] is not None:
+                try:
+                    compiler_regle(description["regle"])
+                    texte_regle = description["regle"]
+                except ValueError:
+                    print(texte1[langue]["AVERTISSEMENT"] + ": " + texte1[langue]["REGLE_INCONNUE"] + description["regle"])
+            regle = compiler_regle(texte_regle)
+            try:
+                moteur.verifier_regle(nom_moteur, regle)
+            except ValueError:
+                print(texte1[langue]["AVERTISSEMENT"] + ": " + texte1[langue]["REGLE_B0"] + texte_regle)
+                continue
+
+            for nb_colonnes, nb_lignes in tailles:
+                largeur, hauteur, cellules = description["structure"]
+                if largeur > nb_colonnes or hauteur > nb_lignes:
+                    continue
+                nb_generations, duree_moteur, duree_cellules, duree_plateau, population = executer(
+                    description["structure"], parametres_moteur, regle, nb_colonnes, nb_lignes, arguments.generations,
+                    arguments.case if arguments.affichage else None)
+                memoire = None
+                if not arguments.sans_memoire:
+                    memoire = mesurer_memoire(description["structure"], parametres_moteur, regle, nb_colonnes, nb_lignes, arguments.generations)
+
+                resultat = dict(contexte)
+                resultat.update({
+                    "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "structure": description["nom"],
+                    "source": description["source"],
+                    "moteur": nom_moteur,
+                    "regle": texte_regle,
+                    "colonnes": nb_colonnes,
+                    "lignes": nb_lignes,
+                    "generations": arguments.generations,
+                    "generations_calculees": nb_generations,
+                    "population_finale": population,
+                    "duree_moteur_ns": duree_moteur,
+                    "generations_par_seconde": round(nb_generations * 1e9 / duree_moteur, 1) if duree_moteur else None,
+                    "memoire_max": memoire,
+                    "largeur_case": arguments.case if arguments.affichage else None,
+                    "affichage_cellules_ns": duree_cellules // max(nb_generations, 1) if arguments.affichage else None,
+                    "affichage_plateau_ns": duree_plateau if arguments.affichage else None
+                })
+                precedent = historique.get(configuration_resultat(resultat))
+                ajouter_resultat(arguments.historique, resultat)
+                historique[configuration_resultat(resultat)] = resultat
+
+                print(description["nom"][:40].ljust(40) + " " + nom_moteur.ljust(10) + " " + (str(nb_colonnes) + "x" + str(nb_lignes)).ljust(10)
+                      + " " + str(resultat["generations_par_seconde"]).rjust(9)
+                      + " " + formater_ecart(resultat["generations_par_seconde"], precedent["generations_par_seconde"] if precedent else None).rjust(9)
+                      + " " + (str(memoire // 1024) if memoire is not None else "").rjust(13)
+                      + " " + (format(resultat["affichage_cellules_ns"] / 1e6, ".3f") + " / " + format(duree_plateau / 1e6, ".1f") if arguments.affichage else "").rjust(15))
@@ -0,0 +1,308 @@
+#!/usr/bin/python3
+""" Catalogue des fichiers de structures
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Le catalogue décrit chaque fichier .cells ou .rle du répertoire bibliothèque ou des archives ZIP
+  qu'il contient (chemin, format, dimensions, population, règle, commentaires, date de
+  modification) sans avoir à le relire
+- Il est conservé au format JSON dans le répertoire bibliothèque et mis à jour en ne relisant
+  que les fichiers ajoutés ou modifiés depuis. Les fichiers illisibles y sont notés (chemin, date
+  de modification et taille) pour n'être relus qu'une fois modifiés
+- Les dernières structures chargées sont gardées en mémoire pour les aperçus répétés
+- Les structures lues sont aussi conservées dans un cache binaire sur disque (sous-répertoire
+  _cache_ de la bibliothèque), un fichier par structure contenant ses lignes compactées en bits,
+  relu par projection en mémoire (mmap) tant que le fichier d'origine garde la même date de
+  modification et la même taille. Il évite l'analyse du texte, mais les lignes restent décodées
+  en listes de cases (octet par octet, au moyen d'une table), en un temps proportionnel à la
+  taille de la structure
+- Les fichiers illisibles sont ignorés et signalés par le précalcul du cache
+- Les fichiers .rle plus grands que le plateau peuvent être lus sous forme de coordonnées des
+  cellules vivantes, sans passer par le cache
+- Exécuté directement, ce module met à jour le catalogue et précalcule en parallèle le cache
+  binaire de toute la bibliothèque
+Utilisation :
+  python3 catalogue.py bibli -p 4
+"""
+
+import argparse
+import concurrent.futures
+import functools
+import itertools
+import json
+import mmap
+import os
+import struct
+import time
+import zipfile
+
+from fichiers import charger_cellules_run_length_encoded, charger_commentaires_dans_fichier, charger_fichier, charger_fichier_plaintext, charger_regle_dans_fichier, dater_fichier, decouper_chemin_archive, ecrire_fichier, ouvrir_archive
+from langues import texte1
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE
+
+REPERTOIRE_BIBLIOTHEQUE = "bibli" # celui de vie.py
+FICHIER_CATALOGUE = "_catalogue_.json"
+VERSION_CATALOGUE = 2
+TAILLE_CACHE_STRUCTURES = 32 # structures
+REPERTOIRE_CACHE = "_cache_"
+# Signature, date de modification (ns) et taille du fichier d'origine, largeur et hauteur
+ENTETE_CACHE = struct.Struct("<4sqqII")
+SIGNATURE_CACHE = b"VIE1"
+# Cases correspondant aux 8 bits de chaque octet possible, du bit de poids faible au bit de poids fort
+CASES_OCTETS = [[CELLULE_NAISSANTE if octet & (1 << bit) else CELLULE_MORTE for bit in range(8)] for octet in range(256)]
+
+########################################################################
+def decrire_fichier(chemin_fichier, langue="fr"):
+    """ Retourne la description d'un fichier de structure """
+    if chemin_fichier.lower().endswith(".rle"):
+        largeur, hauteur, cellules = charger_cellules_run_length_encoded(chemin_fichier, langue)
+        population = len(cellules)
+    else:
+        structure = charger_fichier_plaintext(chemin_fichier, langue)
+        largeur = len(structure[0]) if structure else 0
+        hauteur = len(structure)
+        population = sum(1 for ligne in structure for case in ligne if case != CELLULE_MORTE)
+    return {
+        "format": os.path.splitext(chemin_fichier)[1][1:].lower(),
+        "largeur": largeur,
+        "hauteur": hauteur,
+        "population": population,
+        "regle": charger_regle_dans_fichier(chemin_fichier),
+        "commentaires": charger_commentaires_dans_fichier(chemin_fichier)
+    }
+
+########################################################################
+def lister_structures(repertoire):
+    """ Retourne le dictionnaire {nom: (chemin, date de modification (ns), taille)} des fichiers de
+    structures du répertoire et des archives ZIP qu'il contient, un fichier ordinaire l'emportant
+    sur un membre d'archive de même nom """
+    structures = {}
+    fichiers = []
+    for entree in os.scandir(repertoire):
+        if not entree.is_file():
+            continue
+        if entree.name.lower().endswith(".zip"):
+            try:
+                for nom_fichier in ouvrir_archive(entree.path)["membres"]:
+                    chemin_fichier = os.path.join(entree.path, nom_fichier)
+                    structures[nom_fichier] = (chemin_fichier,) + dater_fichier(chemin_fichier)
+            except (OSError, zipfile.BadZipFile):
+                # Archive illisible (ou en cours de téléchargement) : elle est ignorée
+                continue
+        elif entree.name.lower().endswith((".cells", ".rle")):
+            fichiers.append(entree)
+    for entree in fichiers:
+        etat = entree.stat()
+        structures[entree.name] = (entree.path, etat.st_mtime_ns, etat.st_size)
+    return structures
+
+########################################################################
+def mettre_a_jour_catalogue(catalogue, repertoire, langue="fr"):
+    """ Décrit les fichiers du répertoire (et de ses archives) ajoutés ou modifiés depuis la dernière
+    mise à jour du catalogue, en retire ceux qui ont disparu et retourne un booléen indiquant s'il a
+    changé """
+    fichiers = catalogue["fichiers"]
+    illisibles = catalogue["illisibles"]
+    structures = lister_structures(repertoire)
+    modifie = False
+    for nom_fichier, (chemin_fichier, date, taille) in structures.items():
+        chemin = os.path.relpath(chemin_fichier, repertoire)
+        description = fichiers.get(nom_fichier, illisibles.get(nom_fichier))
+        if description is not None and description["chemin"] == chemin and description["date"] == date and description["taille"] == taille:
+            continue
+        try:
+            description = decrire_fichier(chemin_fichier, langue)
+        except (OSError, UnicodeDecodeError, ValueError, zipfile.BadZipFile):
+            # Fichier illisible : il est ignoré jusqu'à sa prochaine modification
+            fichiers.pop(nom_fichier, None)
+            illisibles[nom_fichier] = {"chemin": chemin, "date": date, "taille": taille}
+            modifie = True
+            continue
+        description["chemin"] = chemin
+        description["date"] = date
+        description["taille"] = taille
+        fichiers[nom_fichier] = description
+        illisibles.pop(nom_fichier, None)
+        modifie = True
+
+    for nom_fichier in set(fichiers) - set(structures):
+        del fichiers[nom_fichier]
+        modifie = True
+    for nom_fichier in set(illisibles) - set(structures):
+        del illisibles[nom_fichier]
+        modifie = True
+
+    if modifie:
+        catalogue["noms"] = sorted(fichiers, key=str.lower)
+    return modifie
+
+########################################################################
+def sauvegarder_catalogue(catalogue, repertoire):
+    """ Sauvegarde le catalogue dans le répertoire bibliothèque """
+    ecrire_fichier(os.path.join(repertoire, FICHIER_CATALOGUE), [json.dumps({"version": VERSION_CATALOGUE, "fichiers": catalogue["fichiers"], "illisibles": catalogue["illisibles"]})])
+
+########################################################################
+def charger_catalogue(repertoire, langue="fr"):
+    """ Retourne le catalogue à jour des fichiers de structures du répertoire bibliothèque, sous la
+    forme {"fichiers": {nom: description}, "noms": liste triée des noms, "illisibles": {nom:
+    {chemin, date, taille}}} """
+    catalogue = {"fichiers": {}, "noms": [], "illisibles": {}}
+    chemin_catalogue = os.path.join(repertoire, FICHIER_CATALOGUE)
+    if os.path.isfile(chemin_catalogue):
+        try:
+            with open(chemin_catalogue, "r") as fichier:
+                contenu = json.load(fichier)
+            if contenu.get("version") == VERSION_CATALOGUE:
+                catalogue["fichiers"] = contenu["fichiers"]
+                catalogue["illisibles"] = contenu.get("illisibles", {})
+        except (OSError, ValueError):
+            # Catalogue illisible : il est reconstruit
+            pass
+    catalogue["noms"] = sorted(catalogue["fichiers"], key=str.lower)
+    if mettre_a_jour_catalogue(catalogue, repertoire, langue):
+        sauvegarder_catalogue(catalogue, repertoire)
+    return catalogue
+
+########################################################################
+def chemin_cache(chemin_fichier):
+    """ Retourne le chemin du fichier du cache binaire d'un fichier de structure (préfixé du nom de
+    l'archive pour un membre d'archive) """
+    chemin_archive = decouper_chemin_archive(chemin_fichier)
+    if chemin_archive is not None:
+        repertoire = os.path.dirname(chemin_archive[0])
+        nom_fichier = os.path.basename(chemin_archive[0]) + "_" + chemin_archive[1]
+    else:
+        repertoire, nom_fichier = os.path.split(chemin_fichier)
+    return os.path.join(repertoire, REPERTOIRE_CACHE, nom_fichier + ".bin")
+
+########################################################################
+def sauvegarder_cache(chemin_fichier, structure, etat):
+    """ Sauvegarde dans le cache binaire une structure et l'état (date de modification (ns), taille)
+    de son fichier d'origine """
+    largeur = len(structure[0]) if structure else 0
+    nb_octets = (largeur + 7) // 8
+    blocs = [ENTETE_CACHE.pack(SIGNATURE_CACHE, etat[0], etat[1], largeur, len(structure))]
+    for ligne in structure:
+        # Case n° i de la ligne au bit n° i
+        bits = int("".join("0" if case == CELLULE_MORTE else "1" for case in reversed(ligne)) or "0", 2)
+        blocs.append(bits.to_bytes(nb_octets, "little"))
+    chemin = chemin_cache(chemin_fichier)
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    ecrire_fichier(chemin, blocs, binaire=True)
+
+########################################################################
+def charger_cache(chemin_fichier, etat):
+    """ Retourne la structure d'un fichier gardée dans le cache binaire, décodée en liste de lignes,
+    ou None si elle n'y est pas ou si le fichier d'origine a changé depuis """
+    try:
+        with open(chemin_cache(chemin_fichier), "rb") as fichier:
+            with mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as donnees:
+                if len(donnees) < ENTETE_CACHE.size:
+                    return None
+                signature, date, taille, largeur, hauteur = ENTETE_CACHE.unpack_from(donnees)
+                nb_octets = (largeur + 7) // 8
+                if signature != SIGNATURE_CACHE or (date, taille) != etat \
+                or len(donnees) != ENTETE_CACHE.size + hauteur * nb_octets:
+                    return None
+                structure = []
+                debut = ENTETE_CACHE.size
+                for ligne in range(hauteur):
+                    octets = donnees[debut:debut + nb_octets]
+                    structure.append(list(itertools.chain.from_iterable(CASES_OCTETS[octet] for octet in octets))[:largeur])
+                    debut += nb_octets
+                return structure
+    except (OSError, ValueError):
+        return None
+
+########################################################################
+def charger_structure_compactee(chemin_fichier, langue="fr"):
+    """ Retourne la structure contenue dans un fichier, depuis le cache binaire s'il est à jour,
+    sinon en analysant le fichier et en mettant le cache à jour """
+    etat = dater_fichier(chemin_fichier)
+    structure = charger_cache(chemin_fichier, etat)
+    if structure is None:
+        structure = charger_fichier(chemin_fichier, langue)
+        try:
+            sauvegarder_cache(chemin_fichier, structure, etat)
+        except OSError:
+            # Le cache n'est qu'une accélération
+            pass
+    return structure
+
+########################################################################
+@functools.lru_cache(maxsize=TAILLE_CACHE_STRUCTURES)
+def charger_structure_en_cache(chemin_fichier, date, langue="fr"):
+    """ Retourne la structure contenue dans un fichier, gardée en mémoire pour les chargements
+    suivants tant que sa date de modification reste la même """
+    return charger_structure_compactee(chemin_fichier, langue)
+
+########################################################################
+def charger_structure(catalogue, repertoire, nom_fichier, langue="fr"):
+    """ Retourne la structure d'un fichier du catalogue (à ne pas modifier, car partagée) """
+    description = catalogue["fichiers"][nom_fichier]
+    return charger_structure_en_cache(os.path.join(repertoire, description["chemin"]), description["date"], langue)
+
+########################################################################
+def charger_cellules(catalogue, repertoire, nom_fichier, langue="fr"):
+    """ Retourne la liste des coordonnées (colonne, ligne) des cellules vivantes d'un fichier .rle
+    du catalogue, sans représenter ses cellules mortes (structures très grandes ou peu peuplées) """
+    description = catalogue["fichiers"][nom_fichier]
+    return charger_cellules_run_length_encoded(os.path.join(repertoire, description["chemin"]), langue)[2]
+
+########################################################################
+def mettre_en_cache(chemin_fichier):
+    """ Met à jour le cache binaire d'un fichier de structure et retourne un booléen indiquant s'il
+    a fallu le recalculer et le message d'erreur éventuel (exécuté dans un processus de calcul) """
+    try:
+        etat = dater_fichier(chemin_fichier)
+        if charger_cache(chemin_fichier, etat) is not None:
+            return False, None
+        sauvegarder_cache(chemin_fichier, charger_fichier(chemin_fichier), etat)
+    except (OSError, UnicodeDecodeError, ValueError, zipfile.BadZipFile) as erreur:
+        # Fichier illisible : il est ignoré, sans interrompre le précalcul des autres
+        return False, str(erreur)
+    return True, None
+
+########################################################################
+def prechauffer_cache(repertoire, nb_processus=0, langue="fr"):
+    """ Précalcule en parallèle le cache binaire de tous les fichiers de structures du répertoire,
+    retire celui des fichiers disparus et retourne le nombre de fichiers recalculés (les fichiers
+    illisibles étant signalés et ignorés) """
+    chemins = [chemin_fichier for chemin_fichier, date, taille in lister_structures(repertoire).values()]
+    if nb_processus <= 0:
+        nb_processus = os.cpu_count() or 1
+    nb_recalcules = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+        resultats = executeur.map(mettre_en_cache, chemins, chunksize=max(1, len(chemins) // (nb_processus * 8)))
+        for chemin_fichier, (recalcule, erreur) in zip(chemins, resultats):
+            if erreur is not None:
+                print(texte1[langue]["ERREUR"] + ": " + texte1[langue]["FICHIER"] + "=" + chemin_fichier + " " + erreur)
+            elif recalcule:
+                nb_recalcules += 1
+
+    repertoire_cache = os.path.join(repertoire, REPERTOIRE_CACHE)
+    if os.path.isdir(repertoire_cache):
+        noms = set(os.path.basename(chemin_cache(chemin_fichier)) for chemin_fichier in chemins)
+        for entree in os.scandir(repertoire_cache):
+            if entree.name not in noms:
+                os.remove(entree.path)
+    return nb_recalcules
+
+### Programme principal ################################################
+
+# Protection nécessaire aux processus de calcul : sous Windows, ils réimportent ce module
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Le jeu de la Vie, mise à jour du catalogue et du cache binaire de la bibliothèque")
+    analyseur.add_argument("repertoire", nargs="?", default=REPERTOIRE_BIBLIOTHEQUE, help="répertoire bibliothèque (défaut : " + REPERTOIRE_BIBLIOTHEQUE + ")")
+    analyseur.add_argument("-p", "--processus", type=int, default=0, help="nombre de processus (défaut : autant que de processeurs)")
+    arguments = analyseur.parse_args()
+    if not os.path.isdir(arguments.repertoire):
+        analyseur.error(arguments.repertoire)
+
+    chrono_1 = time.time()
+    nb_recalcules = prechauffer_cache(arguments.repertoire, arguments.processus)
+    catalogue = charger_catalogue(arguments.repertoire)
+    chrono_2 = time.time()
+    print(str(len(catalogue["noms"])) + " structures, " + str(nb_recalcules) + " mises en cache en " + str(round(chrono_2 - chrono_1, 2)) + " secondes")
@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+""" Fichier de configuration
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Lecture des paramètres définis par l'utilisateur dans le fichier de configuration, ou création
+  de celui-ci avec les valeurs par défaut commentées en français et en anglais
+- Un moteur d'évolution inconnu est signalé et remplacé par le moteur python
+- Les valeurs par défaut reprises par les moteurs d'évolution sont définies ici, pour que la lecture
+  de la configuration ne charge aucun d'eux
+"""
+
+import os
+import re
+
+from langues import texte1
+
+FICHIER_CONFIGURATION = "vie.cfg"
+MOTEURS = ("python", "numpy", "binaire", "hashlife", "creux", "tuiles", "parallele")
+TAILLE_CACHE = 1000000 # noeuds du moteur hashlife
+SEUIL_PARALLELE = 40000 # cases de la zone utile du moteur parallèle
+
+# Traitement des cycles détectés (paramètre PERIODES)
+PERIODES_AUCUNE = 0 # pas de détection
+PERIODES_AFFICHAGE = 1
+PERIODES_ARRET = 2 # arrêt de l'évolution
+PERIODES_REJEU = 3 # rejeu du cycle des oscillateurs sans recalcul
+
+########################################################################
+def charger_ou_creer_fichier_de_configuration(fichier_configuration=FICHIER_CONFIGURATION, creer=True):
+    """ Retourne les paramètres de configuration définis par l'utilisateur dans un fichier, qui est
+    créé avec les valeurs par défaut s'il n'existe pas et que c'est demandé """
+    parametres = \
+    {
+        "LANGUE" : "fr",
+        "LARGEUR_CASE" : 9, # pixels
+        "CYCLE_DE_VIE" : 250, # ticks d'horloge
+        "REGLE" : "B3/S23", # en notation B/S (https://www.conwaylife.com/wiki/Rulestring)
+        "MOTEUR" : "python",
+        "PAS_HASHLIFE" : 0, # 2^0 = 1 génération par cycle de vie
+        "CACHE_HASHLIFE" : TAILLE_CACHE, # noeuds
+        "PROCESSUS" : 0, # autant que de processeurs
+        "SEUIL_PARALLELE" : SEUIL_PARALLELE, # cases
+        "URL_BIBLIOTHEQUE" : "http://www.conwaylife.com/patterns/all.zip",
+        "EMPREINTE_BIBLIOTHEQUE" : "", # SHA-256, non vérifiée si vide
+        "EXTRAIRE_BIBLIOTHEQUE" : False, # structures lues directement dans l'archive
+        "PERIODES" : PERIODES_AFFICHAGE, # détection des oscillateurs et vaisseaux
+        "MEMOIRE_HISTORIQUE" : 64, # Mo, 0 = pas de retour en arrière
+        "DEBUG" : False
+    }
+
+    if os.path.isfile(fichier_configuration):
+        fichier = open(fichier_configuration, "r")
+        for ligne_fichier in fichier:
+            expression = re.match(r'^\s*(?P<cle>\w*)\s*=\s*(?P<valeur>[^\s#]*)', ligne_fichier)
+            if expression is not None:
+                cle_valeur = expression.groupdict()
+                if cle_valeur["cle"] is not None and cle_valeur["valeur"] is not None:
+                    if cle_valeur["cle"] == "LANGUE":
+                        parametres["LANGUE"] = cle_valeur["valeur"]
+                    elif cle_valeur["cle"] == "LARGEUR_CASE":
+                        parametres["LARGEUR_CASE"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "CYCLE_DE_VIE":
+                        parametres["CYCLE_DE_VIE"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "REGLE":
+                        parametres["REGLE"] = cle_valeur["valeur"]
+                    elif cle_valeur["cle"] == "MOTEUR":
+                        parametres["MOTEUR"] = cle_valeur["valeur"]
+                    elif cle_valeur["cle"] == "PAS_HASHLIFE":
+                        parametres["PAS_HASHLIFE"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "CACHE_HASHLIFE":
+                        parametres["CACHE_HASHLIFE"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "PROCESSUS":
+                        parametres["PROCESSUS"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "SEUIL_PARALLELE":
+                        parametres["SEUIL_PARALLELE"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "URL_BIBLIOTHEQUE":
+                        parametres["URL_BIBLIOTHEQUE"] = cle_valeur["valeur"]
+                    elif cle_valeur["cle"] == "EMPREINTE_BIBLIOTHEQUE":
+                        parametres["EMPREINTE_BIBLIOTHEQUE"] = cle_valeur["valeur"]
+                    elif cle_valeur["cle"] == "EXTRAIRE_BIBLIOTHEQUE":
+                        if cle_valeur["valeur"] == "1":
+                            parametres["EXTRAIRE_BIBLIOTHEQUE"] = True
+                        else:
+                            parametres["EXTRAIRE_BIBLIOTHEQUE"] = False
+                    elif cle_valeur["cle"] == "PERIODES":
+                        parametres["PERIODES"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "MEMOIRE_HISTORIQUE":
+                        parametres["MEMOIRE_HISTORIQUE"] = int(cle_valeur["valeur"])
+                    elif cle_valeur["cle"] == "DEBUG":
+                        if cle_valeur["valeur"] == "1":
+                            parametres["DEBUG"] = True
+                        else:
+                            parametres["DEBUG"] = False
+        if parametres["MOTEUR"] not in MOTEURS:
+            print(texte1[parametres["LANGUE"]]["ERREUR"] + ": " + texte1[parametres["LANGUE"]]["MOTEUR_INCONNU"] + parametres["MOTEUR"])
+            parametres["MOTEUR"] = "python"
+    elif creer:
+        fichier = open(fichier_configuration, "w")
+        fichier.write("# Code de langue parmi 'fr' ou 'en'\n")
+        fichier.write("# Language code between 'fr' or 'en'\n")
+        fichier.write("LANGUE = fr\n")
+        fichier.write("#LANGUE = en\n")
+        fichier.write("\n")
+        fichier.write("# Largeur de cellule en pixels (les valeurs impaires sont préférables)\n")
+        fichier.write("# Cell width in pixels (odd values are better)\n")
+        fichier.write("LARGEUR_CASE = 9\n")
+        fichier.write("#LARGEUR_CASE = 15\n")
+        fichier.write("#LARGEUR_CASE = 19\n")
+        fichier.write("\n")
+        fichier.write("# Cycle de vie en ticks d'horloge (plus petit = plus rapide, 0 = vitesse maximale)\n")
+        fichier.write("# Life cycle in clock ticks (smaller = faster, 0 = maximum speed)\n")
+        fichier.write("#CYCLE_DE_VIE = 125\n")
+        fichier.write("CYCLE_DE_VIE = 250\n")
+        fichier.write("#CYCLE_DE_VIE = 500\n")
+        fichier.write("\n")
+        fichier.write("# Règle du jeu en notation B/S (nombre de cellules voisines pour B=naissance/S=survie)\n")
+        fichier.write("# éventuellement suivi des lettres de Hensel des configurations retenues (ou exclues après un -)\n")
+        fichier.write("# Game's rule in B/S notation (number of neighbouring cells for B=birth/S=survival)\n")
+        fichier.write("# optionally followed by the Hensel letters of the configurations included (or excluded after a -)\n")
+        fichier.write("REGLE = B3/S23 # John Horton Conway's game of Life\n")
+        fichier.write("#REGLE = B36/S23 # Nathan Thompson's HighLife\n")
+        fichier.write("#REGLE = B3678/S34678 # Nathan Thompson's day & night\n")
+        fichier.write("#REGLE = B2-a/S12 # isotropic non-totalistic rule in Hensel notation\n")
+        fichier.write("\n")
+        fichier.write("# Moteur d'évolution parmi 'python', 'numpy' (nécessite NumPy) ou 'binaire' (plus rapides sur les grands plateaux)\n")
+        fichier.write("# ou 'hashlife' (plan infini, pour les grandes structures répétitives et les évolutions longues)\n")
+        fichier.write("# ou 'creux' (plan infini, pour les structures peu peuplées)\n")
+        fichier.write("# ou 'tuiles' (pour les structures éparpillées et en grande partie stables)\n")
+        fichier.write("# ou 'parallele' (répartition du calcul entre plusieurs processus)\n")
+        fichier.write("# Sur plan infini, les flèches déplacent la fenêtre d'affichage\n")
+        fichier.write("# Evolution engine between 'python', 'numpy' (requires NumPy) or 'binaire' (faster on big boards)\n")
+        fichier.write("# or 'hashlife' (infinite plane, for huge repetitive patterns and long evolutions)\n")
+        fichier.write("# or 'creux' (infinite plane, for sparse patterns)\n")
+        fichier.write("# or 'tuiles' (for scattered and mostly still patterns)\n")
+        fichier.write("# or 'parallele' (computation shared between several processes)\n")
+        fichier.write("# On an infinite plane, the arrow keys move the display window\n")
+        fichier.write("MOTEUR = python\n")
+        fichier.write("#MOTEUR = numpy\n")
+        fichier.write("#MOTEUR = binaire\n")
+        fichier.write("#MOTEUR = hashlife\n")
+        fichier.write("#MOTEUR = creux\n")
+        fichier.write("#MOTEUR = tuiles\n")
+        fichier.write("#MOTEUR = parallele\n")
+        fichier.write("\n")
+        fichier.write("# Moteur HashLife : 2^PAS_HASHLIFE générations par cycle de vie et nombre maximum de noeuds en mémoire\n")
+        fichier.write("# HashLife engine: 2^PAS_HASHLIFE generations per life cycle and maximum number of nodes in memory\n")
+        fichier.write("PAS_HASHLIFE = 0\n")
+        fichier.write("#PAS_HASHLIFE = 10\n")
+        fichier.write("CACHE_HASHLIFE = " + str(TAILLE_CACHE) + "\n")
+        fichier.write("\n")
+        fichier.write("# Moteur parallèle : nombre de processus (0 = autant que de processeurs) et nombre de cases de la zone utile\n")
+        fichier.write("# en dessous duquel le calcul n'est pas réparti\n")
+        fichier.write("# Parallel engine: number of processes (0 = as many as processors) and number of cells of the useful zone\n")
+        fichier.write("# below which the computation is not shared\n")
+        fichier.write("PROCESSUS = 0\n")
+        fichier.write("SEUIL_PARALLELE = " + str(SEUIL_PARALLELE) + "\n")
+        fichier.write("\n")
+        fichier.write("# Adresse de la base de formes à installer au premier lancement et son empreinte SHA-256 (non vérifiée si absente)\n")
+        fichier.write("# Address of the pattern collection installed at first launch and its SHA-256 checksum (not checked if missing)\n")
+        fichier.write("URL_BIBLIOTHEQUE = " + parametres["URL_BIBLIOTHEQUE"] + "\n")
+        fichier.write("#EMPREINTE_BIBLIOTHEQUE = \n")
+        fichier.write("\n")
+        fichier.write("# Décompression de la base de formes en autant de fichiers (sinon les structures sont lues directement dans l'archive)\n")
+        fichier.write("# Extraction of the pattern collection into as many files (else the patterns are read straight from the archive)\n")
+        fichier.write("EXTRAIRE_BIBLIOTHEQUE = 0 # off\n")
+        fichier.write("#EXTRAIRE_BIBLIOTHEQUE = 1 # on\n")
+        fichier.write("\n")
+        fichier.write("# Détection des oscillateurs et vaisseaux (0 = aucune, 1 = période affichée dans le bandeau, 2 = arrêt de l'évolution,\n")
+        fichier.write("# 3 = cycle des oscillateurs rejoué sans recalcul), sauf avec le moteur hashlife\n")
+        fichier.write("# Oscillator and spaceship detection (0 = none, 1 = period displayed in the title bar, 2 = evolution stopped,\n")
+        fichier.write("# 3 = oscillator cycle replayed without recomputation), except with the hashlife engine\n")
+        fichier.write("PERIODES = 1\n")
+        fichier.write("#PERIODES = 2\n")
+        fichier.write("#PERIODES = 3\n")
+        fichier.write("\n")
+        fichier.write("# Mémoire en Mo de l'historique des générations passées, parcouru en pause (0 = aucun), sauf avec les moteurs creux et hashlife\n")
+        fichier.write("# Memory in MB of the history of past generations, browsed when stalled (0 = none), except with the creux and hashlife engines\n")
+        fichier.write("MEMOIRE_HISTORIQUE = 64\n")
+        fichier.write("\n")
+        fichier.write("# Mode de débogage\n")
+        fichier.write("# Debug mode\n")
+        fichier.write("DEBUG = 0 # off\n")
+        fichier.write("#DEBUG = 1 # on\n")
+    else:
+        return parametres
+    fichier.close()
+    return parametres
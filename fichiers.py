@@ -0,0 +1,401 @@
+#!/usr/bin/python3
+""" Chargement et sauvegarde des structures
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Lecture et écriture des formats Plain Text (.cells) et Run Length Encoded (.rle), sans dépendre
+  de PyGame
+- Les structures sont des listes de lignes de cases du moteur de référence
+- Les fichiers Run Length Encoded sont lus séquence par séquence sans développer les suites de
+  cellules identiques, ce qui permet aussi de n'en charger que les cellules vivantes (structures
+  de grande taille peu peuplées)
+- Les fichiers peuvent aussi être lus directement dans une archive ZIP, avec un chemin de la forme
+  repertoire/archive.zip/membre, l'index du répertoire central des dernières archives ouvertes
+  étant gardé en mémoire
+- Les fichiers sont écrits en une fois dans un fichier temporaire renommé ensuite, de sorte qu'une
+  sauvegarde interrompue ne laisse jamais de fichier tronqué
+"""
+
+import functools
+import io
+import os
+import re
+import threading
+import zipfile
+
+from langues import *
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE
+from regles import REGLE_CONWAY
+
+LONGUEUR_LIGNE_RLE = 70 # caractères
+TAILLE_CACHE_ARCHIVES = 4 # archives
+
+########################################################################
+def indexer_membres(archive):
+    """ Retourne le dictionnaire {nom: membre} des fichiers de structures d'une archive ZIP ouverte,
+    sans les fichiers .rle ayant un équivalent .cells """
+    membres = {}
+    for membre in archive.infolist():
+        nom_fichier = os.path.basename(membre.filename)
+        if not membre.is_dir() and nom_fichier.lower().endswith((".cells", ".rle")):
+            membres[nom_fichier] = membre
+    noms = set(nom_fichier.lower() for nom_fichier in membres)
+    for nom_fichier in list(membres):
+        if nom_fichier.lower().endswith(".rle") and nom_fichier[:-4].lower() + ".cells" in noms:
+            del membres[nom_fichier]
+    return membres
+
+########################################################################
+@functools.lru_cache(maxsize=TAILLE_CACHE_ARCHIVES)
+def indexer_archive(chemin_archive, date):
+    """ Retourne l'archive ZIP ouverte et l'index de son répertoire central, gardés en mémoire tant
+    que sa date de modification reste la même """
+    archive = zipfile.ZipFile(chemin_archive)
+    return {"archive": archive, "membres": indexer_membres(archive)}
+
+########################################################################
+def ouvrir_archive(chemin_archive):
+    """ Retourne l'archive ZIP ouverte et l'index {"archive", "membres"} de son répertoire central """
+    return indexer_archive(chemin_archive, os.stat(chemin_archive).st_mtime_ns)
+
+########################################################################
+def decouper_chemin_archive(chemin_fichier):
+    """ Retourne le chemin de l'archive ZIP et le nom du membre d'un chemin de la forme
+    repertoire/archive.zip/membre, ou None pour un fichier ordinaire """
+    chemin_archive, nom_fichier = os.path.split(chemin_fichier)
+    if chemin_archive.lower().endswith(".zip") and os.path.isfile(chemin_archive):
+        return chemin_archive, nom_fichier
+    return None
+
+########################################################################
+def ouvrir_fichier(chemin_fichier):
+    """ Ouvre en lecture un fichier ordinaire ou un membre d'une archive ZIP """
+    chemin_archive = decouper_chemin_archive(chemin_fichier)
+    if chemin_archive is None:
+        return open(chemin_fichier, "r")
+    index = ouvrir_archive(chemin_archive[0])
+    if chemin_archive[1] not in index["membres"]:
+        raise FileNotFoundError(chemin_fichier)
+    return io.TextIOWrapper(index["archive"].open(index["membres"][chemin_archive[1]]))
+
+########################################################################
+def dater_fichier(chemin_fichier):
+    """ Retourne la date de modification (ns) et la taille d'un fichier ordinaire ou d'un membre
+    d'une archive ZIP (la date étant alors celle de l'archive) """
+    chemin_archive = decouper_chemin_archive(chemin_fichier)
+    if chemin_archive is None:
+        etat = os.stat(chemin_fichier)
+        return etat.st_mtime_ns, etat.st_size
+    index = ouvrir_archive(chemin_archive[0])
+    if chemin_archive[1] not in index["membres"]:
+        raise FileNotFoundError(chemin_fichier)
+    return os.stat(chemin_archive[0]).st_mtime_ns, index["membres"][chemin_archive[1]].file_size
+
+########################################################################
+def preparer_sauvegarde(chemin_fichier, zone_utile, position):
+    """ Crée si besoin le répertoire du fichier et retourne la zone utile et la position à
+    sauvegarder """
+    if zone_utile["X_1"] == -1:
+        # Grille de jeu vide : fichier sans ligne
+        zone_utile = {"X_1": 0, "Y_1": 0, "X_2": -1, "Y_2": -1}
+    if position is None:
+        position = (zone_utile["X_1"], zone_utile["Y_1"])
+    repertoire = os.path.dirname(chemin_fichier)
+    if repertoire and not os.path.exists(repertoire):
+        os.makedirs(repertoire)
+    return zone_utile, position
+
+########################################################################
+def ecrire_fichier(chemin_fichier, lignes, binaire=False):
+    """ Ecrit les lignes (ou blocs d'octets) indiquées en une seule fois dans un fichier temporaire
+    qui remplace ensuite le fichier, lequel n'est ainsi jamais lu à moitié écrit ni perdu en cas
+    d'interruption """
+    # Fichier temporaire propre à chaque tâche, plusieurs pouvant écrire le même fichier (catalogue
+    # mis à jour par l'installation de la base de formes et par le programme principal)
+    chemin_temporaire = chemin_fichier + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp"
+    try:
+        if binaire:
+            with open(chemin_temporaire, "wb") as fichier:
+                fichier.write(b"".join(lignes))
+        else:
+            with open(chemin_temporaire, "w") as fichier:
+                fichier.write("".join(lignes))
+        os.replace(chemin_temporaire, chemin_fichier)
+    except OSError:
+        if os.path.exists(chemin_temporaire):
+            os.remove(chemin_temporaire)
+        raise
+
+########################################################################
+def sauvegarder_fichier_plaintext(chemin_fichier, nom_fichier, plateau, zone_utile, position=None):
+    """ Sauvegarde la zone utile de la grille de jeu dans un fichier au format Plain Text, avec la
+    position indiquée (par défaut le coin de la zone utile) """
+    zone_utile, position = preparer_sauvegarde(chemin_fichier, zone_utile, position)
+    lignes = ["!Name: " + nom_fichier + "\n", "!Position: " + str(position[0]) + "," + str(position[1]) + "\n", "!\n"]
+    for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1):
+        cases = plateau[ligne][zone_utile["X_1"]:zone_utile["X_2"] + 1]
+        lignes.append("".join("." if case == CELLULE_MORTE else "O" for case in cases) + "\n")
+    ecrire_fichier(chemin_fichier, lignes)
+
+########################################################################
+def encoder_ligne(cases):
+    """ Retourne les séquences "<nombre><symbole>" d'une ligne de cases, sans ses cellules mortes
+    finales """
+    sequences = []
+    texte = "".join("b" if case == CELLULE_MORTE else "o" for case in cases).rstrip("b")
+    for suite in re.finditer(r'o+|b+', texte):
+        nombre = suite.end() - suite.start()
+        sequences.append((str(nombre) if nombre > 1 else "") + texte[suite.start()])
+    return sequences
+
+########################################################################
+def sauvegarder_fichier_run_length_encoded(chemin_fichier, nom_fichier, plateau, zone_utile, position=None, regle=REGLE_CONWAY):
+    """ Sauvegarde la zone utile de la grille de jeu dans un fichier au format Run Length Encoded,
+    avec la position indiquée (par défaut le coin de la zone utile) et la règle du jeu """
+    zone_utile, position = preparer_sauvegarde(chemin_fichier, zone_utile, position)
+    sequences = []
+    fins_de_ligne = 0
+    for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1):
+        if ligne > zone_utile["Y_1"]:
+            fins_de_ligne += 1
+        sequences_ligne = encoder_ligne(plateau[ligne][zone_utile["X_1"]:zone_utile["X_2"] + 1])
+        if sequences_ligne:
+            # Les lignes vides sont regroupées dans le multiplicateur de la fin de ligne précédente
+            if fins_de_ligne:
+                sequences.append((str(fins_de_ligne) if fins_de_ligne > 1 else "") + "$")
+                fins_de_ligne = 0
+            sequences.extend(sequences_ligne)
+    sequences.append("!")
+
+    lignes = [
+        "#N " + nom_fichier + "\n",
+        "#P " + str(position[0]) + " " + str(position[1]) + "\n",
+        "x = " + str(zone_utile["X_2"] - zone_utile["X_1"] + 1) + ", y = " + str(zone_utile["Y_2"] - zone_utile["Y_1"] + 1) + ", rule = " + regle + "\n"
+    ]
+
+    # Lignes de 70 caractères au plus, sans couper les séquences
+    ligne_fichier = ""
+    for sequence in sequences:
+        if len(ligne_fichier) + len(sequence) > LONGUEUR_LIGNE_RLE:
+            lignes.append(ligne_fichier + "\n")
+            ligne_fichier = ""
+        ligne_fichier += sequence
+    lignes.append(ligne_fichier + "\n")
+    ecrire_fichier(chemin_fichier, lignes)
+
+########################################################################
+def sauvegarder_fichier(chemin_fichier, nom_fichier, plateau, zone_utile, position=None, regle=REGLE_CONWAY):
+    """ Sauvegarde la zone utile de la grille de jeu dans un fichier au format indiqué par son
+    extension (Plain Text par défaut) """
+    if chemin_fichier.lower().endswith(".rle"):
+        sauvegarder_fichier_run_length_encoded(chemin_fichier, nom_fichier, plateau, zone_utile, position, regle)
+    else:
+        sauvegarder_fichier_plaintext(chemin_fichier, nom_fichier, plateau, zone_utile, position)
+
+########################################################################
+def charger_fichier_plaintext(chemin_fichier, langue="fr"):
+    """ Retourne la structure contenue dans un fichier au format Plain Text (.cells) """
+    structure = []
+    no_ligne = 0
+    max_colonnes = 0
+    fichier = ouvrir_fichier(chemin_fichier)
+    for ligne_fichier in fichier:
+        no_ligne += 1
+        ligne_fichier = ligne_fichier.strip()
+        if not ligne_fichier.startswith("!"):
+            if len(ligne_fichier) > max_colonnes:
+                max_colonnes = len(ligne_fichier)
+            ligne = []
+            for caractere in ligne_fichier:
+                if caractere == '.':
+                    ligne.append(CELLULE_MORTE)
+                elif caractere == "O":
+                    ligne.append(CELLULE_NAISSANTE)
+                elif caractere == "*":
+                    ligne.append(CELLULE_NAISSANTE)
+                    print(texte1[langue]["AVERTISSEMENT"] + ": " + texte1[langue]["FICHIER"] + "=" + chemin_fichier + " " + texte1[langue]["NOLIGNE"] + "=" + str(no_ligne) + " " + texte1[langue]["LIGNE"] + "=" + ligne_fichier)
+                else:
+                    print(texte1[langue]["ERREUR"] + ": " + texte1[langue]["FICHIER"] + "=" + chemin_fichier + " " + texte1[langue]["NOLIGNE"] + "=" + str(no_ligne) + " " + texte1[langue]["LIGNE"] + "=" + ligne_fichier)
+                    break
+            structure.append(ligne.copy())
+    fichier.close()
+
+    # Certains fichiers du LifeWiki ne respectent pas la spécification sur
+    # https://www.conwaylife.com/wiki/Plaintext et ne mentionnent pas les cellules mortes en fin de
+    # ligne, ni les lignes composées uniquement de cellules mortes
+    # Maintenant que l'on connaît la largeur maximale de la structure on les rajoute
+    for ligne in range(len(structure)):
+        cellules_manquantes = max_colonnes - len(structure[ligne])
+        if cellules_manquantes > 0:
+            for i in range(cellules_manquantes):
+                structure[ligne].append(CELLULE_MORTE)
+
+    return structure
+
+########################################################################
+def charger_position_dans_fichier_plaintext(chemin_fichier):
+    """ Retourne la position indiquée dans un fichier au format Plain Text """
+    position = (0, 0)
+    fichier = ouvrir_fichier(chemin_fichier)
+    for ligne_fichier in fichier:
+        ligne_fichier = ligne_fichier.strip()
+        if ligne_fichier.startswith("!Position: "):
+            resultat = ligne_fichier.split(" ")[1].split(",")
+            position = (int(resultat[0]), int(resultat[1]))
+    fichier.close()
+    return position
+
+########################################################################
+def decouper_run_length_encoded(chemin_fichier, en_tete, langue="fr"):
+    """ Génère les séquences (nombre, symbole) d'un fichier au format Run Length Encoded, sans les
+    développer, le symbole étant "b" (cellules mortes), "o" (cellules vivantes) ou "$" (fins de
+    ligne), et complète le dictionnaire en_tete avec la largeur "x" et la hauteur "y" de la
+    structure """
+    nombre = 0
+    no_ligne = 0
+    with ouvrir_fichier(chemin_fichier) as fichier:
+        for ligne_fichier in fichier:
+            no_ligne += 1
+            ligne_fichier = ligne_fichier.strip()
+            if ligne_fichier == "" or ligne_fichier.startswith("#"):
+                continue
+            elif ligne_fichier.startswith("x"):
+                expression = re.match(r'^\s*x\s*=\s*(?P<x>\d*)\s*,\s*y\s*=\s*(?P<y>\d*)(\s*,\s*rule\s*=\s*(?P<rule>[^\s,]*))?', ligne_fichier)
+                if expression is not None:
+                    en_tete["x"] = int(expression.group("x"))
+                    en_tete["y"] = int(expression.group("y"))
+                else:
+                    print(texte1[langue]["ERREUR"] + ": " + texte1[langue]["FICHIER"] + "=" + chemin_fichier + " " + texte1[langue]["NOLIGNE"] + "=" + str(no_ligne) + " " + texte1[langue]["LIGNE"] + "=" + ligne_fichier)
+                continue
+            ligne_fichier = "".join(ligne_fichier.split())
+
+            # Les séquences sont délimitées par les symboles, les nombres les précédant pouvant
+            # être coupés en fin de ligne
+            for sequence in re.finditer(r'(\d*)([^\d\s])|(\d+)$', ligne_fichier):
+                if sequence.group(3) is not None:
+                    nombre = nombre * 10 ** len(sequence.group(3)) + int(sequence.group(3))
+                    continue
+                if sequence.group(1):
+                    nombre = nombre * 10 ** len(sequence.group(1)) + int(sequence.group(1))
+                symbole = sequence.group(2)
+                if nombre == 0:
+                    nombre = 1
+                if symbole in ("b", "B"):
+                    yield nombre, "b"
+                elif symbole in ("o", "O"):
+                    yield nombre, "o"
+                elif symbole == "$":
+                    yield nombre, "$"
+                elif symbole == "!":
+                    return
+                else:
+                    print(texte1[langue]["AVERTISSEMENT"] + ": " + texte1[langue]["FICHIER"] + "=" + chemin_fichier + " " + texte1[langue]["NOLIGNE"] + "=" + str(no_ligne) + " " + texte1[langue]["LIGNE"] + "=" + ligne_fichier)
+                    nombre = 0
+                    break
+                nombre = 0
+
+########################################################################
+def charger_cellules_run_length_encoded(chemin_fichier, langue="fr"):
+    """ Retourne la largeur, la hauteur et la liste des coordonnées (colonne, ligne) des cellules
+    vivantes d'une structure au format Run Length Encoded, sans représenter ses cellules mortes """
+    en_tete = {"x": 0, "y": 0}
+    cellules = []
+    colonne = 0
+    ligne = 0
+    for nombre, symbole in decouper_run_length_encoded(chemin_fichier, en_tete, langue):
+        if symbole == "o":
+            cellules.extend((x, ligne) for x in range(colonne, colonne + nombre))
+            colonne += nombre
+        elif symbole == "b":
+            colonne += nombre
+        else:
+            colonne = 0
+            ligne += nombre
+
+    # L'en-tête peut sous-estimer les dimensions de la structure
+    largeur = max([en_tete["x"]] + [x + 1 for x, y in cellules])
+    hauteur = max([en_tete["y"]] + [y + 1 for x, y in cellules])
+    return largeur, hauteur, cellules
+
+########################################################################
+def charger_fichier_run_length_encoded(chemin_fichier, langue="fr"):
+    """ Retourne la structure contenue dans un fichier au format Run Length Encoded (.rle) """
+    en_tete = {"x": 0, "y": 0}
+    structure = []
+    ligne = []
+    for nombre, symbole in decouper_run_length_encoded(chemin_fichier, en_tete, langue):
+        if symbole == "o":
+            ligne.extend([CELLULE_NAISSANTE] * nombre)
+        elif symbole == "b":
+            ligne.extend([CELLULE_MORTE] * nombre)
+        else:
+            structure.append(ligne)
+            ligne = []
+            # Lignes vides d'un multiplicateur avant le "$"
+            for i in range(nombre - 1):
+                structure.append([])
+    if ligne or len(structure) < en_tete["y"]:
+        structure.append(ligne)
+
+    # Les cellules mortes de fin de ligne et les lignes vides de fin de structure sont implicites
+    largeur_structure = max([en_tete["x"]] + [len(ligne) for ligne in structure])
+    for i in range(len(structure), en_tete["y"]):
+        structure.append([])
+    for ligne in structure:
+        ligne.extend([CELLULE_MORTE] * (largeur_structure - len(ligne)))
+    return structure
+
+########################################################################
+def charger_regle_dans_fichier_run_length_encoded(chemin_fichier):
+    """ Retourne la règle indiquée dans l'en-tête d'un fichier au format Run Length Encoded, ou None """
+    regle = None
+    fichier = ouvrir_fichier(chemin_fichier)
+    for ligne_fichier in fichier:
+        ligne_fichier = ligne_fichier.strip()
+        if ligne_fichier.startswith("x"):
+            expression = re.match(r'^\s*x\s*=\s*\d*\s*,\s*y\s*=\s*\d*\s*,\s*rule\s*=\s*(?P<rule>[^\s,]*)', ligne_fichier)
+            if expression is not None:
+                regle = expression.group("rule") or None
+            break
+    fichier.close()
+    return regle
+
+########################################################################
+def charger_regle_dans_fichier(chemin_fichier):
+    """ Retourne la règle indiquée dans un fichier, ou None (le format Plain Text n'en indique pas) """
+    if chemin_fichier.lower().endswith(".rle"):
+        return charger_regle_dans_fichier_run_length_encoded(chemin_fichier)
+    return None
+
+########################################################################
+def charger_commentaires_dans_fichier(chemin_fichier):
+    """ Retourne la liste des commentaires d'un fichier (lignes "#C" du format Run Length Encoded,
+    lignes "!" du format Plain Text hors nom et position) """
+    commentaires = []
+    run_length_encoded = chemin_fichier.lower().endswith(".rle")
+    fichier = ouvrir_fichier(chemin_fichier)
+    for ligne_fichier in fichier:
+        ligne_fichier = ligne_fichier.strip()
+        if run_length_encoded:
+            if ligne_fichier.startswith("#C") or ligne_fichier.startswith("#c"):
+                commentaires.append(ligne_fichier[2:].strip())
+            elif not ligne_fichier.startswith("#") and ligne_fichier != "":
+                break
+        elif ligne_fichier.startswith("!"):
+            if not ligne_fichier.startswith("!Name:") and not ligne_fichier.startswith("!Position:") and ligne_fichier != "!":
+                commentaires.append(ligne_fichier[1:].strip())
+        elif ligne_fichier != "":
+            break
+    fichier.close()
+    return commentaires
+
+########################################################################
+def charger_fichier(chemin_fichier, langue="fr"):
+    """ Retourne la structure contenue dans un fichier """
+    if chemin_fichier.lower().endswith(".cells"):
+        return charger_fichier_plaintext(chemin_fichier, langue)
+    elif chemin_fichier.lower().endswith(".rle"):
+        return charger_fichier_run_length_encoded(chemin_fichier, langue)
+
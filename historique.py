@@ -0,0 +1,202 @@
+#!/usr/bin/python3
+""" Historique des générations passées, pour revenir en arrière pendant une pause
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- L'état des cases (vivante ou morte) est codé sur un bit par case, dans un tableau d'octets
+- L'historique est une suite d'images clés (états complets compressés avec zlib), chacune suivie
+  des écarts des générations suivantes, c'est-à-dire des numéros des cases qui ont changé d'état,
+  obtenus à partir des cases modifiées indiquées par le moteur d'évolution
+- Une nouvelle image clé est prise quand les écarts depuis la précédente pèsent plus lourd
+  qu'elle, ou au bout de ECARTS_MAXIMUM générations, ce qui borne le coût d'une reconstruction
+- Quand la mémoire occupée dépasse le budget indiqué, les images clés les plus anciennes et leurs
+  écarts sont oubliées
+- Les âges des cellules ne sont pas gardés : une cellule restituée est naissante si elle a changé
+  d'état à cette génération, âgée sinon, ce qui suffit à l'affichage
+- L'état des cases est lu sur le plateau, tenu à jour par tous les moteurs d'évolution avec
+  affichage (y compris lors du rejeu d'un cycle), et non dans l'état propre à chaque moteur
+- Les moteurs d'évolution sur plan infini (creux et hashlife) et les simulations sans affichage ne
+  sont pas concernés
+- N'importe pas PyGame
+"""
+
+import array
+import collections
+import zlib
+
+from moteur import CELLULE_MORTE, CELLULE_NAISSANTE
+import moteur
+
+ECARTS_MAXIMUM = 256 # générations entre deux images clés
+SURCOUT_ECART = 64 # octets occupés par un tableau d'écarts vide
+SURCOUT_IMAGE = 128 # octets occupés par une image clé vide
+
+########################################################################
+def creer_historique(budget):
+    """ Retourne un historique vide des générations, occupant au plus le budget indiqué (en octets)
+    """
+    return {
+        "budget": budget,
+        "actif": False,
+        "nb_colonnes": 0,
+        "nb_lignes": 0,
+        "etat": bytearray(), # état de la dernière génération notée
+        "images": collections.deque(), # {"generation", "image", "ecart", "ecarts", "taille"}
+        "taille": 0, # octets occupés par les images et les écarts
+        "affichee": None, # génération restituée sur le plateau (None pour la dernière)
+        "etat_affiche": None
+    }
+
+########################################################################
+def demarrer_historique(historique, simulation):
+    """ Vide l'historique et note la génération de départ de la simulation (après
+    moteur.demarrer()) """
+    historique["actif"] = historique["budget"] > 0 and simulation["affichage"] and simulation["moteur"] not in ("creux", "hashlife")
+    historique["images"].clear()
+    historique["taille"] = 0
+    historique["affichee"] = None
+    historique["etat_affiche"] = None
+    if not historique["actif"]:
+        historique["etat"] = bytearray()
+        return
+    nb_colonnes = simulation["nb_colonnes"]
+    historique["nb_colonnes"] = nb_colonnes
+    historique["nb_lignes"] = simulation["nb_lignes"]
+    etat = bytearray((nb_colonnes * simulation["nb_lignes"] + 7) // 8)
+    plateau = simulation["plateau"]
+    zone_utile = simulation["zone_utile"]
+    for ligne in range(max(zone_utile["Y_1"], 0), min(zone_utile["Y_2"] + 1, simulation["nb_lignes"])):
+        for colonne in range(max(zone_utile["X_1"], 0), min(zone_utile["X_2"] + 1, nb_colonnes)):
+            if plateau[ligne][colonne] != CELLULE_MORTE:
+                case = ligne * nb_colonnes + colonne
+                etat[case >> 3] |= 1 << (case & 7)
+    historique["etat"] = etat
+    ajouter_image(historique, simulation["generation"])
+
+########################################################################
+def ajouter_image(historique, generation, ecart=None):
+    """ Ajoute une image clé de l'état courant à l'historique, avec son écart avec la génération
+    précédente """
+    image = zlib.compress(bytes(historique["etat"]), 1)
+    if ecart is None:
+        ecart = array.array("I")
+    taille = SURCOUT_IMAGE + len(image) + SURCOUT_ECART + ecart.itemsize * len(ecart)
+    historique["images"].append({"generation": generation, "image": image, "ecart": ecart, "ecarts": [], "taille": taille})
+    historique["taille"] += taille
+
+########################################################################
+def historiser_generation(historique, simulation, resultat):
+    """ Ajoute à l'historique la génération calculée par le moteur d'évolution """
+    if not historique["actif"]:
+        return
+    plateau = simulation["plateau"]
+    etat = historique["etat"]
+    nb_colonnes = historique["nb_colonnes"]
+    ecart = array.array("I")
+    for colonne, ligne in resultat["modifications"]:
+        case = ligne * nb_colonnes + colonne
+        if (plateau[ligne][colonne] != CELLULE_MORTE) != bool(etat[case >> 3] >> (case & 7) & 1):
+            etat[case >> 3] ^= 1 << (case & 7)
+            ecart.append(case)
+
+    derniere = historique["images"][-1]
+    taille_ecart = SURCOUT_ECART + ecart.itemsize * len(ecart)
+    if len(derniere["ecarts"]) >= ECARTS_MAXIMUM or derniere["taille"] + taille_ecart > 2 * (SURCOUT_IMAGE + len(derniere["image"])):
+        ajouter_image(historique, simulation["generation"], ecart)
+    else:
+        derniere["ecarts"].append(ecart)
+        derniere["taille"] += taille_ecart
+        historique["taille"] += taille_ecart
+
+    # On garde au moins la dernière image clé et ses écarts
+    while historique["taille"] > historique["budget"] and len(historique["images"]) > 1:
+        historique["taille"] -= historique["images"].popleft()["taille"]
+
+########################################################################
+def bornes_historique(historique):
+    """ Retourne la première et la dernière génération gardées dans l'historique, ou None """
+    if not historique["actif"] or not historique["images"]:
+        return None
+    derniere = historique["images"][-1]
+    return historique["images"][0]["generation"], derniere["generation"] + len(derniere["ecarts"])
+
+########################################################################
+def reconstruire(historique, generation):
+    """ Retourne l'état de la génération indiquée, gardée dans l'historique, et son écart avec la
+    génération précédente """
+    for image in reversed(historique["images"]):
+        if image["generation"] <= generation:
+            break
+    etat = bytearray(zlib.decompress(image["image"]))
+    ecart = image["ecart"]
+    for ecart in image["ecarts"][:generation - image["generation"]]:
+        for case in ecart:
+            etat[case >> 3] ^= 1 << (case & 7)
+    return etat, ecart
+
+########################################################################
+def restituer_generation(historique, simulation, generation):
+    """ Remet sur le plateau la génération indiquée, bornée à celles gardées dans l'historique, et
+    retourne le même résultat que le moteur d'évolution """
+    premiere, derniere = bornes_historique(historique)
+    generation = min(max(generation, premiere), derniere)
+    etat, ecart = reconstruire(historique, generation)
+    if historique["etat_affiche"] is None:
+        historique["etat_affiche"] = reconstruire(historique, derniere)
+    etat_affiche, ecart_affiche = historique["etat_affiche"]
+
+    # Cases ayant changé d'état, ou d'âge, depuis la génération affichée
+    nb_octets = len(etat)
+    differences = (int.from_bytes(etat, "little") ^ int.from_bytes(etat_affiche, "little")).to_bytes(nb_octets, "little")
+    cases = set(ecart)
+    cases.update(ecart_affiche)
+    for octet in range(nb_octets):
+        if differences[octet]:
+            for bit in range(8):
+                if differences[octet] >> bit & 1:
+                    cases.add(octet * 8 + bit)
+
+    plateau = simulation["plateau"]
+    nb_colonnes = historique["nb_colonnes"]
+    naissances = set(ecart)
+    modifications = []
+    for case in cases:
+        ligne, colonne = divmod(case, nb_colonnes)
+        if etat[case >> 3] >> (case & 7) & 1:
+            plateau[ligne][colonne] = CELLULE_NAISSANTE if case in naissances else CELLULE_NAISSANTE + 1
+        else:
+            plateau[ligne][colonne] = CELLULE_MORTE
+        modifications.append((colonne, ligne))
+    historique["affichee"] = None if generation == derniere else generation
+    historique["etat_affiche"] = (etat, ecart)
+
+    population = bin(int.from_bytes(etat, "little")).count("1")
+    nb_naissances = sum(1 for case in ecart if etat[case >> 3] >> (case & 7) & 1)
+    simulation["generation"] = generation
+    simulation["zone_utile"] = moteur.detourer(simulation)
+    return {
+        "statut": {"population": population, "naissances": nb_naissances, "survie": population - nb_naissances, "deces": len(ecart) - nb_naissances},
+        "zone_utile": simulation["zone_utile"],
+        "modifications": modifications
+    }
+
+########################################################################
+def tronquer_historique(historique):
+    """ Oublie les générations suivant celle restituée sur le plateau, avant de reprendre
+    l'évolution à partir de celle-ci """
+    generation = historique["affichee"]
+    if generation is None:
+        return
+    while historique["images"][-1]["generation"] > generation:
+        historique["taille"] -= historique["images"].pop()["taille"]
+    derniere = historique["images"][-1]
+    for ecart in derniere["ecarts"][generation - derniere["generation"]:]:
+        taille_ecart = SURCOUT_ECART + ecart.itemsize * len(ecart)
+        derniere["taille"] -= taille_ecart
+        historique["taille"] -= taille_ecart
+    del derniere["ecarts"][generation - derniere["generation"]:]
+    historique["etat"] = historique["etat_affiche"][0]
+    historique["affichee"] = None
+    historique["etat_affiche"] = None
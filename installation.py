@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+""" Installation de la base de formes du site LifeWiki
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- L'installation se fait dans une tâche d'arrière-plan, le jeu restant utilisable pendant ce temps
+- Le téléchargement est écrit dans un fichier .part, repris là où il s'était arrêté (requête HTTP
+  Range) au lancement suivant en cas d'interruption, et son empreinte SHA-256 est vérifiée si elle
+  est indiquée dans le fichier de configuration
+- Par défaut, l'archive est conservée telle quelle et les structures y sont lues directement, ce
+  qui évite de créer des milliers de petits fichiers, les sauvegardes de l'utilisateur restant des
+  fichiers ordinaires
+- Si la décompression est demandée, les membres de l'archive sont décompressés un par un en flux (leur CRC étant vérifié au passage)
+  dans des fichiers temporaires renommés ensuite, le fichier témoin de l'installation
+  (_README_.txt) en dernier, et les fichiers .rle ayant un équivalent .cells sont ignorés
+- L'adresse de l'archive est paramétrable, ce qui permet de tester l'installation avec un serveur
+  HTTP local
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+import zipfile
+
+# pip install --trusted-host pypi.org --trusted-host pypi.python.org
+#             --trusted-host files.pythonhosted.org requests
+import requests
+
+from langues import *
+from catalogue import charger_catalogue
+from fichiers import indexer_membres
+
+FICHIER_TEMOIN = "_README_.txt"
+TAILLE_BLOC = 64 * 1024 # octets
+DELAI_RESEAU = 30 # secondes
+
+########################################################################
+def nommer_archive(repertoire, url):
+    """ Retourne le chemin de l'archive téléchargée depuis l'adresse indiquée """
+    return os.path.join(repertoire, os.path.basename(url) or "all.zip")
+
+########################################################################
+def est_installee(repertoire, url, extraction=False):
+    """ Retourne un booléen indiquant si la base de formes est installée dans le répertoire, soit
+    décompressée, soit (sauf si la décompression est demandée) sous forme d'archive complète """
+    if os.path.isfile(os.path.join(repertoire, FICHIER_TEMOIN)):
+        return True
+    return not extraction and os.path.isfile(nommer_archive(repertoire, url))
+
+########################################################################
+def telecharger(url, chemin_fichier, empreinte="", progression=None):
+    """ Télécharge un fichier en reprenant le téléchargement interrompu éventuel et vérifie son
+    empreinte SHA-256 si elle est indiquée (lève OSError ou ValueError) """
+    chemin_partiel = chemin_fichier + ".part"
+    hachage = hashlib.sha256()
+    nb_octets = 0
+    if os.path.isfile(chemin_partiel):
+        with open(chemin_partiel, "rb") as fichier:
+            for bloc in iter(lambda: fichier.read(TAILLE_BLOC), b""):
+                hachage.update(bloc)
+                nb_octets += len(bloc)
+
+    entetes = {"Range": "bytes=" + str(nb_octets) + "-"} if nb_octets else {}
+    reponse = requests.get(url, headers=entetes, stream=True, timeout=DELAI_RESEAU)
+    if nb_octets and reponse.status_code == 206 and not reponse.headers.get("Content-Range", "").startswith("bytes " + str(nb_octets) + "-"):
+        # Reprise ailleurs qu'à l'octet demandé : on redemande le fichier en entier
+        reponse.close()
+        reponse = requests.get(url, stream=True, timeout=DELAI_RESEAU)
+    with reponse:
+        if nb_octets and reponse.status_code == 416:
+            # Le téléchargement précédent était déjà complet
+            mode = None
+        elif nb_octets and reponse.status_code == 206:
+            mode = "ab"
+        else:
+            # Serveur ne sachant pas reprendre un téléchargement : on recommence
+            reponse.raise_for_status()
+            hachage = hashlib.sha256()
+            nb_octets = 0
+            mode = "wb"
+
+        if mode is not None:
+            if progression is not None:
+                progression["octets"] = nb_octets
+                progression["total"] = nb_octets + int(reponse.headers.get("Content-Length", 0))
+            with open(chemin_partiel, mode) as fichier:
+                for bloc in reponse.iter_content(TAILLE_BLOC):
+                    fichier.write(bloc)
+                    hachage.update(bloc)
+                    nb_octets += len(bloc)
+                    if progression is not None:
+                        progression["octets"] = nb_octets
+
+    if empreinte and hachage.hexdigest() != empreinte.lower():
+        os.remove(chemin_partiel)
+        raise ValueError(url + " : SHA-256 " + hachage.hexdigest())
+    os.replace(chemin_partiel, chemin_fichier)
+
+########################################################################
+def extraire(chemin_archive, repertoire):
+    """ Décompresse en flux les membres d'une archive ZIP dans le répertoire indiqué, sans les fichiers
+    .rle ayant un équivalent .cells et avec le fichier témoin en dernier (lève OSError ou
+    zipfile.BadZipFile) """
+    with zipfile.ZipFile(chemin_archive) as archive:
+        membres = list(indexer_membres(archive).values())
+        membres += [membre for membre in archive.infolist() if os.path.basename(membre.filename) == FICHIER_TEMOIN]
+        for membre in membres:
+            chemin_fichier = os.path.join(repertoire, os.path.basename(membre.filename))
+            with archive.open(membre) as source, open(chemin_fichier + ".tmp", "wb") as destination:
+                shutil.copyfileobj(source, destination, TAILLE_BLOC)
+            os.replace(chemin_fichier + ".tmp", chemin_fichier)
+
+########################################################################
+def installer(installation):
+    """ Télécharge et installe la base de formes, puis prépare son catalogue (exécuté dans la tâche
+    d'installation) """
+    langue = installation["langue"]
+    repertoire = installation["repertoire"]
+    chemin_archive = nommer_archive(repertoire, installation["url"])
+    try:
+        if not os.path.isfile(chemin_archive):
+            print("\n" + texte1[langue]["TELECHARGEMENT"])
+            installation["etape"] = "telechargement"
+            chrono_1 = time.time()
+            telecharger(installation["url"], chemin_archive, installation["empreinte"], installation)
+            chrono_2 = time.time()
+            print(texte1[langue]["TERMINE"] + str(chrono_2 - chrono_1) + texte1[langue]["SECONDES"])
+
+        print("\n" + texte1[langue]["DECOMPRESSION"])
+        installation["etape"] = "decompression"
+        chrono_1 = time.time()
+        try:
+            if installation["extraction"]:
+                extraire(chemin_archive, repertoire)
+            else:
+                # Les structures seront lues directement dans l'archive, dont on vérifie les CRC
+                with zipfile.ZipFile(chemin_archive) as archive:
+                    membre_corrompu = archive.testzip()
+                if membre_corrompu is not None:
+                    raise zipfile.BadZipFile(membre_corrompu)
+        except zipfile.BadZipFile:
+            # Archive corrompue : elle sera téléchargée à nouveau au prochain lancement
+            os.remove(chemin_archive)
+            raise
+        if installation["extraction"]:
+            os.remove(chemin_archive)
+        installation["catalogue"] = charger_catalogue(repertoire, langue)
+        chrono_2 = time.time()
+        print(texte1[langue]["TERMINE"] + str(chrono_2 - chrono_1) + texte1[langue]["SECONDES"] + "\n")
+        installation["etape"] = "termine"
+    except (OSError, ValueError, zipfile.BadZipFile) as erreur:
+        print(texte1[langue]["ERREUR"] + ": " + texte1[langue]["INSTALLATION"] + str(erreur))
+        installation["etape"] = "erreur"
+
+########################################################################
+def creer_installation(repertoire, url, empreinte="", extraction=False, langue="fr"):
+    """ Retourne l'état de l'installation de la base de formes dans le répertoire indiqué, avec sa
+    tâche d'arrière-plan (à démarrer) """
+    installation = {
+        "repertoire": repertoire,
+        "url": url,
+        "empreinte": empreinte,
+        "extraction": extraction,
+        "langue": langue,
+        "etape": "attente",
+        "octets": 0,
+        "total": 0,
+        "catalogue": None # catalogue à jour de la bibliothèque installée
+    }
+    installation["tache"] = threading.Thread(target=installer, args=(installation,), daemon=True)
+    return installation
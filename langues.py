@@ -15,14 +15,26 @@ texte1 = \
     {
         "TITRE" : "Le jeu de la Vie",
 
-        "TELECHARGEMENT"  : "Téléchargement de la base de formes du site LifeWiki (une fois, < 30 s)",
-        "DECOMPRESSION"   : "Installation de la base de formes du site LifeWiki (une fois, < 30 s)",
+        "TELECHARGEMENT"  : "Téléchargement en arrière-plan de la base de formes du site LifeWiki (une fois, < 30 s)",
+        "DECOMPRESSION"   : "Installation en arrière-plan de la base de formes du site LifeWiki (une fois, < 30 s)",
+        "INSTALLATION"    : "installation de la base de formes interrompue, reprise au prochain lancement : ",
         "TERMINE"         : "Terminé en ",
         "CYCLE_EVOLUTION" : "Cycle d'évolution terminé en ",
         "SECONDES"        : " secondes",
+        "MOTEUR_INDISPONIBLE" : "moteur indisponible, utilisation du moteur python à la place de ",
+        "MOTEUR_INCONNU"  : "moteur inconnu, utilisation du moteur python à la place de ",
+        "REGLE_INCONNUE"  : "règle non reconnue : ",
+        "REGLE_B0"        : "règle avec naissance à 0 voisine impossible sur plan infini : ",
+        "CACHE_HASHLIFE"  : "Cache HashLife : ",
+        "NOEUDS"          : "noeuds",
+        "RESULTATS"       : "résultats",
+        "TAUX_SUCCES"     : "succès",
+        "COLLECTES"       : "collectes",
+        "MEMOIRE"         : "mémoire",
 
         "POP_MINIMUM" : "min",
         "POP_MAXIMUM" : "max",
+        "VITESSE_MAXIMALE" : "max",
 
         "AVERTISSEMENT" : "AVERTISSEMENT ",
         "ERREUR"        : "ERREUR ",
@@ -37,22 +49,48 @@ texte1 = \
         "TOUCHE_VIDER"        : "v",
         "TOUCHE_QUITTER"      : "q",
         "TOUCHE_CONFIRMATION" : "o",
-
-        "DERNIERE_PARTIE" : "_DernierePartie"
+        "TOUCHE_MESURES"      : "m",
+        "TOUCHE_EXPORTER"     : "x",
+        "TOUCHE_GENERATION"   : "g",
+
+        "GENERATIONS"       : "générations",
+        "MESURE_VOISINES"   : "voisines",
+        "MESURE_REGLE"      : "règle",
+        "MESURE_DETOURAGE"  : "détourage",
+        "MESURE_MOTEUR"     : "moteur",
+        "MESURE_AFFICHAGE"  : "affichage",
+        "MESURE_EVENEMENTS" : "événements",
+
+        "DERNIERE_PARTIE" : "_DernierePartie",
+        "MESURES"         : "_Mesures",
+
+        "PERIODE_DETECTEE" : "Période détectée à la génération "
     },
 
     "en" : # English
     {
         "TITRE" : "The game of Life",
 
-        "TELECHARGEMENT" : "Downloading the pattern collection from LifeWiki website (only once, < 30 s)",
-        "DECOMPRESSION"  : "Installing the pattern collection from LifeWiki website (only once, < 30 s)",
+        "TELECHARGEMENT" : "Downloading the pattern collection from LifeWiki website in the background (only once, < 30 s)",
+        "DECOMPRESSION"  : "Installing the pattern collection from LifeWiki website in the background (only once, < 30 s)",
+        "INSTALLATION"   : "pattern collection install interrupted, resumed at next launch: ",
         "TERMINE"        : "Done in ",
         "CYCLE_EVOLUTION" : "Evolution cycle completed in ",
         "SECONDES"       : " seconds",
+        "MOTEUR_INDISPONIBLE" : "engine unavailable, using the python engine instead of ",
+        "MOTEUR_INCONNU" : "unknown engine, using the python engine instead of ",
+        "REGLE_INCONNUE" : "unrecognized rule: ",
+        "REGLE_B0"       : "rule with birth on 0 neighbours impossible on an infinite plane: ",
+        "CACHE_HASHLIFE" : "HashLife cache: ",
+        "NOEUDS"         : "nodes",
+        "RESULTATS"      : "results",
+        "TAUX_SUCCES"    : "hits",
+        "COLLECTES"      : "collections",
+        "MEMOIRE"        : "memory",
 
         "POP_MINIMUM"   : "min",
         "POP_MAXIMUM"   : "max",
+        "VITESSE_MAXIMALE" : "max",
 
         "AVERTISSEMENT" : "WARNING",
         "ERREUR"        : "ERROR",
@@ -67,8 +105,22 @@ texte1 = \
         "TOUCHE_VIDER"        : "e",
         "TOUCHE_QUITTER"      : "q",
         "TOUCHE_CONFIRMATION" : "y",
-
-        "DERNIERE_PARTIE" : "_LastGame"
+        "TOUCHE_MESURES"      : "m",
+        "TOUCHE_EXPORTER"     : "x",
+        "TOUCHE_GENERATION"   : "g",
+
+        "GENERATIONS"       : "generations",
+        "MESURE_VOISINES"   : "neighbours",
+        "MESURE_REGLE"      : "rule",
+        "MESURE_DETOURAGE"  : "bounding box",
+        "MESURE_MOTEUR"     : "engine",
+        "MESURE_AFFICHAGE"  : "rendering",
+        "MESURE_EVENEMENTS" : "events",
+
+        "DERNIERE_PARTIE" : "_LastGame",
+        "MESURES"         : "_Metrics",
+
+        "PERIODE_DETECTEE" : "Period detected at generation "
     }
 }
 
@@ -81,35 +133,43 @@ texte2 = \
         {
             "MODE_EDITION"      : " [mode édition : ESC=mode évolution, B=bibliothèque interne, F=sélecteur de fichier, clic=poser, S=sauvegarder, R=restaurer, V=vider, Q=quitter]",
             "MODE_BIBLIOTHEQUE" : " [mode bibliothèque interne : ESC=mode édition, flèches=sélectionner, souris=positionner, Entrée=poser] => ",
-            "MODE_EVOLUTION"    : " [mode évolution : ESC=mode édition, +/-=accélérer/décélérer, Espace=pause]",
+            "MODE_EVOLUTION"    : " [mode évolution : ESC=mode édition, +/-=accélérer/décélérer, Espace=pause, G=aller à la génération, M=mesures, X=exporter]",
             "MODE_SAISIE"       : " [mode saisie : ESC=mode édition, Entrée=valider] Nom du fichier ? => ",
             "MODE_CONFIRMATION" : " [mode confirmation : O/o=confirmer, autre=annuler] Ecraser le fichier ? => ",
             "MODE_FICHIER"      : " [mode sélecteur de fichier : ESC=mode édition, flèches=sélectionner, souris=positionner, Entrée=poser] => ",
-            "MODE_PAUSE"        : " [mode évolution en pause : ESC=mode édition, Espace=reprendre] ",
+            "MODE_PAUSE"        : " [mode évolution en pause : ESC=mode édition, Espace=reprendre, Gauche/Droite=génération précédente/suivante, PgPréc/PgSuiv=100 générations, Début/Fin=première/dernière, G=aller à la génération, M=mesures, X=exporter] ",
+            "MODE_GENERATION"   : " [mode saisie de génération : ESC=mode édition, Entrée=valider] Génération à atteindre ? => ",
+            "MODE_AVANCE"       : " [mode avance rapide : ESC=mode édition, Espace=interrompre] ",
 
             "VITESSE"    : "vitesse",
             "GENERATION" : "génération",
             "POPULATION" : "population",
             "NAISSANCES" : "naissances",
             "SURVIE"     : "survies",
-            "DECES"      : "décès"
+            "DECES"      : "décès",
+            "PERIODE"    : "période",
+            "DEPLACEMENT" : "déplacement"
         },
         "court" :
         {
             "MODE_EDITION"      : " [édition: ESC/B/F/clic/S/R/V/Q]",
             "MODE_BIBLIOTHEQUE" : " [bibliothèque: ESC/flèches/souris/Entrée] => ",
-            "MODE_EVOLUTION"    : " [évolution: ESC/+/-/Espace]",
+            "MODE_EVOLUTION"    : " [évolution: ESC/+/-/Espace/G/M/X]",
             "MODE_SAISIE"       : " [saisie: ESC/Entrée] Nom ? => ",
             "MODE_CONFIRMATION" : " [confirmation: O/o/autre] Ecraser ? => ",
             "MODE_FICHIER"      : " [sélecteur de fichier: ESC/flèches/souris/Entrée] => ",
-            "MODE_PAUSE"        : " [évolution en pause: ESC/Espace] ",
+            "MODE_PAUSE"        : " [évolution en pause: ESC/Espace/Gauche/Droite/PgPréc/PgSuiv/Début/Fin/G/M/X] ",
+            "MODE_GENERATION"   : " [génération: ESC/Entrée] Gen ? => ",
+            "MODE_AVANCE"       : " [avance: ESC/Espace] ",
 
             "VITESSE"    : "v",
             "GENERATION" : "gen",
             "POPULATION" : "pop",
             "NAISSANCES" : "n",
             "SURVIE"     : "s",
-            "DECES"      : "d"
+            "DECES"      : "d",
+            "PERIODE"    : "p",
+            "DEPLACEMENT" : "dep"
         }
     },
 
@@ -119,35 +179,43 @@ texte2 = \
         {
             "MODE_EDITION"      : " [edit mode: ESC=evolution mode, L=internal library, F=file selector, click=paste, S=save, R=restore, E=empty, Q=quit]",
             "MODE_BIBLIOTHEQUE" : " [internal library mode: ESC=edit mode, arrows=select, mouse=position, Return=paste] => ",
-            "MODE_EVOLUTION"    : " [evolution mode: ESC=edit mode, +/-=faster/slower, Space=pause] ",
+            "MODE_EVOLUTION"    : " [evolution mode: ESC=edit mode, +/-=faster/slower, Space=pause, G=go to generation, M=metrics, X=export] ",
             "MODE_SAISIE"       : " [typing mode: ESC=edit mode, Return=validate] File name? => ",
             "MODE_CONFIRMATION" : " [confirmation mode: Y/y=confirm, other=cancel] Overwrite file? => ",
             "MODE_FICHIER"      : " [file selection mode: ESC=edit mode, arrows=select, mouse=position, Return=paste] => ",
-            "MODE_PAUSE"        : " [evolution mode stalled: ESC=edit mode, Space=unpause] ",
+            "MODE_PAUSE"        : " [evolution mode stalled: ESC=edit mode, Space=unpause, Left/Right=previous/next generation, PgUp/PgDn=100 generations, Home/End=first/last, G=go to generation, M=metrics, X=export] ",
+            "MODE_GENERATION"   : " [generation typing mode: ESC=edit mode, Return=validate] Generation to reach? => ",
+            "MODE_AVANCE"       : " [fast forward mode: ESC=edit mode, Space=interrupt] ",
 
             "VITESSE"      : "speed",
             "GENERATION"   : "generation",
             "POPULATION"   : "population",
             "NAISSANCES"   : "births",
             "SURVIE"       : "survivals",
-            "DECES"        : "deaths"
+            "DECES"        : "deaths",
+            "PERIODE"      : "period",
+            "DEPLACEMENT"  : "displacement"
         },
         "court" :
         {
             "MODE_EDITION"      : " [edit: ESC/L/F/click/S/R/E/Q]",
             "MODE_BIBLIOTHEQUE" : " [library: ESC/arrows/mouse/Return] => ",
-            "MODE_EVOLUTION"    : " [evolution: ESC/+/-/Space] ",
+            "MODE_EVOLUTION"    : " [evolution: ESC/+/-/Space/G/M/X] ",
             "MODE_SAISIE"       : " [typing: ESC/Return] Name? => ",
             "MODE_CONFIRMATION" : " [confirmation: Y/y/other] Overwrite? => ",
             "MODE_FICHIER"      : " [file selection: ESC/arrows/mouse/Return] => ",
-            "MODE_PAUSE"        : " [evolution stalled: ESC/Space] ",
+            "MODE_PAUSE"        : " [evolution stalled: ESC/Space/Left/Right/PgUp/PgDn/Home/End/G/M/X] ",
+            "MODE_GENERATION"   : " [generation: ESC/Return] Gen? => ",
+            "MODE_AVANCE"       : " [fast forward: ESC/Space] ",
 
             "VITESSE"    : "s",
             "GENERATION" : "gen",
             "POPULATION" : "pop",
             "NAISSANCES" : "b",
             "SURVIE"     : "s",
-            "DECES"      : "d"
+            "DECES"      : "d",
+            "PERIODE"    : "p",
+            "DEPLACEMENT" : "disp"
         }
     }
 }
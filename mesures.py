@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+""" Mesure des durées des phases de chaque génération
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Les durées sont mesurées en nanosecondes avec time.perf_counter_ns() et gardées par génération
+  dans un historique circulaire de taille bornée (les plus anciennes étant oubliées)
+- Phases mesurées par les moteurs d'évolution python, numpy et binaire (et par le moteur parallèle
+  quand il revient au moteur de référence) : comptage des voisines, application de la règle et
+  redéfinition de la zone utile (détourage). Les autres moteurs, comme le rejeu d'un cycle, ne
+  mesurent que la durée totale de leur appel
+- Phases mesurées par le programme principal : dessin de l'affichage et traitement des événements,
+  cumulés depuis la génération précédente
+- Export au format CSV (une ligne par génération) ou JSON (avec le résumé et le contexte)
+- N'importe pas PyGame, ce qui permet de comparer les moteurs d'évolution avec vie_lot.py
+"""
+
+import collections
+import csv
+import io
+import json
+import threading
+
+from fichiers import ecrire_fichier
+
+PHASES = ("voisines", "regle", "detourage", "moteur", "affichage", "evenements")
+TAILLE_HISTORIQUE = 1000 # générations
+
+########################################################################
+def creer_mesures(taille=TAILLE_HISTORIQUE):
+    """ Retourne un historique vide des durées des phases des dernières générations """
+    return {
+        # Les durées d'affichage et d'événements sont ajoutées par la boucle d'affichage pendant que la
+        # tâche de calcul enregistre les générations
+        "verrou": threading.Lock(),
+        "historique": collections.deque(maxlen=taille),
+        "en_cours": {} # durées cumulées depuis la dernière génération enregistrée
+    }
+
+########################################################################
+def ajouter_duree(mesures, phase, duree):
+    """ Ajoute une durée en nanosecondes à la phase indiquée de la génération en cours """
+    with mesures["verrou"]:
+        mesures["en_cours"][phase] = mesures["en_cours"].get(phase, 0) + duree
+
+########################################################################
+def enregistrer_generation(mesures, generation, chronometre):
+    """ Enregistre dans l'historique les durées de la génération calculée, mesurées par le moteur
+    d'évolution dans le chronomètre (qui est vidé) et cumulées depuis la génération précédente """
+    with mesures["verrou"]:
+        enregistrement = {"generation": generation}
+        for phase in PHASES:
+            enregistrement[phase] = chronometre.get(phase, 0) + mesures["en_cours"].get(phase, 0)
+        mesures["historique"].append(enregistrement)
+        mesures["en_cours"].clear()
+    chronometre.clear()
+
+########################################################################
+def resumer_mesures(mesures, nb_generations=0):
+    """ Retourne le nombre de générations et la durée moyenne par génération en nanosecondes de
+    chaque phase sur les dernières générations de l'historique (toutes par défaut) """
+    with mesures["verrou"]:
+        enregistrements = list(mesures["historique"])
+    if nb_generations:
+        enregistrements = enregistrements[-nb_generations:]
+    resume = {"generations": len(enregistrements)}
+    for phase in PHASES:
+        resume[phase] = sum(enregistrement[phase] for enregistrement in enregistrements) // max(len(enregistrements), 1)
+    return resume
+
+########################################################################
+def exporter_csv(chemin_fichier, mesures):
+    """ Sauvegarde l'historique des durées au format CSV, une ligne par génération """
+    with mesures["verrou"]:
+        enregistrements = list(mesures["historique"])
+    texte = io.StringIO()
+    # Fins de ligne converties par ecrire_fichier() selon le système
+    ecriture = csv.writer(texte, lineterminator="\n")
+    ecriture.writerow(("generation",) + PHASES)
+    for enregistrement in enregistrements:
+        ecriture.writerow([enregistrement["generation"]] + [enregistrement[phase] for phase in PHASES])
+    ecrire_fichier(chemin_fichier, [texte.getvalue()])
+
+########################################################################
+def exporter_json(chemin_fichier, mesures, contexte=None):
+    """ Sauvegarde l'historique des durées au format JSON, avec leur résumé et le contexte indiqué
+    (moteur d'évolution, règle, etc.) """
+    with mesures["verrou"]:
+        enregistrements = list(mesures["historique"])
+    contenu = {
+        "contexte": contexte or {},
+        "unite": "ns",
+        "resume": resumer_mesures(mesures),
+        "generations": enregistrements
+    }
+    ecrire_fichier(chemin_fichier, [json.dumps(contenu, indent=1)])
+
+########################################################################
+def exporter_mesures(chemin_fichier, mesures, contexte=None):
+    """ Sauvegarde l'historique des durées au format JSON si le fichier a l'extension .json, sinon
+    au format CSV """
+    if chemin_fichier.lower().endswith(".json"):
+        exporter_json(chemin_fichier, mesures, contexte)
+    else:
+        exporter_csv(chemin_fichier, mesures)
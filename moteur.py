@@ -0,0 +1,347 @@
+#!/usr/bin/python3
+""" Interface commune aux moteurs d'évolution
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Une simulation est un dictionnaire réunissant le plateau, la règle, le moteur d'évolution choisi
+  et l'état propre à ce moteur. Les fonctions de ce module la manipulent sans variable globale, ce
+  qui permet au programme principal, à l'exécution sans affichage ou à tout autre programme de
+  piloter n'importe quel moteur de la même manière
+- Les moteurs d'évolution autres que celui de référence ne sont importés qu'à la création d'une
+  simulation qui les utilise, l'import de ce module restant ainsi quasi instantané
+- Sur plan infini (moteurs hashlife et creux), le plateau est une fenêtre sur l'univers commençant
+  en origine, et les règles avec naissance à 0 voisine (B0) sont refusées
+- Sans affichage, le plateau n'est plus tenu à jour pendant l'évolution (âges du moteur binaire,
+  fenêtre des moteurs sur plan infini) et seuls les statuts sont calculés
+- Si la simulation a un chronomètre (dictionnaire), la durée en nanosecondes de chaque cycle et
+  celles des phases mesurées par le moteur d'évolution y sont notées (voir mesures.py)
+"""
+
+import importlib
+import time
+
+from configuration import MOTEURS
+import moteur_python
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE
+
+########################################################################
+def charger_moteur(nom):
+    """ Retourne le module du moteur d'évolution indiqué, importé à la première demande """
+    return importlib.import_module("moteur_" + nom)
+
+########################################################################
+def verifier_regle(nom, regle):
+    """ Lève ValueError si le moteur d'évolution indiqué ne peut pas appliquer la règle compilée :
+    sur plan infini, une naissance à 0 voisine (B0) ferait naître une infinité de cellules """
+    if nom in ("hashlife", "creux") and 0 in regle["naissance"]:
+        raise ValueError(regle["texte"])
+
+########################################################################
+def creer_simulation(parametres, regle, nb_lignes, nb_colonnes, affichage=True):
+    """ Retourne une simulation sur une grille de jeu vide, avec la règle compilée indiquée et le
+    moteur d'évolution et les réglages des paramètres de configuration, ou lève ValueError si la
+    règle ne convient pas au moteur """
+    nom = parametres.get("MOTEUR", "python")
+    verifier_regle(nom, regle)
+    module = charger_moteur(nom)
+    simulation = {
+        "moteur": nom,
+        "module": module,
+        "regle": regle,
+        "affichage": affichage,
+        "nb_lignes": nb_lignes,
+        "nb_colonnes": nb_colonnes,
+        "zone_utile": {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes},
+        "origine": (0, 0),
+        "generation": 1,
+        "generations_par_cycle": 1,
+        "chronometre": None, # durées des phases du dernier cycle, en nanosecondes
+        # Etat propre aux moteurs d'évolution
+        "table_regle": None,
+        "lignes_binaires": None,
+        "etat_tuiles": None,
+        "univers": None,
+        "groupe": None
+    }
+
+    if nom == "numpy":
+        simulation["plateau"] = module.creer_plateau(nb_lignes, nb_colonnes)
+    else:
+        simulation["plateau"] = moteur_python.creer_plateau(nb_lignes, nb_colonnes)
+
+    if nom == "numpy":
+        simulation["table_regle"] = module.compiler_regle(regle)
+    elif nom == "hashlife":
+        simulation["pas"] = parametres.get("PAS_HASHLIFE", 0)
+        simulation["taille_cache"] = parametres.get("CACHE_HASHLIFE", module.TAILLE_CACHE)
+        simulation["generations_par_cycle"] = 1 << simulation["pas"]
+    elif nom == "creux":
+        # Sur plan infini creux, l'univers est tenu à jour dès l'édition
+        simulation["univers"] = module.creer_univers(regle, avec_ages=affichage)
+    elif nom == "parallele":
+        simulation["groupe"] = module.creer_groupe(parametres.get("PROCESSUS", 0))
+        simulation["seuil"] = parametres.get("SEUIL_PARALLELE", module.SEUIL_PARALLELE)
+    return simulation
+
+########################################################################
+def changer_regle(simulation, regle):
+    """ Remplace la règle compilée de la simulation (hors évolution), ou lève ValueError si elle ne
+    convient pas au moteur """
+    verifier_regle(simulation["moteur"], regle)
+    simulation["regle"] = regle
+    if simulation["moteur"] == "numpy":
+        simulation["table_regle"] = simulation["module"].compiler_regle(regle)
+    elif simulation["moteur"] == "creux":
+        simulation["univers"]["regle"] = regle
+
+########################################################################
+def terminer(simulation):
+    """ Libère les ressources de la simulation (processus de calcul) """
+    if simulation["groupe"] is not None:
+        simulation["module"].terminer_groupe(simulation["groupe"])
+        simulation["groupe"] = None
+
+########################################################################
+def detourer(simulation):
+    """ Retourne la zone utile de la grille de jeu """
+    if simulation["moteur"] == "numpy":
+        return simulation["module"].detourer(simulation["plateau"], 0, 0, simulation["nb_colonnes"] - 1, simulation["nb_lignes"] - 1)
+    return moteur_python.detourer(simulation["plateau"], 0, 0, simulation["nb_colonnes"] - 1, simulation["nb_lignes"] - 1)
+
+########################################################################
+def compter_cellules(simulation):
+    """ Retourne le nombre de cellules vivantes de la simulation """
+    if simulation["moteur"] == "creux":
+        return len(simulation["univers"]["cellules"])
+    if simulation["moteur"] == "numpy":
+        return simulation["module"].compter_cellules(simulation["plateau"])
+    return moteur_python.compter_cellules(simulation["plateau"])
+
+########################################################################
+def est_vivante(simulation, colonne, ligne):
+    """ Retourne un booléen indiquant si la cellule indiquée du plateau est vivante, même sans
+    affichage (hors moteurs sur plan infini) """
+    if simulation["moteur"] == "binaire" and simulation["lignes_binaires"] is not None:
+        # Sans affichage, le plateau des âges n'est pas tenu à jour
+        return bool(simulation["lignes_binaires"][ligne] >> colonne & 1)
+    return bool(simulation["plateau"][ligne][colonne] != CELLULE_MORTE)
+
+########################################################################
+def basculer_cellule(simulation, colonne, ligne):
+    """ Fait naître ou mourir la cellule indiquée de la grille de jeu """
+    plateau = simulation["plateau"]
+    if plateau[ligne][colonne] == CELLULE_MORTE:
+        plateau[ligne][colonne] = CELLULE_NAISSANTE
+    else:
+        plateau[ligne][colonne] = CELLULE_MORTE
+    if simulation["moteur"] == "creux":
+        origine = simulation["origine"]
+        univers = simulation["univers"]
+        simulation["module"].poser_cellule(univers, origine[0] + colonne, origine[1] + ligne, plateau[ligne][colonne] != CELLULE_MORTE)
+        # Les cellules visibles sont celles que la prochaine projection effacera
+        if plateau[ligne][colonne] != CELLULE_MORTE:
+            univers["visibles"].add((colonne, ligne))
+        else:
+            univers["visibles"].discard((colonne, ligne))
+
+########################################################################
+def appliquer_changements(simulation, changements):
+    """ Donne aux cases indiquées par les changements (colonne, ligne, valeur) leur nouvelle valeur
+    en tenant à jour l'état propre au moteur d'évolution (moteurs sur plateau borné), comme le
+    ferait une génération, et retourne la liste des cases modifiées """
+    plateau = simulation["plateau"]
+    lignes_binaires = simulation["lignes_binaires"] if simulation["moteur"] == "binaire" else None
+    etat_tuiles = simulation["etat_tuiles"] if simulation["moteur"] == "tuiles" else None
+    actives = set()
+    modifications = []
+    for colonne, ligne, valeur in changements:
+        vivante = valeur != CELLULE_MORTE
+        if lignes_binaires is not None:
+            if vivante:
+                lignes_binaires[ligne] |= 1 << colonne
+            else:
+                lignes_binaires[ligne] &= ~(1 << colonne)
+        if etat_tuiles is not None and vivante != (plateau[ligne][colonne] != CELLULE_MORTE):
+            tuile = (ligne // etat_tuiles["taille"], colonne // etat_tuiles["taille"])
+            population = etat_tuiles["populations"].get(tuile, 0) + (1 if vivante else -1)
+            if population:
+                etat_tuiles["populations"][tuile] = population
+            else:
+                etat_tuiles["populations"].pop(tuile, None)
+            actives.add(tuile)
+        plateau[ligne][colonne] = valeur
+        modifications.append((colonne, ligne))
+    if etat_tuiles is not None:
+        # Seules les tuiles où une cellule est née ou morte sont à recalculer ensuite
+        etat_tuiles["actives"] = actives
+    return modifications
+
+########################################################################
+def coller_structure(simulation, structure, colonne_plateau, ligne_plateau):
+    """ Recopie une structure dans la grille de jeu à la position indiquée """
+    plateau = simulation["plateau"]
+    if simulation["moteur"] == "creux":
+        # Sur plan infini, la structure n'est pas tronquée aux bords du plateau
+        origine = simulation["origine"]
+        simulation["module"].poser_structure(simulation["univers"], structure, origine[0] + colonne_plateau, origine[1] + ligne_plateau)
+        if simulation["affichage"]:
+            simulation["module"].projeter(simulation["univers"], plateau, origine)
+    else:
+        moteur_python.coller_structure(plateau, structure, colonne_plateau, ligne_plateau)
+
+########################################################################
+def coller_cellules(simulation, cellules, colonne_plateau, ligne_plateau):
+    """ Fait naître dans la grille de jeu les cellules de coordonnées (colonne, ligne) indiquées,
+    relatives à la position indiquée, sans représenter les cellules mortes de la structure """
+    plateau = simulation["plateau"]
+    if simulation["moteur"] == "creux":
+        origine = simulation["origine"]
+        for colonne, ligne in cellules:
+            simulation["module"].poser_cellule(simulation["univers"], origine[0] + colonne_plateau + colonne, origine[1] + ligne_plateau + ligne)
+        if simulation["affichage"]:
+            simulation["module"].projeter(simulation["univers"], plateau, origine)
+    else:
+        for colonne, ligne in cellules:
+            if 0 <= ligne + ligne_plateau < simulation["nb_lignes"] and 0 <= colonne + colonne_plateau < simulation["nb_colonnes"]:
+                plateau[ligne + ligne_plateau][colonne + colonne_plateau] = CELLULE_NAISSANTE
+
+########################################################################
+def vider(simulation):
+    """ Retire toutes les cellules de la simulation """
+    if simulation["moteur"] == "creux":
+        simulation["module"].vider(simulation["univers"])
+    if simulation["moteur"] == "numpy":
+        simulation["module"].vider(simulation["plateau"])
+    else:
+        moteur_python.vider(simulation["plateau"])
+
+########################################################################
+def deplacer(simulation, decalage_x, decalage_y):
+    """ Déplace la fenêtre sur l'univers d'un moteur sur plan infini """
+    x, y = simulation["origine"]
+    simulation["origine"] = (x + decalage_x, y + decalage_y)
+    if simulation["univers"] is not None:
+        simulation["module"].projeter(simulation["univers"], simulation["plateau"], simulation["origine"])
+
+########################################################################
+def demarrer(simulation):
+    """ Prépare le moteur d'évolution à partir de la grille de jeu et retourne le statut initial """
+    reprendre(simulation, 1)
+    nb_cellules = compter_cellules(simulation)
+    return {"population": nb_cellules, "naissances": nb_cellules, "survie": 0, "deces": 0}
+
+########################################################################
+def reprendre(simulation, generation):
+    """ Prépare le moteur d'évolution à partir de la grille de jeu, qui est à la génération
+    indiquée """
+    simulation["generation"] = generation
+    simulation["zone_utile"] = detourer(simulation)
+    module = simulation["module"]
+    if simulation["moteur"] == "binaire":
+        simulation["lignes_binaires"] = module.compacter(simulation["plateau"])
+    elif simulation["moteur"] == "tuiles":
+        simulation["etat_tuiles"] = module.creer_etat(simulation["plateau"])
+    elif simulation["moteur"] == "hashlife":
+        # Le plateau a pu être modifié depuis la dernière évolution
+        simulation["univers"] = module.creer_univers(simulation["regle"], simulation["taille_cache"])
+        module.poser_structure(simulation["univers"], simulation["plateau"], simulation["origine"][0], simulation["origine"][1])
+
+########################################################################
+def avancer(simulation):
+    """ Fait évoluer la simulation d'un cycle et retourne le résultat du moteur d'évolution
+    (statut, zone utile et cases modifiées) """
+    nom = simulation["moteur"]
+    module = simulation["module"]
+    plateau = simulation["plateau"]
+    zone_utile = simulation["zone_utile"]
+    chronometre = simulation["chronometre"]
+    if chronometre is not None:
+        # Seules les phases mesurées pendant ce cycle y figurent ensuite
+        chronometre.clear()
+    debut = time.perf_counter_ns()
+
+    if nom == "numpy":
+        resultat = module.evoluer(plateau, zone_utile, simulation["table_regle"], chronometre)
+    elif nom == "binaire":
+        # Le plateau ne sert plus que de tableau annexe des âges pour l'affichage
+        ages = plateau if simulation["affichage"] else None
+        resultat = module.evoluer(simulation["lignes_binaires"], simulation["nb_colonnes"], zone_utile, simulation["regle"], ages, chronometre)
+    elif nom == "hashlife":
+        # Le plateau n'est plus qu'une fenêtre sur l'univers
+        if simulation["affichage"]:
+            resultat = module.evoluer(simulation["univers"], simulation["pas"], plateau, simulation["origine"])
+        else:
+            univers = simulation["univers"]
+            module.limiter_cache(univers)
+            ancienne_racine = univers["racine"]
+            module.avancer(univers, simulation["pas"])
+            naissances, deces = module.comparer(univers, ancienne_racine, univers["racine"])
+            population = univers["population"][univers["racine"]]
+            resultat = {
+                "statut": {"population": population, "naissances": naissances, "survie": population - naissances, "deces": deces},
+                "zone_utile": zone_utile,
+                "modifications": []
+            }
+    elif nom == "creux":
+        if simulation["affichage"]:
+            resultat = module.evoluer(simulation["univers"], plateau, simulation["origine"])
+        else:
+            naissantes, mourantes = module.avancer(simulation["univers"])
+            population = len(simulation["univers"]["cellules"])
+            resultat = {
+                "statut": {"population": population, "naissances": len(naissantes), "survie": population - len(naissantes), "deces": len(mourantes)},
+                "zone_utile": zone_utile,
+                "modifications": []
+            }
+    elif nom == "tuiles":
+        resultat = module.evoluer(plateau, simulation["etat_tuiles"], simulation["regle"])
+    elif nom == "parallele":
+        resultat = module.evoluer(plateau, zone_utile, simulation["regle"], simulation["groupe"], simulation["seuil"], chronometre)
+    else:
+        resultat = moteur_python.evoluer(plateau, zone_utile, simulation["regle"], chronometre)
+
+    if chronometre is not None:
+        chronometre["moteur"] = time.perf_counter_ns() - debut
+    simulation["zone_utile"] = resultat["zone_utile"]
+    simulation["generation"] += simulation["generations_par_cycle"]
+    return resultat
+
+########################################################################
+def extraire_structure(simulation):
+    """ Retourne la structure (liste de lignes) englobant les cellules vivantes de la simulation et
+    sa position dans le repère du plateau, y compris hors du plateau sur plan infini """
+    x_0, y_0 = simulation["origine"]
+    if simulation["moteur"] in ("hashlife", "creux") and simulation["univers"] is not None:
+        univers = simulation["univers"]
+        if simulation["moteur"] == "hashlife":
+            demi_cote = 1 << (univers["niveau"][univers["racine"]] - 1)
+            vivantes = simulation["module"].cellules(univers, -demi_cote, -demi_cote, demi_cote - 1, demi_cote - 1)
+        else:
+            vivantes = univers["cellules"]
+        vivantes = [(x - x_0, y - y_0) for x, y in vivantes]
+    elif simulation["moteur"] == "binaire" and simulation["lignes_binaires"] is not None:
+        vivantes = []
+        for ligne, cellules in enumerate(simulation["lignes_binaires"]):
+            while cellules:
+                bit = cellules & -cellules
+                vivantes.append((bit.bit_length() - 1, ligne))
+                cellules ^= bit
+    else:
+        vivantes = []
+        for ligne, cases in enumerate(simulation["plateau"]):
+            for colonne, case in enumerate(cases):
+                if case != CELLULE_MORTE:
+                    vivantes.append((colonne, ligne))
+
+    if not vivantes:
+        return [], (0, 0)
+    x_1 = min(x for x, y in vivantes)
+    y_1 = min(y for x, y in vivantes)
+    x_2 = max(x for x, y in vivantes)
+    y_2 = max(y for x, y in vivantes)
+    structure = moteur_python.creer_plateau(y_2 - y_1 + 1, x_2 - x_1 + 1)
+    for x, y in vivantes:
+        structure[y - y_1][x - x_1] = CELLULE_NAISSANTE
+    return structure, (x_1, y_1)
@@ -0,0 +1,213 @@
+#!/usr/bin/python3
+""" Moteur d'évolution sur plateau compacté en bits
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Chaque ligne du plateau est un entier Python dont le bit n° colonne vaut 1 si la cellule est
+  vivante, ce qui permet de calculer toute une ligne à la fois par opérations logiques :
+    - les 8 voisines de chaque cellule sont obtenues par décalage des lignes du dessus, courante et
+      du dessous
+    - elles sont additionnées par des additionneurs complets en un compteur de 4 bits par cellule
+    - la règle B/S est appliquée en comparant ce compteur aux nombres de voisines de la règle
+- Les règles non totalistiques, qui ne se contentent pas du nombre de voisines, sont appliquées
+  cellule par cellule en consultant la table de transition des configurations du voisinage
+- L'âge des cellules, qui ne sert qu'à l'affichage, est tenu dans un tableau annexe optionnel
+  (de même forme que le plateau du moteur de référence) qu'on peut omettre sans affichage
+"""
+
+import time
+
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE, chronometrer, elargir_zone
+
+########################################################################
+def compter_bits(nombre):
+    """ Retourne le nombre de bits à 1 dans un entier positif """
+    return bin(nombre).count("1")
+
+########################################################################
+def compacter(plateau):
+    """ Retourne les lignes compactées en bits d'une grille de jeu du moteur de référence """
+    lignes = []
+    for ligne_plateau in plateau:
+        ligne = 0
+        for colonne, case in enumerate(ligne_plateau):
+            if case != CELLULE_MORTE:
+                ligne |= 1 << colonne
+        lignes.append(ligne)
+    return lignes
+
+########################################################################
+def decompacter(lignes, nb_colonnes):
+    """ Retourne une grille de jeu du moteur de référence à partir de lignes compactées en bits """
+    plateau = []
+    for ligne in lignes:
+        plateau.append([(ligne >> colonne) & 1 for colonne in range(nb_colonnes)])
+    return plateau
+
+########################################################################
+def additionner(a, b, c):
+    """ Retourne la somme et la retenue de l'addition bit à bit de 3 lignes (additionneur complet) """
+    a_ou_exclusif_b = a ^ b
+    return a_ou_exclusif_b ^ c, (a & b) | (c & a_ou_exclusif_b)
+
+########################################################################
+def compter_voisines(haut, milieu, bas, masque):
+    """ Retourne les 4 bits (unités, deuxaines, quatraines, huitaines) du nombre de voisines de
+    chaque cellule de la ligne du milieu """
+    somme_1, retenue_1 = additionner((haut << 1) & masque, haut, haut >> 1)
+    somme_2, retenue_2 = additionner((bas << 1) & masque, bas, bas >> 1)
+    somme_3 = ((milieu << 1) & masque) ^ (milieu >> 1)
+    retenue_3 = ((milieu << 1) & masque) & (milieu >> 1)
+
+    # Unités
+    bit_0, retenue_4 = additionner(somme_1, somme_2, somme_3)
+
+    # Deuxaines (4 retenues de poids 2)
+    somme_5, retenue_5 = additionner(retenue_1, retenue_2, retenue_3)
+    bit_1 = somme_5 ^ retenue_4
+    retenue_6 = somme_5 & retenue_4
+
+    # Quatraines et huitaines (2 retenues de poids 4)
+    bit_2 = retenue_5 ^ retenue_6
+    bit_3 = retenue_5 & retenue_6
+
+    return bit_0, bit_1, bit_2, bit_3
+
+########################################################################
+def selectionner(bits, nombres, masque):
+    """ Retourne la ligne des cellules dont le nombre de voisines fait partie des nombres indiqués """
+    resultat = 0
+    for nombre in nombres:
+        selection = masque
+        for rang in range(4):
+            if nombre & (1 << rang):
+                selection &= bits[rang]
+            else:
+                selection &= ~bits[rang]
+        resultat |= selection
+    return resultat
+
+########################################################################
+def consulter_voisinage(haut, milieu, bas, masque, voisinage):
+    """ Retourne la ligne des cellules vivantes à la génération suivante d'après la table de
+    transition des configurations du voisinage """
+    # Seules les cases ayant une cellule vivante dans leur voisinage peuvent être concernées,
+    # sauf si une configuration vide fait naître une cellule
+    if voisinage[0]:
+        candidates = masque
+    else:
+        candidates = haut | milieu | bas
+        candidates = (candidates | (candidates << 1) | (candidates >> 1)) & masque
+
+    resultat = 0
+    while candidates:
+        bit = candidates & -candidates
+        colonne = bit.bit_length() - 1
+        if colonne > 0:
+            index = ((haut >> (colonne - 1)) & 7) | (((milieu >> (colonne - 1)) & 7) << 3) | (((bas >> (colonne - 1)) & 7) << 6)
+        else:
+            index = ((haut << 1) & 7) | (((milieu << 1) & 7) << 3) | (((bas << 1) & 7) << 6)
+        if voisinage[index]:
+            resultat |= bit
+        candidates ^= bit
+    return resultat
+
+########################################################################
+def vieillir(ages, ligne, naissantes, survivantes, mourantes, modifications):
+    """ Reporte dans le tableau annexe des âges les changements d'une ligne et ajoute aux
+    modifications les cellules atteignant leur 2ème génération """
+    for cellules, valeur in ((naissantes, CELLULE_NAISSANTE), (mourantes, CELLULE_MORTE), (survivantes, None)):
+        while cellules:
+            bit = cellules & -cellules
+            colonne = bit.bit_length() - 1
+            if valeur is None:
+                if ages[ligne][colonne] == CELLULE_NAISSANTE:
+                    modifications.append((colonne, ligne))
+                ages[ligne][colonne] += 1
+            else:
+                ages[ligne][colonne] = valeur
+            cellules ^= bit
+
+########################################################################
+def lister(ligne, cellules, modifications):
+    """ Ajoute aux modifications les coordonnées des bits à 1 d'une ligne """
+    while cellules:
+        bit = cellules & -cellules
+        modifications.append((bit.bit_length() - 1, ligne))
+        cellules ^= bit
+
+########################################################################
+def detourer(lignes, nb_colonnes, y_1, y_2):
+    """ Retourne la zone utile des lignes compactées indiquées """
+    zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": len(lignes)}
+    for ligne in range(y_1, y_2 + 1):
+        cellules = lignes[ligne]
+        if cellules:
+            if zone_utile["X_1"] == -1:
+                zone_utile["X_1"] = (cellules & -cellules).bit_length() - 1
+                zone_utile["X_2"] = cellules.bit_length() - 1
+                zone_utile["Y_1"] = ligne
+            else:
+                zone_utile["X_1"] = min(zone_utile["X_1"], (cellules & -cellules).bit_length() - 1)
+                zone_utile["X_2"] = max(zone_utile["X_2"], cellules.bit_length() - 1)
+            zone_utile["Y_2"] = ligne
+    return zone_utile
+
+########################################################################
+def evoluer(lignes, nb_colonnes, zone_utile, regle, ages=None, chronometre=None):
+    """ Applique la règle d'évolution compilée aux lignes compactées (et aux âges s'ils sont fournis) """
+    debut = time.perf_counter_ns()
+    totalistique = regle["table"] is not None
+    nb_lignes = len(lignes)
+    masque_plateau = (1 << nb_colonnes) - 1
+
+    # Implémentation de la règle du jeu dans la zone utile
+    # avec une marge supplémentaire d'une colonne/ligne
+    zone = elargir_zone(zone_utile, nb_lignes, nb_colonnes)
+    masque_zone = ((1 << (zone["X_2"] - zone["X_1"] + 1)) - 1) << zone["X_1"]
+    nouvelles_lignes = []
+    for ligne in range(zone["Y_1"], zone["Y_2"] + 1):
+        haut = lignes[ligne - 1] if ligne > 0 else 0
+        milieu = lignes[ligne]
+        bas = lignes[ligne + 1] if ligne < nb_lignes - 1 else 0
+        if totalistique:
+            bits = compter_voisines(haut, milieu, bas, masque_plateau)
+            nouvelles_lignes.append(
+                (~milieu & selectionner(bits, regle["naissance"], masque_zone))
+                | (milieu & selectionner(bits, regle["survie"], masque_zone))
+            )
+        else:
+            nouvelles_lignes.append(consulter_voisinage(haut, milieu, bas, masque_zone, regle["voisinage"]))
+    # Le comptage des voisines d'une ligne et la sélection de ses nouvelles cellules étant
+    # entrelacés, l'application de la règle ne mesure que la mise à jour des lignes et des âges
+    comptage = time.perf_counter_ns()
+
+    naissances = 0
+    survie = 0
+    deces = 0
+    modifications = []
+    for ligne, nouvelle_ligne in enumerate(nouvelles_lignes, zone["Y_1"]):
+        ancienne_ligne = lignes[ligne]
+        naissantes = nouvelle_ligne & ~ancienne_ligne
+        survivantes = nouvelle_ligne & ancienne_ligne
+        mourantes = ancienne_ligne & ~nouvelle_ligne
+        naissances += compter_bits(naissantes)
+        survie += compter_bits(survivantes)
+        deces += compter_bits(mourantes)
+        lister(ligne, naissantes | mourantes, modifications)
+        if ages is not None:
+            vieillir(ages, ligne, naissantes, survivantes, mourantes, modifications)
+        lignes[ligne] = nouvelle_ligne
+    application = time.perf_counter_ns()
+
+    # Redéfinition de la zone utile
+    zone_utile = detourer(lignes, nb_colonnes, zone["Y_1"], zone["Y_2"])
+    if chronometre is not None:
+        chronometrer(chronometre, debut, comptage, application)
+    return {
+        "statut": {"population": naissances + survie, "naissances": naissances, "survie": survie, "deces": deces},
+        "zone_utile": zone_utile,
+        "modifications": modifications
+        }
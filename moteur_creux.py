@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+""" Moteur d'évolution creux sur plan infini
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Seules les coordonnées (x, y) des cellules vivantes sont stockées, dans un ensemble, ce qui
+  supprime les bords du plateau et rend le coût d'une génération proportionnel à la population
+  plutôt qu'à la surface du plateau
+- Les voisines sont comptées dans un dictionnaire (Counter) ne contenant que les cases ayant au
+  moins une voisine vivante, si bien que les règles avec naissance à 0 voisine (B0) ne sont pas
+  gérées
+- L'âge des cellules, qui ne sert qu'à l'affichage, est tenu dans un dictionnaire optionnel
+- Le plateau du moteur de référence n'est plus qu'une fenêtre sur l'univers, dont le coin
+  supérieur gauche est à la position "origine" de l'univers
+"""
+
+import collections
+
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE
+
+VOISINAGE = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+########################################################################
+def creer_univers(regle, avec_ages=True):
+    """ Retourne un univers vide pour la règle compilée indiquée """
+    return {
+        "cellules": set(),
+        "ages": {} if avec_ages else None,
+        "regle": regle,
+        "generation": 0,
+
+        # Cellules reportées sur le plateau lors de la dernière projection
+        "visibles": set()
+    }
+
+########################################################################
+def vider(univers):
+    """ Retire toutes les cellules de l'univers """
+    univers["cellules"].clear()
+    if univers["ages"] is not None:
+        univers["ages"].clear()
+
+########################################################################
+def poser_cellule(univers, x, y, vivante=True):
+    """ Fait naître ou mourir la cellule de coordonnées x, y """
+    if vivante:
+        if (x, y) not in univers["cellules"]:
+            univers["cellules"].add((x, y))
+            if univers["ages"] is not None:
+                univers["ages"][(x, y)] = CELLULE_NAISSANTE
+    else:
+        univers["cellules"].discard((x, y))
+        if univers["ages"] is not None:
+            univers["ages"].pop((x, y), None)
+
+########################################################################
+def poser_structure(univers, structure, x, y):
+    """ Recopie une structure (liste de lignes) avec son coin supérieur gauche en x, y,
+    cellules mortes comprises """
+    for ligne in range(len(structure)):
+        for colonne in range(len(structure[ligne])):
+            poser_cellule(univers, x + colonne, y + ligne, structure[ligne][colonne] != CELLULE_MORTE)
+
+########################################################################
+def detourer(univers):
+    """ Retourne le rectangle {"X_1", "Y_1", "X_2", "Y_2"} englobant les cellules de l'univers,
+    ou None s'il est vide """
+    if not univers["cellules"]:
+        return None
+    abscisses = [x for x, y in univers["cellules"]]
+    ordonnees = [y for x, y in univers["cellules"]]
+    return {"X_1": min(abscisses), "Y_1": min(ordonnees), "X_2": max(abscisses), "Y_2": max(ordonnees)}
+
+########################################################################
+def avancer(univers):
+    """ Fait évoluer l'univers d'une génération et retourne les ensembles des naissances et décès """
+    cellules = univers["cellules"]
+    regle = univers["regle"]
+
+    voisines = collections.Counter((x + dx, y + dy) for x, y in cellules for dx, dy in VOISINAGE)
+
+    nouvelles = set()
+    if regle["table"] is not None:
+        naissance, survie = regle["table"]
+        for case, nombre in voisines.items():
+            if case in cellules:
+                if survie[nombre]:
+                    nouvelles.add(case)
+            elif naissance[nombre]:
+                nouvelles.add(case)
+        if survie[0]:
+            # Les cellules isolées n'apparaissent pas dans le décompte des voisines
+            nouvelles |= cellules.difference(voisines)
+    else:
+        # Les règles non totalistiques nécessitent la configuration du voisinage de chaque case
+        voisinage = regle["voisinage"]
+        for x, y in cellules.union(voisines):
+            index = 0
+            for dy in range(3):
+                for dx in range(3):
+                    if (x + dx - 1, y + dy - 1) in cellules:
+                        index |= 1 << (3 * dy + dx)
+            if voisinage[index]:
+                nouvelles.add((x, y))
+
+    naissantes = nouvelles - cellules
+    mourantes = cellules - nouvelles
+
+    ages = univers["ages"]
+    if ages is not None:
+        for case in mourantes:
+            del ages[case]
+        for case in ages:
+            ages[case] += 1
+        for case in naissantes:
+            ages[case] = CELLULE_NAISSANTE
+
+    univers["cellules"] = nouvelles
+    univers["generation"] += 1
+    return naissantes, mourantes
+
+########################################################################
+def projeter(univers, plateau, origine, modifications=None):
+    """ Reporte sur le plateau (âges compris) la fenêtre de l'univers commençant en origine et
+    retourne la zone utile du plateau. Les cases dont l'affichage change sont ajoutées aux
+    modifications si elles sont fournies """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    x_0, y_0 = origine
+
+    # Couleurs affichées (morte, naissante ou âgée) des cellules précédemment visibles
+    anciennes = {}
+    for colonne, ligne in univers["visibles"]:
+        anciennes[(colonne, ligne)] = min(plateau[ligne][colonne], CELLULE_NAISSANTE + 1)
+        plateau[ligne][colonne] = CELLULE_MORTE
+
+    visibles = set()
+    zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+    for x, y in univers["cellules"]:
+        colonne = x - x_0
+        ligne = y - y_0
+        if 0 <= colonne < nb_colonnes and 0 <= ligne < nb_lignes:
+            visibles.add((colonne, ligne))
+            if univers["ages"] is not None:
+                plateau[ligne][colonne] = univers["ages"][(x, y)]
+            else:
+                plateau[ligne][colonne] = CELLULE_NAISSANTE
+            couleur = min(plateau[ligne][colonne], CELLULE_NAISSANTE + 1)
+            if couleur != anciennes.pop((colonne, ligne), CELLULE_MORTE) and modifications is not None:
+                modifications.append((colonne, ligne))
+            if zone_utile["X_1"] == -1:
+                zone_utile = {"X_1": colonne, "Y_1": ligne, "X_2": colonne, "Y_2": ligne}
+            else:
+                zone_utile["X_1"] = min(zone_utile["X_1"], colonne)
+                zone_utile["Y_1"] = min(zone_utile["Y_1"], ligne)
+                zone_utile["X_2"] = max(zone_utile["X_2"], colonne)
+                zone_utile["Y_2"] = max(zone_utile["Y_2"], ligne)
+    univers["visibles"] = visibles
+
+    # Les cellules qui ne sont plus visibles sont mortes
+    if modifications is not None:
+        modifications.extend(anciennes.keys())
+    return zone_utile
+
+########################################################################
+def evoluer(univers, plateau, origine=(0, 0)):
+    """ Fait évoluer l'univers d'une génération et reporte sur le plateau les cellules visibles """
+    naissantes, mourantes = avancer(univers)
+    population = len(univers["cellules"])
+    modifications = []
+    zone_utile = projeter(univers, plateau, origine, modifications)
+    return {
+        "statut": {"population": population, "naissances": len(naissantes), "survie": population - len(naissantes), "deces": len(mourantes)},
+        "zone_utile": zone_utile,
+        "modifications": modifications
+        }
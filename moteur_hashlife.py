@@ -0,0 +1,453 @@
+#!/usr/bin/python3
+""" Moteur d'évolution HashLife sur plan infini
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Algorithme HashLife de Bill Gosper (https://conwaylife.com/wiki/HashLife) :
+    - l'univers est un arbre quaternaire (quadtree) dont les noeuds identiques ne sont stockés
+      qu'une fois
+    - le résultat de l'évolution de chaque noeud est mémorisé, ce qui permet d'avancer les grandes
+      structures répétitives (canons, puffeurs, vaisseaux...) de 2^k générations d'un seul coup
+- Les noeuds sont des entiers indexant les tables de l'univers, le noeud 0 étant la case morte et
+  le noeud 1 la case vivante. L'univers est un dictionnaire contenant ces tables
+- La racine est centrée sur l'origine : un noeud de niveau k couvre les coordonnées de -2^(k-1) à
+  2^(k-1) - 1 en x comme en y, les y croissant vers le bas comme sur le plateau
+- Le nombre de noeuds est borné : au-delà, les noeuds inaccessibles depuis la racine sont supprimés
+  et les résultats mémorisés oubliés
+- Un noeud sans cellule vivante est considéré comme stable, si bien que les règles avec naissance à
+  0 voisine (B0) ne sont pas gérées
+"""
+
+import sys
+
+from configuration import TAILLE_CACHE
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE
+
+MORTE = 0
+VIVANTE = 1
+NIVEAU_MINIMUM = 3
+
+########################################################################
+def creer_univers(regle, taille_cache=TAILLE_CACHE):
+    """ Retourne un univers vide pour la règle compilée indiquée """
+    univers = {
+        # Tables des noeuds
+        "niveau": [0, 0],
+        "population": [0, 1],
+        "nw": [MORTE, MORTE],
+        "ne": [MORTE, MORTE],
+        "sw": [MORTE, MORTE],
+        "se": [MORTE, MORTE],
+        "index": {},
+
+        # Noeuds vides de chaque niveau
+        "vides": [MORTE],
+
+        # Résultats mémorisés (noeud, pas) => noeud
+        "resultats": {},
+
+        "voisinage": regle["voisinage"],
+        "taille_cache": taille_cache,
+        "racine": MORTE,
+        "generation": 0,
+
+        # Statistiques
+        "succes": 0,
+        "echecs": 0,
+        "collectes": 0
+    }
+    univers["racine"] = vide(univers, NIVEAU_MINIMUM)
+    return univers
+
+########################################################################
+def noeud(univers, nw, ne, sw, se):
+    """ Retourne le noeud unique ayant les 4 quadrants indiqués """
+    cle = (nw, ne, sw, se)
+    resultat = univers["index"].get(cle)
+    if resultat is None:
+        resultat = len(univers["niveau"])
+        univers["niveau"].append(univers["niveau"][nw] + 1)
+        univers["population"].append(
+            univers["population"][nw] + univers["population"][ne]
+            + univers["population"][sw] + univers["population"][se]
+        )
+        univers["nw"].append(nw)
+        univers["ne"].append(ne)
+        univers["sw"].append(sw)
+        univers["se"].append(se)
+        univers["index"][cle] = resultat
+    return resultat
+
+########################################################################
+def vide(univers, niveau):
+    """ Retourne le noeud vide du niveau indiqué """
+    vides = univers["vides"]
+    while len(vides) <= niveau:
+        precedent = vides[-1]
+        vides.append(noeud(univers, precedent, precedent, precedent, precedent))
+    return vides[niveau]
+
+########################################################################
+def etendre(univers):
+    """ Double la taille de la racine en l'entourant de cases mortes, sans la décentrer """
+    racine = univers["racine"]
+    bord = vide(univers, univers["niveau"][racine] - 1)
+    univers["racine"] = noeud(
+        univers,
+        noeud(univers, bord, bord, bord, univers["nw"][racine]),
+        noeud(univers, bord, bord, univers["ne"][racine], bord),
+        noeud(univers, bord, univers["sw"][racine], bord, bord),
+        noeud(univers, univers["se"][racine], bord, bord, bord)
+    )
+
+########################################################################
+def est_centre(univers):
+    """ Retourne un booléen indiquant si toutes les cellules sont dans la moitié centrale de la racine """
+    racine = univers["racine"]
+    population = univers["population"]
+    nw = univers["nw"][racine]
+    ne = univers["ne"][racine]
+    sw = univers["sw"][racine]
+    se = univers["se"][racine]
+    return population[nw] == population[univers["se"][nw]] \
+       and population[ne] == population[univers["sw"][ne]] \
+       and population[sw] == population[univers["ne"][sw]] \
+       and population[se] == population[univers["nw"][se]]
+
+########################################################################
+def poser_cellule(univers, x, y, valeur=VIVANTE):
+    """ Donne la valeur indiquée à la case de coordonnées x, y """
+    while True:
+        moitie = 1 << (univers["niveau"][univers["racine"]] - 1)
+        if -moitie <= x < moitie and -moitie <= y < moitie:
+            break
+        etendre(univers)
+
+    def poser(courant, x, y):
+        niveau = univers["niveau"][courant]
+        if niveau == 0:
+            return valeur
+        moitie = 1 << (niveau - 1)
+        nw = univers["nw"][courant]
+        ne = univers["ne"][courant]
+        sw = univers["sw"][courant]
+        se = univers["se"][courant]
+        if y < moitie:
+            if x < moitie:
+                nw = poser(nw, x, y)
+            else:
+                ne = poser(ne, x - moitie, y)
+        else:
+            if x < moitie:
+                sw = poser(sw, x, y - moitie)
+            else:
+                se = poser(se, x - moitie, y - moitie)
+        return noeud(univers, nw, ne, sw, se)
+
+    univers["racine"] = poser(univers["racine"], x + moitie, y + moitie)
+
+########################################################################
+def poser_structure(univers, structure, x, y):
+    """ Ajoute les cellules vivantes d'une structure (liste de lignes) avec son coin supérieur gauche en x, y """
+    for ligne in range(len(structure)):
+        for colonne in range(len(structure[ligne])):
+            if structure[ligne][colonne] != CELLULE_MORTE:
+                poser_cellule(univers, x + colonne, y + ligne)
+
+########################################################################
+def cellules(univers, x_1, y_1, x_2, y_2):
+    """ Retourne l'ensemble des coordonnées des cellules vivantes dans le rectangle indiqué """
+    resultat = set()
+
+    def parcourir(courant, x, y):
+        if univers["population"][courant] == 0:
+            return
+        taille = 1 << univers["niveau"][courant]
+        if x > x_2 or y > y_2 or x + taille <= x_1 or y + taille <= y_1:
+            return
+        if taille == 1:
+            resultat.add((x, y))
+            return
+        moitie = taille // 2
+        parcourir(univers["nw"][courant], x, y)
+        parcourir(univers["ne"][courant], x + moitie, y)
+        parcourir(univers["sw"][courant], x, y + moitie)
+        parcourir(univers["se"][courant], x + moitie, y + moitie)
+
+    moitie = 1 << (univers["niveau"][univers["racine"]] - 1)
+    parcourir(univers["racine"], -moitie, -moitie)
+    return resultat
+
+########################################################################
+def evoluer_niveau_2(univers, courant):
+    """ Retourne le centre 2x2 d'un noeud 4x4 après une génération """
+    nw = univers["nw"]
+    ne = univers["ne"]
+    sw = univers["sw"]
+    se = univers["se"]
+    quadrants = (nw[courant], ne[courant], sw[courant], se[courant])
+    cases = [[MORTE] * 4 for i in range(4)]
+    for rang, quadrant in enumerate(quadrants):
+        y = (rang // 2) * 2
+        x = (rang % 2) * 2
+        cases[y][x] = nw[quadrant]
+        cases[y][x + 1] = ne[quadrant]
+        cases[y + 1][x] = sw[quadrant]
+        cases[y + 1][x + 1] = se[quadrant]
+
+    # Consultation de la table de transition de la règle pour chaque configuration du voisinage
+    centre = []
+    for y in (1, 2):
+        for x in (1, 2):
+            index = 0
+            for dy in range(3):
+                for dx in range(3):
+                    index |= cases[y + dy - 1][x + dx - 1] << (3 * dy + dx)
+            centre.append(univers["voisinage"][index])
+    return noeud(univers, centre[0], centre[1], centre[2], centre[3])
+
+########################################################################
+def successeur(univers, courant, pas):
+    """ Retourne le noeud central de niveau k-1 d'un noeud de niveau k avancé de 2^pas générations
+    (pas étant borné à k-2) """
+    niveau = univers["niveau"][courant]
+    if univers["population"][courant] == 0:
+        return vide(univers, niveau - 1)
+    pas = min(pas, niveau - 2)
+    cle = (courant, pas)
+    resultat = univers["resultats"].get(cle)
+    if resultat is not None:
+        univers["succes"] += 1
+        return resultat
+    univers["echecs"] += 1
+
+    if niveau == 2:
+        resultat = evoluer_niveau_2(univers, courant)
+    else:
+        nw = univers["nw"]
+        ne = univers["ne"]
+        sw = univers["sw"]
+        se = univers["se"]
+        a = nw[courant]
+        b = ne[courant]
+        c = sw[courant]
+        d = se[courant]
+
+        # 9 sous-noeuds de niveau k-1 se chevauchant, avancés et réduits à leur centre
+        c1 = successeur(univers, a, pas)
+        c2 = successeur(univers, noeud(univers, ne[a], nw[b], se[a], sw[b]), pas)
+        c3 = successeur(univers, b, pas)
+        c4 = successeur(univers, noeud(univers, sw[a], se[a], nw[c], ne[c]), pas)
+        c5 = successeur(univers, noeud(univers, se[a], sw[b], ne[c], nw[d]), pas)
+        c6 = successeur(univers, noeud(univers, sw[b], se[b], nw[d], ne[d]), pas)
+        c7 = successeur(univers, c, pas)
+        c8 = successeur(univers, noeud(univers, ne[c], nw[d], se[c], sw[d]), pas)
+        c9 = successeur(univers, d, pas)
+
+        if pas < niveau - 2:
+            # Les générations demandées sont déjà calculées, il n'y a plus qu'à recentrer
+            resultat = noeud(
+                univers,
+                noeud(univers, se[c1], sw[c2], ne[c4], nw[c5]),
+                noeud(univers, se[c2], sw[c3], ne[c5], nw[c6]),
+                noeud(univers, se[c4], sw[c5], ne[c7], nw[c8]),
+                noeud(univers, se[c5], sw[c6], ne[c8], nw[c9])
+            )
+        else:
+            # Seconde moitié des générations demandées
+            resultat = noeud(
+                univers,
+                successeur(univers, noeud(univers, c1, c2, c4, c5), pas),
+                successeur(univers, noeud(univers, c2, c3, c5, c6), pas),
+                successeur(univers, noeud(univers, c4, c5, c7, c8), pas),
+                successeur(univers, noeud(univers, c5, c6, c8, c9), pas)
+            )
+
+    univers["resultats"][cle] = resultat
+    return resultat
+
+########################################################################
+def collecter(univers):
+    """ Supprime les noeuds inaccessibles depuis la racine et oublie les résultats mémorisés """
+    anciens = {
+        "niveau": univers["niveau"],
+        "population": univers["population"],
+        "nw": univers["nw"],
+        "ne": univers["ne"],
+        "sw": univers["sw"],
+        "se": univers["se"]
+    }
+    for table in anciens:
+        univers[table] = univers[table][:2]
+    univers["index"] = {}
+    univers["resultats"] = {}
+    univers["vides"] = [MORTE]
+    univers["collectes"] += 1
+
+    correspondances = {MORTE: MORTE, VIVANTE: VIVANTE}
+
+    def copier(ancien):
+        nouveau = correspondances.get(ancien)
+        if nouveau is None:
+            nouveau = noeud(
+                univers,
+                copier(anciens["nw"][ancien]),
+                copier(anciens["ne"][ancien]),
+                copier(anciens["sw"][ancien]),
+                copier(anciens["se"][ancien])
+            )
+            correspondances[ancien] = nouveau
+        return nouveau
+
+    univers["racine"] = copier(univers["racine"])
+
+########################################################################
+def limiter_cache(univers):
+    """ Supprime les noeuds inaccessibles si les tables dépassent la taille du cache (les numéros
+    des noeuds changeant alors, à appeler avant d'en noter un) """
+    if len(univers["niveau"]) > univers["taille_cache"] \
+    or len(univers["resultats"]) > univers["taille_cache"]:
+        collecter(univers)
+
+########################################################################
+def avancer(univers, pas):
+    """ Fait évoluer l'univers de 2^pas générations """
+    limiter_cache(univers)
+
+    # Agrandir la racine jusqu'à ce que les cellules ne puissent pas en sortir pendant l'évolution
+    while univers["niveau"][univers["racine"]] < max(NIVEAU_MINIMUM, pas + 2) or not est_centre(univers):
+        etendre(univers)
+    etendre(univers)
+
+    univers["racine"] = successeur(univers, univers["racine"], pas)
+    univers["generation"] += 1 << pas
+
+########################################################################
+def comparer(univers, ancienne_racine, nouvelle_racine):
+    """ Retourne les nombres de naissances et de décès entre deux racines """
+    # Mise au même niveau des deux racines, toutes deux centrées sur l'origine
+    racines = [ancienne_racine, nouvelle_racine]
+    for i in range(2):
+        autre = racines[1 - i]
+        while univers["niveau"][racines[i]] < univers["niveau"][autre]:
+            bord = vide(univers, univers["niveau"][racines[i]] - 1)
+            racine = racines[i]
+            racines[i] = noeud(
+                univers,
+                noeud(univers, bord, bord, bord, univers["nw"][racine]),
+                noeud(univers, bord, bord, univers["ne"][racine], bord),
+                noeud(univers, bord, univers["sw"][racine], bord, bord),
+                noeud(univers, univers["se"][racine], bord, bord, bord)
+            )
+
+    differences = {}
+
+    def differencier(avant, apres):
+        if avant == apres:
+            return (0, 0)
+        if univers["population"][avant] == 0:
+            return (univers["population"][apres], 0)
+        if univers["population"][apres] == 0:
+            return (0, univers["population"][avant])
+        if univers["niveau"][avant] == 0:
+            return (1, 0) if apres == VIVANTE else (0, 1)
+        resultat = differences.get((avant, apres))
+        if resultat is None:
+            naissances = 0
+            deces = 0
+            for quadrant in ("nw", "ne", "sw", "se"):
+                nes, morts = differencier(univers[quadrant][avant], univers[quadrant][apres])
+                naissances += nes
+                deces += morts
+            resultat = (naissances, deces)
+            differences[(avant, apres)] = resultat
+        return resultat
+
+    return differencier(racines[0], racines[1])
+
+########################################################################
+def statistiques(univers):
+    """ Retourne les statistiques d'utilisation du cache de l'univers """
+    consultations = univers["succes"] + univers["echecs"]
+    memoire = sys.getsizeof(univers["index"]) + sys.getsizeof(univers["resultats"])
+    for table in ("niveau", "population", "nw", "ne", "sw", "se"):
+        memoire += sys.getsizeof(univers[table])
+    # Clés des dictionnaires (tuples) et entiers au-delà des petits entiers partagés par Python
+    memoire += len(univers["index"]) * (sys.getsizeof((0, 0, 0, 0)) + 4 * sys.getsizeof(1 << 30))
+    memoire += len(univers["resultats"]) * (sys.getsizeof((0, 0)) + sys.getsizeof(1 << 30))
+    return {
+        "noeuds": len(univers["niveau"]),
+        "resultats": len(univers["resultats"]),
+        "succes": univers["succes"],
+        "echecs": univers["echecs"],
+        "taux_succes": univers["succes"] / consultations if consultations else 0.0,
+        "collectes": univers["collectes"],
+        "memoire": memoire
+    }
+
+########################################################################
+def projeter(univers, plateau, origine, vieillir=False, modifications=None):
+    """ Reporte sur le plateau la fenêtre de l'univers commençant en origine et retourne la zone
+    utile du plateau. L'âge des cellules restées visibles est incrémenté si demandé, sinon toutes
+    les cellules visibles sont considérées comme âgées. Les cases dont l'affichage change sont
+    ajoutées aux modifications si elles sont fournies """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    x_0, y_0 = origine
+
+    anciennes_visibles = univers.get("visibles")
+    if anciennes_visibles is None:
+        anciennes_visibles = set()
+        for ligne in range(nb_lignes):
+            for colonne in range(nb_colonnes):
+                if plateau[ligne][colonne] != CELLULE_MORTE:
+                    anciennes_visibles.add((colonne, ligne))
+    visibles = set()
+    for x, y in cellules(univers, x_0, y_0, x_0 + nb_colonnes - 1, y_0 + nb_lignes - 1):
+        visibles.add((x - x_0, y - y_0))
+    univers["visibles"] = visibles
+
+    for colonne, ligne in anciennes_visibles - visibles:
+        plateau[ligne][colonne] = CELLULE_MORTE
+        if modifications is not None:
+            modifications.append((colonne, ligne))
+    zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+    for colonne, ligne in visibles:
+        if modifications is not None and plateau[ligne][colonne] in (CELLULE_MORTE, CELLULE_NAISSANTE):
+            modifications.append((colonne, ligne))
+        if not vieillir:
+            plateau[ligne][colonne] = CELLULE_NAISSANTE + 1
+        elif plateau[ligne][colonne] == CELLULE_MORTE:
+            plateau[ligne][colonne] = CELLULE_NAISSANTE
+        else:
+            plateau[ligne][colonne] += 1
+        if zone_utile["X_1"] == -1:
+            zone_utile = {"X_1": colonne, "Y_1": ligne, "X_2": colonne, "Y_2": ligne}
+        else:
+            zone_utile["X_1"] = min(zone_utile["X_1"], colonne)
+            zone_utile["Y_1"] = min(zone_utile["Y_1"], ligne)
+            zone_utile["X_2"] = max(zone_utile["X_2"], colonne)
+            zone_utile["Y_2"] = max(zone_utile["Y_2"], ligne)
+    return zone_utile
+
+########################################################################
+def evoluer(univers, pas, plateau, origine=(0, 0)):
+    """ Fait évoluer l'univers de 2^pas générations et reporte sur le plateau (âges compris) les
+    cellules visibles """
+    # La collecte éventuelle se fait avant de noter l'ancienne racine, qu'elle renumérote
+    limiter_cache(univers)
+    ancienne_racine = univers["racine"]
+    avancer(univers, pas)
+    naissances, deces = comparer(univers, ancienne_racine, univers["racine"])
+    population = univers["population"][univers["racine"]]
+
+    # Report des cellules visibles sur le plateau, l'âge étant compté en évolutions
+    modifications = []
+    zone_utile = projeter(univers, plateau, origine, vieillir=True, modifications=modifications)
+    return {
+        "statut": {"population": population, "naissances": naissances, "survie": population - naissances, "deces": deces},
+        "zone_utile": zone_utile,
+        "modifications": modifications
+        }
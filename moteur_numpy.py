@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+""" Moteur d'évolution vectorisé avec NumPy
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Même plateau, mêmes âges de cellules, même zone utile et mêmes statistiques que le moteur de
+  référence (moteur_python), mais le plateau est un tableau NumPy et chaque génération est
+  calculée par opérations sur tableaux au lieu de boucles Python :
+    - comptage des voisines par somme des 8 décalages de la zone utile
+    - application de la règle par consultation d'une table précalculée
+    - pour les règles non totalistiques, les 9 décalages forment l'index de la configuration du
+      voisinage dans la table de transition de la règle
+"""
+
+import time
+
+# l'import suivant nécessite l'installation d'un composant supplémentaire
+# pip install numpy
+import numpy
+
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE, chronometrer, elargir_zone
+
+########################################################################
+def creer_plateau(nb_lignes, nb_colonnes):
+    """ Retourne une grille de jeu vide """
+    return numpy.zeros((nb_lignes, nb_colonnes), dtype=numpy.int32)
+
+########################################################################
+def compiler_regle(regle):
+    """ Retourne les tables de transition de la règle compilée indiquée sous forme de tableaux
+    NumPy de booléens """
+    return {
+        "table": None if regle["table"] is None else numpy.array(regle["table"], dtype=bool),
+        "voisinage": numpy.array(regle["voisinage"], dtype=bool)
+    }
+
+########################################################################
+def detourer(plateau, x_1, y_1, x_2, y_2):
+    """ Retourne la zone utile de la grille de jeu """
+    nb_lignes, nb_colonnes = plateau.shape
+    zone = plateau[y_1:y_2 + 1, x_1:x_2 + 1] != CELLULE_MORTE
+    lignes = numpy.flatnonzero(zone.any(axis=1))
+    if len(lignes) == 0:
+        # Rien à sauvegarder !
+        return {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+    colonnes = numpy.flatnonzero(zone.any(axis=0))
+    return {
+        "X_1": x_1 + int(colonnes[0]),
+        "Y_1": y_1 + int(lignes[0]),
+        "X_2": x_1 + int(colonnes[-1]),
+        "Y_2": y_1 + int(lignes[-1])
+        }
+
+########################################################################
+def compter_cellules(plateau):
+    """ Retourne le nombre de cellules vivantes de la grille de jeu """
+    return int(numpy.count_nonzero(plateau != CELLULE_MORTE))
+
+########################################################################
+def vider(plateau):
+    """ Retire toutes les cellules de la grille de jeu """
+    plateau.fill(CELLULE_MORTE)
+
+########################################################################
+def evoluer(plateau, zone_utile, table_regle, chronometre=None):
+    """ Applique la règle d'évolution compilée à la grille de jeu """
+    nb_lignes, nb_colonnes = plateau.shape
+    debut = time.perf_counter_ns()
+
+    # Les cellules vivantes étant toutes dans la zone utile, la zone élargie d'une
+    # colonne/ligne bordée de cellules mortes suffit au comptage des voisines
+    zone = elargir_zone(zone_utile, nb_lignes, nb_colonnes)
+    cases = plateau[zone["Y_1"]:zone["Y_2"] + 1, zone["X_1"]:zone["X_2"] + 1]
+    vivantes = cases != CELLULE_MORTE
+    bordee = numpy.zeros((cases.shape[0] + 2, cases.shape[1] + 2), dtype=numpy.uint8)
+    bordee[1:-1, 1:-1] = vivantes
+    if table_regle["table"] is not None:
+        voisines = bordee[:-2, :-2] + bordee[:-2, 1:-1] + bordee[:-2, 2:] \
+                 + bordee[1:-1, :-2] + bordee[1:-1, 2:] \
+                 + bordee[2:, :-2] + bordee[2:, 1:-1] + bordee[2:, 2:]
+        comptage = time.perf_counter_ns()
+
+        # Implémentation de la règle du jeu par consultation de la table
+        naissantes = ~vivantes & table_regle["table"][0][voisines]
+        survivantes = vivantes & table_regle["table"][1][voisines]
+    else:
+        hauteur, largeur = vivantes.shape
+        index = numpy.zeros(vivantes.shape, dtype=numpy.uint16)
+        for dy in range(3):
+            for dx in range(3):
+                index |= bordee[dy:dy + hauteur, dx:dx + largeur].astype(numpy.uint16) << (3 * dy + dx)
+        comptage = time.perf_counter_ns()
+
+        # Implémentation de la règle du jeu par consultation de la table des configurations
+        nouvelles = table_regle["voisinage"][index]
+        naissantes = ~vivantes & nouvelles
+        survivantes = vivantes & nouvelles
+    mourantes = vivantes & ~survivantes
+    lignes, colonnes = numpy.nonzero(naissantes | mourantes | (survivantes & (cases == CELLULE_NAISSANTE)))
+    cases[naissantes] = CELLULE_NAISSANTE
+    cases[survivantes] += 1
+    cases[mourantes] = CELLULE_MORTE
+
+    naissances = int(numpy.count_nonzero(naissantes))
+    survie = int(numpy.count_nonzero(survivantes))
+    deces = int(numpy.count_nonzero(mourantes))
+    application = time.perf_counter_ns()
+
+    # Redéfinition de la zone utile
+    zone_utile = detourer(plateau, zone["X_1"], zone["Y_1"], zone["X_2"], zone["Y_2"])
+    if chronometre is not None:
+        chronometrer(chronometre, debut, comptage, application)
+    return {
+        "statut": {"population": naissances + survie, "naissances": naissances, "survie": survie, "deces": deces},
+        "zone_utile": zone_utile,
+        "modifications": list(zip((colonnes + zone["X_1"]).tolist(), (lignes + zone["Y_1"]).tolist()))
+        }
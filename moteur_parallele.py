@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+""" Moteur d'évolution multi-processus par bandes horizontales
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- La zone utile du plateau du moteur de référence est découpée en autant de bandes horizontales
+  que de processus, chaque bande étant envoyée à un processus avec une ligne de bordure (halo)
+  au-dessus et au-dessous
+- Chaque processus retourne les naissances, survies et décès de sa bande, qui sont ensuite
+  reportés sur le plateau et cumulés dans les statistiques
+- Pour les petites zones utiles, où l'envoi des bandes coûterait plus que le calcul, on revient au
+  moteur de référence
+- Sous Windows, les processus réimportent le programme principal, qui doit donc être protégé par
+  un test if __name__ == "__main__"
+"""
+
+import concurrent.futures
+import os
+
+from configuration import SEUIL_PARALLELE
+import moteur_python
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE, calculer_zone, elargir_zone
+
+########################################################################
+def creer_groupe(nb_processus=0):
+    """ Retourne un groupe de processus de calcul (autant que de processeurs si 0) """
+    if nb_processus <= 0:
+        nb_processus = os.cpu_count() or 1
+    return {
+        "executeur": concurrent.futures.ProcessPoolExecutor(max_workers=nb_processus),
+        "nb_processus": nb_processus
+    }
+
+########################################################################
+def terminer_groupe(groupe):
+    """ Arrête les processus d'un groupe """
+    groupe["executeur"].shutdown()
+
+########################################################################
+def calculer_bande(bande, zone, decalage, regle):
+    """ Retourne les naissances, survies et décès d'une bande (exécuté dans un processus de calcul) """
+    resultats = []
+    for cellules in calculer_zone(bande, zone, regle):
+        resultats.append([(ligne + decalage[0], colonne + decalage[1]) for ligne, colonne in cellules])
+    return resultats
+
+########################################################################
+def evoluer(plateau, zone_utile, regle, groupe, seuil=SEUIL_PARALLELE, chronometre=None):
+    """ Applique la règle d'évolution compilée indiquée à la grille de jeu en répartissant le calcul des
+    bandes entre les processus du groupe (les phases ne sont mesurées dans le chronomètre qu'en
+    revenant au moteur de référence) """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+
+    # Implémentation de la règle du jeu indiquée dans la zone utile
+    # avec une marge supplémentaire d'une colonne/ligne
+    zone = elargir_zone(zone_utile, nb_lignes, nb_colonnes)
+    hauteur = zone["Y_2"] - zone["Y_1"] + 1
+    largeur = zone["X_2"] - zone["X_1"] + 1
+    if groupe is None or groupe["nb_processus"] < 2 or hauteur < 2 or hauteur * largeur < seuil:
+        return moteur_python.evoluer(plateau, zone_utile, regle, chronometre)
+
+    # Les cases hors de la zone élargie étant mortes, il suffit d'envoyer les colonnes de la zone
+    nb_bandes = min(groupe["nb_processus"], hauteur)
+    taches = []
+    for rang in range(nb_bandes):
+        debut = zone["Y_1"] + (hauteur * rang) // nb_bandes
+        fin = zone["Y_1"] + (hauteur * (rang + 1)) // nb_bandes - 1
+        haut = max(debut - 1, 0)
+        bas = min(fin + 1, nb_lignes - 1)
+        bande = [ligne[zone["X_1"]:zone["X_2"] + 1] for ligne in plateau[haut:bas + 1]]
+        zone_bande = {"X_1": 0, "Y_1": debut - haut, "X_2": largeur - 1, "Y_2": fin - haut}
+        taches.append(
+            groupe["executeur"].submit(calculer_bande, bande, zone_bande, (haut, zone["X_1"]), regle)
+        )
+
+    # Report des résultats sur le plateau et redéfinition de la zone utile
+    naissances = 0
+    survie = 0
+    deces = 0
+    nouvelle_zone = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+    modifications = []
+    for tache in taches:
+        naissantes, survivantes, mourantes = tache.result()
+        naissances += len(naissantes)
+        survie += len(survivantes)
+        deces += len(mourantes)
+        for ligne, colonne in mourantes:
+            plateau[ligne][colonne] = CELLULE_MORTE
+            modifications.append((colonne, ligne))
+        for valeur, cellules in ((CELLULE_NAISSANTE, naissantes), (None, survivantes)):
+            for ligne, colonne in cellules:
+                if valeur is None:
+                    if plateau[ligne][colonne] == CELLULE_NAISSANTE:
+                        modifications.append((colonne, ligne))
+                    plateau[ligne][colonne] += 1
+                else:
+                    plateau[ligne][colonne] = valeur
+                    modifications.append((colonne, ligne))
+                if nouvelle_zone["X_1"] == -1:
+                    nouvelle_zone = {"X_1": colonne, "Y_1": ligne, "X_2": colonne, "Y_2": ligne}
+                else:
+                    nouvelle_zone["X_1"] = min(nouvelle_zone["X_1"], colonne)
+                    nouvelle_zone["Y_1"] = min(nouvelle_zone["Y_1"], ligne)
+                    nouvelle_zone["X_2"] = max(nouvelle_zone["X_2"], colonne)
+                    nouvelle_zone["Y_2"] = max(nouvelle_zone["Y_2"], ligne)
+
+    return {
+        "statut": {"population": naissances + survie, "naissances": naissances, "survie": survie, "deces": deces},
+        "zone_utile": nouvelle_zone,
+        "modifications": modifications
+        }
@@ -0,0 +1,335 @@
+#!/usr/bin/python3
+""" Moteur d'évolution de référence en Python pur
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Le plateau est une liste de lignes, chaque case contenant CELLULE_MORTE ou l'âge de la cellule
+- La zone utile est un dictionnaire {"X_1", "Y_1", "X_2", "Y_2"} encadrant les cellules vivantes
+- Les modifications sont la liste des coordonnées (colonne, ligne) des cases dont l'affichage change
+  d'une génération à l'autre : naissances, décès et cellules atteignant leur 2ème génération
+- Si un chronomètre (dictionnaire) est fourni à evoluer(), les durées en nanosecondes du comptage
+  des voisines, de l'application de la règle et du détourage y sont notées
+"""
+
+import time
+
+# Valeurs des cases
+CELLULE_MORTE = 0
+CELLULE_NAISSANTE = 1
+# et n = âge de la cellule
+
+########################################################################
+def creer_plateau(nb_lignes, nb_colonnes):
+    """ Retourne une grille de jeu vide """
+    plateau = []
+    for i in range(nb_lignes):
+        ligne = []
+        for j in range(nb_colonnes):
+            ligne.append(CELLULE_MORTE)
+        plateau.append(ligne.copy())
+    return plateau
+
+########################################################################
+def ligne_vivante(plateau, ligne, x_1, x_2):
+    """ Retourne un booléen indiquant si la ligne spécifiée contient au moins une cellule vivante """
+    # CELLULE_MORTE étant nulle, any() parcourt la tranche de ligne sans boucle Python
+    return any(plateau[ligne][x_1:x_2 + 1])
+
+########################################################################
+def colonne_vivante(plateau, colonne, y_1, y_2):
+    """ Retourne un booléen indiquant si la colonne spécifiée contient au moins une cellule vivante """
+    return any(plateau[ligne][colonne] for ligne in range(y_1, y_2 + 1))
+
+########################################################################
+def premiere_vivante(cases):
+    """ Retourne l'indice de la première cellule vivante d'une liste de cases qui en contient """
+    # Les cases qui la précèdent étant nulles, c'est la première occurrence de sa valeur
+    return cases.index(next(filter(None, cases)))
+
+########################################################################
+def detourer(plateau, x_1, y_1, x_2, y_2):
+    """ Retourne la zone utile de la grille de jeu """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+    for ligne in range(y_1, y_2 + 1):
+        if ligne_vivante(plateau, ligne, x_1, x_2):
+            zone_utile["Y_1"] = ligne
+            break
+    if zone_utile["Y_1"] == -1:
+        # Rien à sauvegarder !
+        return zone_utile
+    for ligne in range(y_2, y_1 - 1, -1):
+        if ligne_vivante(plateau, ligne, x_1, x_2):
+            zone_utile["Y_2"] = ligne
+            break
+
+    # Dans chaque ligne, seules les cases à l'extérieur des colonnes extrêmes déjà trouvées sont
+    # examinées, par tranches
+    gauche = x_2 + 1
+    droite = x_1 - 1
+    for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1):
+        cases = plateau[ligne]
+        if gauche > x_1 and any(cases[x_1:gauche]):
+            gauche = x_1 + premiere_vivante(cases[x_1:gauche])
+        if droite < x_2:
+            tranche = cases[droite + 1:x_2 + 1]
+            if any(tranche):
+                droite = x_2 - premiere_vivante(tranche[::-1])
+    zone_utile["X_1"] = gauche
+    zone_utile["X_2"] = droite
+    return zone_utile
+
+########################################################################
+def compter_cellules(plateau):
+    """ Retourne le nombre de cellules vivantes de la grille de jeu """
+    return sum(len(cases) - cases.count(CELLULE_MORTE) for cases in plateau)
+
+########################################################################
+def vider(plateau):
+    """ Retire toutes les cellules de la grille de jeu """
+    vide = [CELLULE_MORTE] * len(plateau[0])
+    for cases in plateau:
+        cases[:] = vide
+
+########################################################################
+def coller_structure(plateau, structure, colonne_plateau, ligne_plateau):
+    """ Recopie une structure dans la grille de jeu (liste de lignes ou tableau NumPy) à la
+    position indiquée, tronquée aux bords de la grille """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    # Découpage calculé une fois, chaque ligne étant ensuite recopiée par tranche
+    ligne_debut = max(-ligne_plateau, 0)
+    ligne_fin = min(len(structure), nb_lignes - ligne_plateau)
+    colonne_debut = max(-colonne_plateau, 0)
+    for ligne in range(ligne_debut, ligne_fin):
+        cases = structure[ligne]
+        colonne_fin = min(len(cases), nb_colonnes - colonne_plateau)
+        if colonne_debut < colonne_fin:
+            plateau[ligne + ligne_plateau][colonne_debut + colonne_plateau:colonne_fin + colonne_plateau] = cases[colonne_debut:colonne_fin]
+
+########################################################################
+def elargir_zone(zone_utile, nb_lignes, nb_colonnes):
+    """ Retourne la zone utile augmentée d'une marge d'une colonne/ligne, bornée à la grille de jeu """
+    ligne_depart = zone_utile["Y_1"] - 1
+    if ligne_depart < 0:
+        ligne_depart = 0
+    ligne_arrivee = zone_utile["Y_2"] + 1
+    if ligne_arrivee >= nb_lignes:
+        ligne_arrivee = nb_lignes - 1
+    colonne_depart = zone_utile["X_1"] - 1
+    if colonne_depart < 0:
+        colonne_depart = 0
+    colonne_arrivee = zone_utile["X_2"] + 1
+    if colonne_arrivee >= nb_colonnes:
+        colonne_arrivee = nb_colonnes - 1
+    return {"X_1": colonne_depart, "Y_1": ligne_depart, "X_2": colonne_arrivee, "Y_2": ligne_arrivee}
+
+########################################################################
+def chronometrer(chronometre, debut, comptage, application):
+    """ Note dans le chronomètre les durées en nanosecondes du comptage des voisines, de
+    l'application de la règle et du détourage, qui vient de se terminer """
+    chronometre["voisines"] = comptage - debut
+    chronometre["regle"] = application - comptage
+    chronometre["detourage"] = time.perf_counter_ns() - application
+
+########################################################################
+def calculer_zone(plateau, zone, regle):
+    """ Retourne les listes des naissances, survies et décès d'une zone de la grille de jeu, sous
+    forme de coordonnées (ligne, colonne), sans modifier le plateau """
+    if regle["table"] is None:
+        # Les règles non totalistiques ne se contentent pas du nombre de voisines
+        return calculer_zone_par_voisinage(plateau, zone, regle)
+    table_naissance, table_survie = regle["table"]
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    naissantes = []
+    survivantes = []
+    mourantes = []
+
+    x_1 = zone["X_1"]
+    x_2 = zone["X_2"]
+    ligne_vide = [CELLULE_MORTE] * nb_colonnes
+    for ligne in range(zone["Y_1"], zone["Y_2"] + 1):
+        haut = plateau[ligne - 1] if ligne > 0 else ligne_vide
+        milieu = plateau[ligne]
+        bas = plateau[ligne + 1] if ligne < nb_lignes - 1 else ligne_vide
+
+        # Sommes verticales des cellules vivantes de la zone et des colonnes qui la bordent
+        sommes = []
+        for colonne in range(x_1 - 1, x_2 + 2):
+            if 0 <= colonne < nb_colonnes:
+                sommes.append((haut[colonne] != CELLULE_MORTE) + (milieu[colonne] != CELLULE_MORTE) + (bas[colonne] != CELLULE_MORTE))
+            else:
+                sommes.append(0)
+
+        for colonne in range(x_1, x_2 + 1):
+            rang = colonne - x_1 + 1
+            if milieu[colonne] == CELLULE_MORTE:
+                if table_naissance[sommes[rang - 1] + sommes[rang] + sommes[rang + 1]]:
+                    naissantes.append((ligne, colonne))
+            else:
+                if table_survie[sommes[rang - 1] + sommes[rang] + sommes[rang + 1] - 1]:
+                    survivantes.append((ligne, colonne))
+                else:
+                    mourantes.append((ligne, colonne))
+    return naissantes, survivantes, mourantes
+
+########################################################################
+def calculer_zone_par_voisinage(plateau, zone, regle):
+    """ Retourne les listes des naissances, survies et décès d'une zone de la grille de jeu en
+    consultant la table de transition des configurations du voisinage """
+    voisinage = regle["voisinage"]
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    naissantes = []
+    survivantes = []
+    mourantes = []
+
+    x_1 = zone["X_1"]
+    x_2 = zone["X_2"]
+    ligne_vide = [CELLULE_MORTE] * nb_colonnes
+    for ligne in range(zone["Y_1"], zone["Y_2"] + 1):
+        haut = plateau[ligne - 1] if ligne > 0 else ligne_vide
+        milieu = plateau[ligne]
+        bas = plateau[ligne + 1] if ligne < nb_lignes - 1 else ligne_vide
+
+        # Colonnes verticales de 3 cases de la zone et des colonnes qui la bordent, codées sur les
+        # bits n° 0 (haut), 3 (milieu) et 6 (bas) de l'index de la table
+        colonnes = []
+        for colonne in range(x_1 - 1, x_2 + 2):
+            if 0 <= colonne < nb_colonnes:
+                colonnes.append((haut[colonne] != CELLULE_MORTE) | (milieu[colonne] != CELLULE_MORTE) << 3 | (bas[colonne] != CELLULE_MORTE) << 6)
+            else:
+                colonnes.append(0)
+
+        for colonne in range(x_1, x_2 + 1):
+            rang = colonne - x_1 + 1
+            vivante = voisinage[colonnes[rang - 1] | colonnes[rang] << 1 | colonnes[rang + 1] << 2]
+            if milieu[colonne] == CELLULE_MORTE:
+                if vivante:
+                    naissantes.append((ligne, colonne))
+            else:
+                if vivante:
+                    survivantes.append((ligne, colonne))
+                else:
+                    mourantes.append((ligne, colonne))
+    return naissantes, survivantes, mourantes
+
+########################################################################
+def evoluer(plateau, zone_utile, regle, chronometre=None):
+    """ Applique la règle d'évolution compilée indiquée à la grille de jeu """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    if regle["table"] is None:
+        # Les règles non totalistiques ne se contentent pas du nombre de voisines
+        return evoluer_par_voisinage(plateau, zone_utile, regle, chronometre)
+    debut = time.perf_counter_ns()
+    table_naissance, table_survie = regle["table"]
+
+    population = 0
+    naissances = 0
+    survie = 0
+    deces = 0
+    modifications = []
+
+    # Créer un tableau pour compter les cellules voisines
+    voisines = creer_plateau(nb_lignes, nb_colonnes)
+
+    # Le peupler en une seule passe, sans réexaminer plusieurs fois une
+    # même cellule et en ne parcourant que la zone utile
+    for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1):
+        for colonne in range(zone_utile["X_1"], zone_utile["X_2"] + 1):
+            if plateau[ligne][colonne] != CELLULE_MORTE:
+                if ligne > 0:
+                    if colonne > 0:
+                        voisines[ligne - 1][colonne - 1] += 1
+                    voisines[ligne - 1][colonne] += 1
+                    if colonne < nb_colonnes - 1:
+                        voisines[ligne - 1][colonne + 1] += 1
+                if colonne > 0:
+                    voisines[ligne][colonne - 1] += 1
+                if colonne < nb_colonnes - 1:
+                    voisines[ligne][colonne + 1] += 1
+                if ligne < nb_lignes - 1:
+                    if colonne > 0:
+                        voisines[ligne + 1][colonne - 1] += 1
+                    voisines[ligne + 1][colonne] += 1
+                    if colonne < nb_colonnes - 1:
+                        voisines[ligne + 1][colonne + 1] += 1
+
+    comptage = time.perf_counter_ns()
+
+    # Implémentation de la règle du jeu indiquée dans la zone utile
+    # avec une marge supplémentaire d'une colonne/ligne
+    zone = elargir_zone(zone_utile, nb_lignes, nb_colonnes)
+    for ligne in range(zone["Y_1"], zone["Y_2"] + 1):
+        for colonne in range(zone["X_1"], zone["X_2"] + 1):
+            if plateau[ligne][colonne] == CELLULE_MORTE:
+                if table_naissance[voisines[ligne][colonne]]:
+                    plateau[ligne][colonne] = CELLULE_NAISSANTE
+                    population += 1
+                    naissances += 1
+                    modifications.append((colonne, ligne))
+            else:
+                if table_survie[voisines[ligne][colonne]]:
+                    if plateau[ligne][colonne] == CELLULE_NAISSANTE:
+                        modifications.append((colonne, ligne))
+                    plateau[ligne][colonne] += 1
+                    population += 1
+                    survie += 1
+                else:
+                    plateau[ligne][colonne] = CELLULE_MORTE
+                    deces += 1
+                    modifications.append((colonne, ligne))
+    application = time.perf_counter_ns()
+
+    # Redéfinition de la zone utile
+    zone_utile = detourer(plateau, zone["X_1"], zone["Y_1"], zone["X_2"], zone["Y_2"])
+    if chronometre is not None:
+        chronometrer(chronometre, debut, comptage, application)
+    return {
+        "statut": {"population": population, "naissances": naissances, "survie": survie, "deces": deces},
+        "zone_utile": zone_utile,
+        "modifications": modifications
+        }
+
+########################################################################
+def evoluer_par_voisinage(plateau, zone_utile, regle, chronometre=None):
+    """ Applique la règle d'évolution compilée indiquée à la grille de jeu en consultant la table
+    de transition des configurations du voisinage """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    debut = time.perf_counter_ns()
+
+    # Implémentation de la règle du jeu indiquée dans la zone utile
+    # avec une marge supplémentaire d'une colonne/ligne
+    zone = elargir_zone(zone_utile, nb_lignes, nb_colonnes)
+    # Le comptage des voisines se fait en même temps que la consultation de la table
+    naissantes, survivantes, mourantes = calculer_zone(plateau, zone, regle)
+    comptage = time.perf_counter_ns()
+
+    modifications = []
+    for ligne, colonne in naissantes:
+        plateau[ligne][colonne] = CELLULE_NAISSANTE
+        modifications.append((colonne, ligne))
+    for ligne, colonne in survivantes:
+        if plateau[ligne][colonne] == CELLULE_NAISSANTE:
+            modifications.append((colonne, ligne))
+        plateau[ligne][colonne] += 1
+    for ligne, colonne in mourantes:
+        plateau[ligne][colonne] = CELLULE_MORTE
+        modifications.append((colonne, ligne))
+    application = time.perf_counter_ns()
+
+    # Redéfinition de la zone utile
+    zone_utile = detourer(plateau, zone["X_1"], zone["Y_1"], zone["X_2"], zone["Y_2"])
+    if chronometre is not None:
+        chronometrer(chronometre, debut, comptage, application)
+    return {
+        "statut": {"population": len(naissantes) + len(survivantes), "naissances": len(naissantes), "survie": len(survivantes), "deces": len(mourantes)},
+        "zone_utile": zone_utile,
+        "modifications": modifications
+        }
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+""" Moteur d'évolution par tuiles ignorant les tuiles vides ou stables
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Le plateau du moteur de référence est découpé en tuiles carrées de taille fixe
+- Seules les tuiles dans lesquelles une cellule est née ou morte à la génération précédente, ainsi
+  que leurs 8 voisines, sont recalculées, au lieu d'une unique zone utile englobant toutes les
+  cellules vivantes
+- Les statistiques restent celles du moteur de référence, la population des tuiles stables étant
+  mémorisée. En revanche l'âge des cellules des tuiles stables n'est plus incrémenté, ce qui ne
+  change pas leur couleur puisqu'elles ont toutes au moins 2 générations
+"""
+
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE, calculer_zone, detourer
+
+TAILLE_TUILE = 16 # cases
+
+########################################################################
+def creer_etat(plateau, taille_tuile=TAILLE_TUILE):
+    """ Retourne l'état des tuiles d'une grille de jeu, toutes les tuiles peuplées étant à recalculer """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+    etat = {
+        "taille": taille_tuile,
+        "nb_lignes": (nb_lignes + taille_tuile - 1) // taille_tuile,
+        "nb_colonnes": (nb_colonnes + taille_tuile - 1) // taille_tuile,
+        "populations": {},
+        "actives": set()
+    }
+    for ligne in range(nb_lignes):
+        for colonne in range(nb_colonnes):
+            if plateau[ligne][colonne] != CELLULE_MORTE:
+                tuile = (ligne // taille_tuile, colonne // taille_tuile)
+                etat["populations"][tuile] = etat["populations"].get(tuile, 0) + 1
+                etat["actives"].add(tuile)
+    return etat
+
+########################################################################
+def zone_tuile(etat, tuile, nb_lignes, nb_colonnes):
+    """ Retourne le rectangle de cases {"X_1", "Y_1", "X_2", "Y_2"} couvert par une tuile """
+    return {
+        "X_1": tuile[1] * etat["taille"],
+        "Y_1": tuile[0] * etat["taille"],
+        "X_2": min((tuile[1] + 1) * etat["taille"], nb_colonnes) - 1,
+        "Y_2": min((tuile[0] + 1) * etat["taille"], nb_lignes) - 1
+    }
+
+########################################################################
+def evoluer(plateau, etat, regle):
+    """ Applique la règle d'évolution compilée indiquée aux tuiles à recalculer de la grille de jeu """
+    nb_lignes = len(plateau)
+    nb_colonnes = len(plateau[0])
+
+    # Tuiles modifiées à la génération précédente et leurs voisines
+    a_calculer = set()
+    for ligne_tuile, colonne_tuile in etat["actives"]:
+        for ligne in range(max(ligne_tuile - 1, 0), min(ligne_tuile + 2, etat["nb_lignes"])):
+            for colonne in range(max(colonne_tuile - 1, 0), min(colonne_tuile + 2, etat["nb_colonnes"])):
+                a_calculer.add((ligne, colonne))
+
+    # Calcul de toutes les tuiles avant de modifier le plateau
+    changements = []
+    naissances = 0
+    survie = 0
+    deces = 0
+    actives = set()
+    for tuile in a_calculer:
+        naissantes, survivantes, mourantes = calculer_zone(plateau, zone_tuile(etat, tuile, nb_lignes, nb_colonnes), regle)
+        changements.append((naissantes, survivantes, mourantes))
+        naissances += len(naissantes)
+        survie += len(survivantes)
+        deces += len(mourantes)
+        if naissantes or mourantes:
+            actives.add(tuile)
+        if naissantes or survivantes:
+            etat["populations"][tuile] = len(naissantes) + len(survivantes)
+        else:
+            etat["populations"].pop(tuile, None)
+
+    modifications = []
+    for naissantes, survivantes, mourantes in changements:
+        for ligne, colonne in naissantes:
+            plateau[ligne][colonne] = CELLULE_NAISSANTE
+            modifications.append((colonne, ligne))
+        for ligne, colonne in survivantes:
+            if plateau[ligne][colonne] == CELLULE_NAISSANTE:
+                modifications.append((colonne, ligne))
+            plateau[ligne][colonne] += 1
+        for ligne, colonne in mourantes:
+            plateau[ligne][colonne] = CELLULE_MORTE
+            modifications.append((colonne, ligne))
+
+    # Les cellules des tuiles stables survivent toutes
+    for tuile, population in etat["populations"].items():
+        if tuile not in a_calculer:
+            survie += population
+    etat["actives"] = actives
+
+    # Redéfinition de la zone utile à partir des tuiles peuplées
+    if etat["populations"]:
+        tuiles = etat["populations"].keys()
+        zone = {
+            "X_1": min(tuile[1] for tuile in tuiles) * etat["taille"],
+            "Y_1": min(tuile[0] for tuile in tuiles) * etat["taille"],
+            "X_2": min((max(tuile[1] for tuile in tuiles) + 1) * etat["taille"], nb_colonnes) - 1,
+            "Y_2": min((max(tuile[0] for tuile in tuiles) + 1) * etat["taille"], nb_lignes) - 1
+        }
+        zone_utile = detourer(plateau, zone["X_1"], zone["Y_1"], zone["X_2"], zone["Y_2"])
+    else:
+        zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+
+    return {
+        "statut": {"population": naissances + survie, "naissances": naissances, "survie": survie, "deces": deces},
+        "zone_utile": zone_utile,
+        "modifications": modifications
+        }
@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+""" Détection des oscillateurs et des vaisseaux par empreinte des générations
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- L'empreinte d'une génération est la somme modulo 2^61-1 des valeurs BASE_X^colonne * BASE_Y^ligne
+  de ses cellules vivantes. Elle se met à jour à chaque génération en ne traitant que les cases
+  modifiées (empreinte glissante), et sa division par BASE_X^X_1 * BASE_Y^Y_1, où (X_1, Y_1) est le
+  coin de la zone utile, la rend indépendante de la position des cellules
+- Les empreintes des dernières générations sont gardées dans une table de taille bornée. Quand
+  l'empreinte (et la population) de la génération courante y figure déjà, la configuration se
+  répète : sa période est l'écart entre les deux générations et son déplacement celui du coin de
+  la zone utile (nul pour un oscillateur, non nul pour un vaisseau)
+- Une fois un oscillateur détecté, son cycle peut être enregistré puis rejoué sans recalcul
+  (moteurs d'évolution à plateau borné, avec affichage)
+- Le moteur hashlife, qui avance de plusieurs générations à la fois, n'est pas concerné, et les
+  empreintes du moteur creux sont recalculées à chaque génération à partir de ses cellules
+- N'importe pas PyGame
+"""
+
+import collections
+import time
+
+from configuration import PERIODES_AUCUNE, PERIODES_AFFICHAGE, PERIODES_ARRET, PERIODES_REJEU
+import moteur
+from moteur import CELLULE_NAISSANTE
+
+TAILLE_HISTORIQUE = 1000 # générations, et donc période maximale détectée
+MODULO = (1 << 61) - 1 # nombre premier de Mersenne
+BASE_X = 0x2545F4914F6CDD1D % MODULO
+BASE_Y = 0x9E3779B97F4A7C15 % MODULO
+INVERSE_X = pow(BASE_X, MODULO - 2, MODULO)
+INVERSE_Y = pow(BASE_Y, MODULO - 2, MODULO)
+
+########################################################################
+def puissance(base, inverse, exposant):
+    """ Retourne la base à la puissance indiquée, éventuellement négative, modulo MODULO """
+    if exposant >= 0:
+        return pow(base, exposant, MODULO)
+    return pow(inverse, -exposant, MODULO)
+
+########################################################################
+def creer_detecteur(taille=TAILLE_HISTORIQUE):
+    """ Retourne un détecteur de cycles gardant les empreintes du nombre de générations indiqué """
+    return {
+        "taille": taille,
+        "actif": False,
+        "empreintes": {}, # (empreinte, population) -> (génération, X_1, Y_1)
+        "ordre": collections.deque(), # ((empreinte, population), génération), pour oublier les plus anciennes
+        "cellules": set(), # cellules vivantes (colonne, ligne) sur plateau borné
+        "somme": 0, # empreinte non normalisée des cellules vivantes
+        "puissances_x": [],
+        "puissances_y": [],
+        "periode": None, # {"periode", "deplacement", "generation"} du cycle en cours
+        "enregistrement": None, # générations du cycle en cours d'enregistrement
+        "longueur": 0, # période du cycle en cours d'enregistrement
+        "cycle": None, # générations du cycle à rejouer
+        "rang": 0 # rang dans le cycle de la prochaine génération à rejouer
+    }
+
+########################################################################
+def valeur_case(detecteur, colonne, ligne):
+    """ Retourne la valeur de la case indiquée dans l'empreinte """
+    if 0 <= colonne < len(detecteur["puissances_x"]) and 0 <= ligne < len(detecteur["puissances_y"]):
+        return detecteur["puissances_x"][colonne] * detecteur["puissances_y"][ligne] % MODULO
+    return puissance(BASE_X, INVERSE_X, colonne) * puissance(BASE_Y, INVERSE_Y, ligne) % MODULO
+
+########################################################################
+def demarrer_detection(detecteur, simulation, action=PERIODES_AFFICHAGE):
+    """ Vide le détecteur de cycles et note la génération de départ de la simulation (après
+    moteur.demarrer()) """
+    detecteur["actif"] = action != PERIODES_AUCUNE and simulation["moteur"] != "hashlife"
+    detecteur["empreintes"].clear()
+    detecteur["ordre"].clear()
+    detecteur["cellules"].clear()
+    detecteur["somme"] = 0
+    detecteur["periode"] = None
+    detecteur["enregistrement"] = None
+    detecteur["cycle"] = None
+    detecteur["rang"] = 0
+    if not detecteur["actif"]:
+        return
+    detecteur["puissances_x"] = [pow(BASE_X, colonne, MODULO) for colonne in range(simulation["nb_colonnes"])]
+    detecteur["puissances_y"] = [pow(BASE_Y, ligne, MODULO) for ligne in range(simulation["nb_lignes"])]
+
+    if simulation["moteur"] != "creux":
+        zone_utile = simulation["zone_utile"]
+        for ligne in range(max(zone_utile["Y_1"], 0), min(zone_utile["Y_2"] + 1, simulation["nb_lignes"])):
+            for colonne in range(max(zone_utile["X_1"], 0), min(zone_utile["X_2"] + 1, simulation["nb_colonnes"])):
+                if moteur.est_vivante(simulation, colonne, ligne):
+                    detecteur["cellules"].add((colonne, ligne))
+                    detecteur["somme"] += valeur_case(detecteur, colonne, ligne)
+        detecteur["somme"] %= MODULO
+    noter_generation(detecteur, simulation, None)
+
+########################################################################
+def noter_generation(detecteur, simulation, resultat):
+    """ Met à jour l'empreinte avec le résultat du moteur d'évolution (None pour la génération de
+    départ) et retourne le cycle en cours {"periode", "deplacement", "generation"} ou None """
+    if simulation["moteur"] == "creux":
+        # L'univers n'étant pas borné, l'empreinte est recalculée à partir de ses cellules
+        cellules = simulation["univers"]["cellules"]
+        if not cellules:
+            detecteur["periode"] = None
+            return None
+        somme = 0
+        for colonne, ligne in cellules:
+            somme += valeur_case(detecteur, colonne, ligne)
+        detecteur["somme"] = somme % MODULO
+        x_1 = min(colonne for colonne, ligne in cellules)
+        y_1 = min(ligne for colonne, ligne in cellules)
+        population = len(cellules)
+    else:
+        if resultat is not None:
+            # Seules les cases modifiées peuvent être nées ou mortes
+            cellules = detecteur["cellules"]
+            somme = detecteur["somme"]
+            for colonne, ligne in resultat["modifications"]:
+                vivante = moteur.est_vivante(simulation, colonne, ligne)
+                if vivante and (colonne, ligne) not in cellules:
+                    cellules.add((colonne, ligne))
+                    somme += valeur_case(detecteur, colonne, ligne)
+                elif not vivante and (colonne, ligne) in cellules:
+                    cellules.remove((colonne, ligne))
+                    somme -= valeur_case(detecteur, colonne, ligne)
+            detecteur["somme"] = somme % MODULO
+        if not detecteur["cellules"]:
+            detecteur["periode"] = None
+            return None
+        x_1 = simulation["zone_utile"]["X_1"]
+        y_1 = simulation["zone_utile"]["Y_1"]
+        population = len(detecteur["cellules"])
+
+    # Empreinte ramenée au coin de la zone utile
+    empreinte = detecteur["somme"] * puissance(INVERSE_X, BASE_X, x_1) % MODULO * puissance(INVERSE_Y, BASE_Y, y_1) % MODULO
+    cle = (empreinte, population)
+    generation = simulation["generation"]
+    precedente = detecteur["empreintes"].get(cle)
+    if precedente is None:
+        detecteur["periode"] = None
+    else:
+        detecteur["periode"] = {
+            "periode": generation - precedente[0],
+            "deplacement": (x_1 - precedente[1], y_1 - precedente[2]),
+            "generation": generation
+        }
+
+    detecteur["empreintes"][cle] = (generation, x_1, y_1)
+    detecteur["ordre"].append((cle, generation))
+    while len(detecteur["ordre"]) > detecteur["taille"]:
+        cle, generation = detecteur["ordre"].popleft()
+        if detecteur["empreintes"].get(cle, (None,))[0] == generation:
+            del detecteur["empreintes"][cle]
+    return detecteur["periode"]
+
+########################################################################
+def enregistrer_generation(detecteur, simulation, resultat):
+    """ Enregistre le résultat du moteur d'évolution dans le cycle en cours d'enregistrement, avec
+    les nouvelles valeurs des cases modifiées, et termine l'enregistrement au bout d'une période """
+    plateau = simulation["plateau"]
+    # Les cellules âgées de plus d'une génération étant toutes dessinées de la même couleur, leur
+    # âge exact est inutile
+    changements = [(colonne, ligne, min(int(plateau[ligne][colonne]), CELLULE_NAISSANTE + 1)) for colonne, ligne in resultat["modifications"]]
+    detecteur["enregistrement"].append((resultat["statut"], resultat["zone_utile"], changements))
+    if len(detecteur["enregistrement"]) == detecteur["longueur"]:
+        detecteur["cycle"] = detecteur["enregistrement"]
+        detecteur["enregistrement"] = None
+        detecteur["rang"] = 0
+
+########################################################################
+def rejouer_generation(detecteur, simulation):
+    """ Applique à la simulation la génération suivante du cycle enregistré et retourne le même
+    résultat que le moteur d'évolution """
+    statut, zone_utile, changements = detecteur["cycle"][detecteur["rang"]]
+    detecteur["rang"] = (detecteur["rang"] + 1) % len(detecteur["cycle"])
+    # L'état propre au moteur d'évolution (lignes binaires, tuiles) est tenu à jour avec le plateau
+    modifications = moteur.appliquer_changements(simulation, changements)
+    simulation["zone_utile"] = zone_utile
+    simulation["generation"] += simulation["generations_par_cycle"]
+    return {"statut": statut, "zone_utile": zone_utile, "modifications": modifications}
+
+########################################################################
+def avancer(simulation, detecteur, action=PERIODES_AFFICHAGE):
+    """ Fait évoluer la simulation d'un cycle, détecte les oscillateurs et vaisseaux et retourne le
+    résultat du moteur d'évolution. Avec PERIODES_REJEU, le cycle d'un oscillateur détecté est
+    enregistré pendant une période puis rejoué sans recalcul """
+    if detecteur["cycle"] is not None:
+        debut = time.perf_counter_ns()
+        resultat = rejouer_generation(detecteur, simulation)
+        if simulation["chronometre"] is not None:
+            # Rien n'est calculé : seule la durée totale est mesurée
+            simulation["chronometre"].clear()
+            simulation["chronometre"]["moteur"] = time.perf_counter_ns() - debut
+        return resultat
+
+    resultat = moteur.avancer(simulation)
+    if not detecteur["actif"]:
+        return resultat
+    if detecteur["enregistrement"] is not None:
+        enregistrer_generation(detecteur, simulation, resultat)
+    periode = noter_generation(detecteur, simulation, resultat)
+
+    # Les moteurs sur plan infini ne tiennent pas le plateau à jour hors de la fenêtre affichée
+    if action == PERIODES_REJEU and periode is not None and periode["deplacement"] == (0, 0) \
+    and detecteur["enregistrement"] is None and detecteur["cycle"] is None \
+    and simulation["affichage"] and simulation["moteur"] not in ("creux", "hashlife"):
+        detecteur["enregistrement"] = []
+        detecteur["longueur"] = periode["periode"]
+    return resultat
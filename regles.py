@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+""" Règles du jeu
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Une règle est compilée une fois pour toutes en tables de transition communes à tous les moteurs
+  d'évolution :
+    - "voisinage" : état suivant de la cellule centrale pour chacune des 512 configurations de son
+      voisinage 3x3, indexées par le bit n° 3 * (dy + 1) + (dx + 1) de chaque case (le bit n° 4
+      étant la cellule elle-même)
+    - "table" : pour les règles totalistiques (notation B/S), état suivant [vivante][nombre de
+      voisines] (2x9 entrées), plus rapide pour les moteurs qui comptent les voisines
+- Les règles isotropes non totalistiques sont acceptées en notation de Hensel
+  (https://conwaylife.com/wiki/Isotropic_non-totalistic_rule) : chaque nombre de voisines peut être
+  suivi des lettres des configurations retenues, ou d'un - et de celles qui sont exclues
+  (ex : B2-a/S12)
+- Les notations B3/S23, b3/s23 et 23/3 (survie/naissance) sont reconnues
+"""
+
+import re
+
+# Ordre des voisines dans les configurations de Hensel ci-dessous : N, NE, E, SE, S, SO, O, NO
+VOISINES_HENSEL = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+LETTRES_HENSEL = "cekainyqjrtwz"
+CONFIGURATIONS_HENSEL = {
+    0: (),
+    1: ("00000001", "10000000"),
+    2: ("01000001", "10000010", "00100001", "10000001", "10001000", "00010001"),
+    3: ("01000101", "10100010", "00101001", "10000011", "11000001", "01100001", "01001001", "10010001", "10100001", "10001001"),
+    4: ("01010101", "10101010", "01001011", "11100001", "01100011", "11000101", "01100101", "10010011", "10101001", "10100011", "11001001", "10110001", "10011001"),
+    5: ("10111010", "01011101", "11010110", "01111100", "00111110", "10011110", "10110110", "01101110", "01011110", "01110110"),
+    6: ("10111110", "01111101", "11011110", "01111110", "01110111", "11101110"),
+    7: ("11111110", "01111111"),
+    8: ()
+}
+BIT_CENTRAL = 4
+REGLE_CONWAY = "B3/S23"
+
+# Lettres de Hensel des 512 configurations du voisinage, calculées à la première règle non
+# totalistique
+lettres_voisinages = []
+
+########################################################################
+def indexer(cases):
+    """ Retourne l'index dans la table "voisinage" d'un ensemble de cases (dx, dy) vivantes """
+    index = 0
+    for dx, dy in cases:
+        index |= 1 << (3 * (dy + 1) + (dx + 1))
+    return index
+
+########################################################################
+def classer_voisinages():
+    """ Retourne la lettre de Hensel de chacune des 512 configurations du voisinage ("" pour 0 et
+    8 voisines) """
+    # Les 8 symétries du carré : 4 rotations, avec ou sans retournement
+    symetries = []
+    for retournement in (False, True):
+        for rotation in range(4):
+            symetries.append((retournement, rotation))
+
+    def transformer(cases, retournement, rotation):
+        resultat = []
+        for dx, dy in cases:
+            if retournement:
+                dx = -dx
+            for i in range(rotation):
+                dx, dy = -dy, dx
+            resultat.append((dx, dy))
+        return resultat
+
+    lettres = [""] * 512
+    for nombre, configurations in CONFIGURATIONS_HENSEL.items():
+        for lettre, configuration in zip(LETTRES_HENSEL, configurations):
+            cases = [VOISINES_HENSEL[rang] for rang, bit in enumerate(configuration) if bit == "1"]
+            for retournement, rotation in symetries:
+                index = indexer(transformer(cases, retournement, rotation))
+                lettres[index] = lettre
+                lettres[index | (1 << BIT_CENTRAL)] = lettre
+    return lettres
+
+########################################################################
+def decoder_conditions(texte):
+    """ Retourne le dictionnaire {nombre de voisines: lettres de Hensel retenues} d'une moitié de
+    règle (ex : "2-a3" => {2: "ceikn", 3: "cekainyqjr"}), ou lève ValueError """
+    conditions = {}
+    for nombre, signe, lettres in re.findall(r'(\d)(-?)([a-z]*)', texte):
+        nombre = int(nombre)
+        toutes = LETTRES_HENSEL[:len(CONFIGURATIONS_HENSEL[nombre])]
+        if any(lettre not in toutes for lettre in lettres):
+            raise ValueError(texte)
+        if not lettres:
+            conditions[nombre] = toutes
+        elif signe:
+            conditions[nombre] = "".join(lettre for lettre in toutes if lettre not in lettres)
+        else:
+            conditions[nombre] = lettres
+    return conditions
+
+########################################################################
+def decoder_regle(regle):
+    """ Retourne les conditions de naissance et de survie d'une règle, ou lève ValueError """
+    texte = regle.strip().replace(" ", "")
+    expression = re.match(r'^[bB](?P<naissance>(\d-?[a-z]*)*)/[sS](?P<survie>(\d-?[a-z]*)*)$', texte)
+    if expression is None:
+        expression = re.match(r'^[sS]?(?P<survie>\d*)/[bB]?(?P<naissance>\d*)$', texte)
+    if expression is None or re.search(r'9', texte):
+        raise ValueError(regle)
+    return decoder_conditions(expression.group("naissance")), decoder_conditions(expression.group("survie"))
+
+########################################################################
+def compiler_regle(regle):
+    """ Retourne les tables de transition d'une règle en notation B/S ou de Hensel, ou lève
+    ValueError """
+    naissance, survie = decoder_regle(regle)
+    totalistique = all(
+        len(lettres) == len(CONFIGURATIONS_HENSEL[nombre])
+        for conditions in (naissance, survie)
+        for nombre, lettres in conditions.items()
+    )
+
+    if totalistique:
+        table = [[0] * 9, [0] * 9]
+        for etat, conditions in enumerate((naissance, survie)):
+            for nombre in conditions:
+                table[etat][nombre] = 1
+        voisinage = []
+        for index in range(512):
+            etat = (index >> BIT_CENTRAL) & 1
+            voisinage.append(table[etat][bin(index).count("1") - etat])
+    else:
+        table = None
+        if not lettres_voisinages:
+            lettres_voisinages.extend(classer_voisinages())
+        voisinage = []
+        for index in range(512):
+            etat = (index >> BIT_CENTRAL) & 1
+            conditions = (naissance, survie)[etat]
+            nombre = bin(index).count("1") - etat
+            voisinage.append(int(nombre in conditions and (lettres_voisinages[index] in conditions[nombre] or lettres_voisinages[index] == "")))
+
+    # Nombres de voisines dont au moins une configuration est retenue
+    return {
+        "texte": regle.strip(),
+        "naissance": sorted(nombre for nombre, lettres in naissance.items() if lettres or nombre in (0, 8)),
+        "survie": sorted(nombre for nombre, lettres in survie.items() if lettres or nombre in (0, 8)),
+        "totalistique": totalistique,
+        "table": table,
+        "voisinage": voisinage
+    }
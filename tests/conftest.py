@@ -0,0 +1,6 @@
+""" Configuration des tests : les modules du jeu sont à la racine du dépôt """
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
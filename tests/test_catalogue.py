@@ -0,0 +1,42 @@
+""" Tests du précalcul du cache binaire de la bibliothèque (catalogue.py) """
+
+import catalogue as catalogue_module
+from catalogue import charger_cache, charger_catalogue, mettre_a_jour_catalogue, prechauffer_cache, sauvegarder_catalogue
+from fichiers import dater_fichier
+
+########################################################################
+def test_fichier_illisible(tmp_path, capsys):
+    """ Un fichier illisible est signalé et ignoré, sans interrompre le précalcul des autres """
+    (tmp_path / "clignotant.cells").write_text("!Name: Clignotant\nOOO\n")
+    (tmp_path / "illisible.cells").write_bytes(b"\xff\xfe\x00O\xff\n")
+    chemin_fichier = str(tmp_path / "clignotant.cells")
+    assert prechauffer_cache(str(tmp_path), 2) == 1
+    assert "illisible.cells" in capsys.readouterr().out
+    assert charger_cache(chemin_fichier, dater_fichier(chemin_fichier)) is not None
+    assert prechauffer_cache(str(tmp_path), 2) == 0
+
+########################################################################
+def test_fichier_devenu_illisible(tmp_path, monkeypatch):
+    """ Un fichier du catalogue devenu illisible en est retiré (liste des noms comprise) et n'est
+    relu qu'une fois modifié """
+    (tmp_path / "clignotant.cells").write_text("!Name: Clignotant\nOOO\n")
+    catalogue = charger_catalogue(str(tmp_path))
+    assert catalogue["noms"] == ["clignotant.cells"]
+
+    (tmp_path / "clignotant.cells").write_bytes(b"\xff\xfe\x00O\xff\n")
+    assert mettre_a_jour_catalogue(catalogue, str(tmp_path))
+    assert catalogue["noms"] == []
+    assert catalogue["fichiers"] == {}
+    sauvegarder_catalogue(catalogue, str(tmp_path))
+
+    lectures = []
+    monkeypatch.setattr(catalogue_module, "decrire_fichier", lambda chemin_fichier, langue="fr": lectures.append(chemin_fichier))
+    catalogue = charger_catalogue(str(tmp_path))
+    assert catalogue["noms"] == []
+    assert lectures == []
+
+    monkeypatch.undo()
+    (tmp_path / "clignotant.cells").write_text("!Name: Clignotant\nO\nO\nO\n")
+    catalogue = charger_catalogue(str(tmp_path))
+    assert catalogue["noms"] == ["clignotant.cells"]
+    assert catalogue["illisibles"] == {}
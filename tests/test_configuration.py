@@ -0,0 +1,19 @@
+""" Tests de la lecture du fichier de configuration (configuration.py) """
+
+from configuration import charger_ou_creer_fichier_de_configuration
+
+########################################################################
+def test_moteur_inconnu(tmp_path, capsys):
+    """ Un moteur d'évolution inconnu est signalé et remplacé par le moteur python """
+    fichier_configuration = tmp_path / "vie.cfg"
+    fichier_configuration.write_text("LANGUE = en\nMOTEUR = binare\n")
+    parametres = charger_ou_creer_fichier_de_configuration(str(fichier_configuration))
+    assert parametres["MOTEUR"] == "python"
+    assert "binare" in capsys.readouterr().out
+
+########################################################################
+def test_moteur_connu(tmp_path):
+    """ Un moteur d'évolution connu est gardé """
+    fichier_configuration = tmp_path / "vie.cfg"
+    fichier_configuration.write_text("MOTEUR = tuiles # commentaire\n")
+    assert charger_ou_creer_fichier_de_configuration(str(fichier_configuration))["MOTEUR"] == "tuiles"
@@ -0,0 +1,58 @@
+""" Tests de l'écriture des fichiers (fichiers.py) """
+
+import os
+import random
+import threading
+
+import pytest
+
+from fichiers import charger_cellules_run_length_encoded, charger_fichier_run_length_encoded, charger_regle_dans_fichier, ecrire_fichier, sauvegarder_fichier
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE, creer_plateau, detourer
+
+########################################################################
+def test_ecritures_simultanees(tmp_path):
+    """ Plusieurs tâches peuvent remplacer le même fichier en même temps sans erreur """
+    chemin_fichier = str(tmp_path / "_catalogue_.json")
+    erreurs = []
+
+    def ecrire(numero):
+        try:
+            for i in range(200):
+                ecrire_fichier(chemin_fichier, [str(numero) * 1000])
+        except OSError as erreur:
+            erreurs.append(erreur)
+
+    taches = [threading.Thread(target=ecrire, args=(numero,)) for numero in range(4)]
+    for tache in taches:
+        tache.start()
+    for tache in taches:
+        tache.join()
+    assert not erreurs
+    assert os.listdir(str(tmp_path)) == ["_catalogue_.json"]
+
+########################################################################
+@pytest.mark.parametrize("graine", [0, 1, 2])
+def test_aller_retour_run_length_encoded(tmp_path, graine):
+    """ Une structure sauvegardée au format Run Length Encoded (lignes vides, longues suites et
+    lignes de plus de 70 caractères comprises) est relue à l'identique, en cases comme en
+    coordonnées """
+    hasard = random.Random(graine)
+    plateau = creer_plateau(40, 200)
+    for ligne in range(3, 37):
+        if hasard.random() < 0.2:
+            continue # ligne vide
+        for colonne in range(5, 195):
+            if hasard.random() < 0.3 or 50 <= colonne < 80:
+                plateau[ligne][colonne] = CELLULE_NAISSANTE + hasard.randrange(3)
+    zone_utile = detourer(plateau, 0, 0, 199, 39)
+    chemin_fichier = str(tmp_path / "soupe.rle")
+    sauvegarder_fichier(chemin_fichier, "soupe", plateau, zone_utile, regle="B36/S23")
+
+    attendue = [[CELLULE_MORTE if case == CELLULE_MORTE else CELLULE_NAISSANTE for case in ligne[zone_utile["X_1"]:zone_utile["X_2"] + 1]] for ligne in plateau[zone_utile["Y_1"]:zone_utile["Y_2"] + 1]]
+    assert charger_fichier_run_length_encoded(chemin_fichier) == attendue
+    largeur, hauteur, cellules = charger_cellules_run_length_encoded(chemin_fichier)
+    assert (largeur, hauteur) == (len(attendue[0]), len(attendue))
+    assert sorted(cellules) == sorted((colonne, ligne) for ligne, cases in enumerate(attendue) for colonne, case in enumerate(cases) if case != CELLULE_MORTE)
+    assert charger_regle_dans_fichier(chemin_fichier) == "B36/S23"
+    with open(chemin_fichier, "r") as fichier:
+        assert max(len(ligne_fichier.rstrip("\n")) for ligne_fichier in fichier) <= 70
@@ -0,0 +1,49 @@
+""" Tests de l'historique des générations passées (historique.py) """
+
+import pytest
+
+import moteur
+import periodes
+from bibliotheque import bibliotheque
+from historique import creer_historique, demarrer_historique, historiser_generation, restituer_generation
+from moteur_python import CELLULE_MORTE
+from regles import compiler_regle
+
+########################################################################
+def vivantes(simulation):
+    """ Retourne l'ensemble des cellules vivantes (colonne, ligne) du plateau """
+    plateau = simulation["plateau"]
+    return {(colonne, ligne) for ligne in range(simulation["nb_lignes"]) for colonne in range(simulation["nb_colonnes"]) if plateau[ligne][colonne] != CELLULE_MORTE}
+
+########################################################################
+def creer(nom_moteur, structure):
+    """ Retourne une simulation démarrée avec la structure de la bibliothèque indiquée """
+    simulation = moteur.creer_simulation({"MOTEUR": nom_moteur}, compiler_regle("B3/S23"), 40, 40)
+    moteur.coller_structure(simulation, bibliotheque[structure], 15, 15)
+    moteur.demarrer(simulation)
+    return simulation
+
+########################################################################
+@pytest.mark.parametrize("nom_moteur", ["python", "binaire", "tuiles"])
+@pytest.mark.parametrize("structure", ["Oscillateur : Clignotant", "Oscillateur : Pentadécathlon"])
+def test_retour_pendant_rejeu(nom_moteur, structure):
+    """ Les générations rejouées sans recalcul sont restituées dans la bonne phase """
+    reference = creer("python", structure)
+    attendues = {reference["generation"]: vivantes(reference)}
+
+    simulation = creer(nom_moteur, structure)
+    detecteur = periodes.creer_detecteur()
+    periodes.demarrer_detection(detecteur, simulation, periodes.PERIODES_REJEU)
+    historique = creer_historique(1 << 20)
+    demarrer_historique(historique, simulation)
+    for i in range(60):
+        moteur.avancer(reference)
+        attendues[reference["generation"]] = vivantes(reference)
+        resultat = periodes.avancer(simulation, detecteur, periodes.PERIODES_REJEU)
+        historiser_generation(historique, simulation, resultat)
+    assert detecteur["cycle"] is not None
+
+    for generation in range(simulation["generation"], 0, -1):
+        restituer_generation(historique, simulation, generation)
+        assert simulation["generation"] == generation
+        assert vivantes(simulation) == attendues[generation]
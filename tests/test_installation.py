@@ -0,0 +1,105 @@
+""" Tests du téléchargement de la base de formes (installation.py) avec un serveur HTTP local """
+
+import hashlib
+import http.server
+import os
+import threading
+
+import pytest
+
+from installation import telecharger
+
+CONTENU = bytes(range(256)) * 64
+EMPREINTE = hashlib.sha256(CONTENU).hexdigest()
+
+########################################################################
+class Serveur(http.server.BaseHTTPRequestHandler):
+    """ Serveur de substitution de l'archive, dont le traitement des requêtes Range est réglable
+    (attribut de classe mode) : "reprise" (206 ou 416), "ignore" (200) ou "decale" (206 avec un
+    Content-Range ne commençant pas à l'octet demandé) """
+    mode = "reprise"
+
+    def do_GET(self):
+        """ Envoie l'archive, ou sa fin si une reprise est demandée """
+        debut = 0
+        plage = self.headers.get("Range", "")
+        if plage.startswith("bytes=") and self.mode != "ignore":
+            debut = int(plage[len("bytes="):].split("-")[0])
+            if debut >= len(CONTENU):
+                self.send_response(416)
+                self.send_header("Content-Range", "bytes */" + str(len(CONTENU)))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.mode == "decale":
+                debut = max(debut - 10, 0)
+        if debut:
+            self.send_response(206)
+            self.send_header("Content-Range", "bytes " + str(debut) + "-" + str(len(CONTENU) - 1) + "/" + str(len(CONTENU)))
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(CONTENU) - debut))
+        self.end_headers()
+        self.wfile.write(CONTENU[debut:])
+
+    def log_message(self, *arguments):
+        """ Pas de journal des requêtes """
+
+########################################################################
+@pytest.fixture
+def url():
+    """ Démarre le serveur de substitution et retourne l'adresse de l'archive """
+    serveur = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Serveur)
+    tache = threading.Thread(target=serveur.serve_forever, daemon=True)
+    tache.start()
+    yield "http://127.0.0.1:" + str(serveur.server_address[1]) + "/all.zip"
+    serveur.shutdown()
+    serveur.server_close()
+    Serveur.mode = "reprise"
+
+########################################################################
+def lire(chemin_fichier):
+    """ Retourne le contenu d'un fichier """
+    with open(chemin_fichier, "rb") as fichier:
+        return fichier.read()
+
+########################################################################
+def test_telechargement_complet(url, tmp_path):
+    """ Téléchargement sans fichier partiel, empreinte vérifiée """
+    chemin_fichier = str(tmp_path / "all.zip")
+    progression = {}
+    telecharger(url, chemin_fichier, EMPREINTE, progression)
+    assert lire(chemin_fichier) == CONTENU
+    assert not os.path.exists(chemin_fichier + ".part")
+    assert progression == {"octets": len(CONTENU), "total": len(CONTENU)}
+
+########################################################################
+@pytest.mark.parametrize("mode", ["reprise", "ignore", "decale"])
+def test_reprise(url, tmp_path, mode):
+    """ Reprise d'un téléchargement interrompu (206), ou téléchargement recommencé si le serveur
+    ignore la requête Range (200) ou ne reprend pas à l'octet demandé """
+    Serveur.mode = mode
+    chemin_fichier = str(tmp_path / "all.zip")
+    with open(chemin_fichier + ".part", "wb") as fichier:
+        fichier.write(CONTENU[:1000])
+    telecharger(url, chemin_fichier, EMPREINTE)
+    assert lire(chemin_fichier) == CONTENU
+    assert not os.path.exists(chemin_fichier + ".part")
+
+########################################################################
+def test_reprise_deja_complete(url, tmp_path):
+    """ Fichier partiel déjà complet : le serveur répond 416 et le fichier est gardé """
+    chemin_fichier = str(tmp_path / "all.zip")
+    with open(chemin_fichier + ".part", "wb") as fichier:
+        fichier.write(CONTENU)
+    telecharger(url, chemin_fichier, EMPREINTE)
+    assert lire(chemin_fichier) == CONTENU
+
+########################################################################
+def test_empreinte_incorrecte(url, tmp_path):
+    """ Une empreinte différente lève ValueError et supprime le fichier partiel """
+    chemin_fichier = str(tmp_path / "all.zip")
+    with pytest.raises(ValueError):
+        telecharger(url, chemin_fichier, "0" * 64)
+    assert not os.path.exists(chemin_fichier)
+    assert not os.path.exists(chemin_fichier + ".part")
@@ -0,0 +1,98 @@
+""" Tests de l'interface commune aux moteurs d'évolution (moteur.py) """
+
+import random
+
+import pytest
+
+import moteur
+import periodes
+from moteur_python import CELLULE_MORTE
+from regles import compiler_regle
+
+########################################################################
+def vivantes(simulation):
+    """ Retourne l'ensemble des cellules vivantes (colonne, ligne) du plateau """
+    plateau = simulation["plateau"]
+    return {(colonne, ligne) for ligne in range(simulation["nb_lignes"]) for colonne in range(simulation["nb_colonnes"]) if plateau[ligne][colonne] != CELLULE_MORTE}
+
+########################################################################
+@pytest.mark.parametrize("nom_moteur", ["python", "binaire", "hashlife", "creux", "tuiles"])
+def test_cellules_basculees(nom_moteur):
+    """ Les cellules posées à la main évoluent et les cases modifiées sont signalées """
+    simulation = moteur.creer_simulation({"MOTEUR": nom_moteur}, compiler_regle("B3/S23"), 8, 8)
+    for colonne in (2, 3, 4, 5):
+        moteur.basculer_cellule(simulation, colonne, 3)
+    moteur.basculer_cellule(simulation, 5, 3) # posée puis retirée
+    moteur.demarrer(simulation)
+    resultat = moteur.avancer(simulation)
+    assert vivantes(simulation) == {(3, 2), (3, 3), (3, 4)}
+    assert set(resultat["modifications"]) >= {(2, 3), (4, 3), (3, 2), (3, 4)}
+    assert resultat["statut"] == {"population": 3, "naissances": 2, "survie": 1, "deces": 2}
+
+########################################################################
+def semer(nom_moteur, regle, graine):
+    """ Retourne une simulation démarrée sur une soupe aléatoire au centre du plateau, assez loin
+    des bords pour que les moteurs sur plan infini et sur plateau borné restent comparables """
+    simulation = moteur.creer_simulation({"MOTEUR": nom_moteur, "PROCESSUS": 2, "SEUIL_PARALLELE": 0}, compiler_regle(regle), 64, 64)
+    hasard = random.Random(graine)
+    for ligne in range(24, 40):
+        for colonne in range(24, 40):
+            if hasard.random() < 0.4:
+                moteur.basculer_cellule(simulation, colonne, ligne)
+    return simulation, moteur.demarrer(simulation)
+
+########################################################################
+@pytest.mark.parametrize("nom_moteur", ["numpy", "binaire", "hashlife", "creux", "tuiles", "parallele"])
+@pytest.mark.parametrize("regle", ["B3/S23", "B36/S23", "B3678/S34678", "B2-a/S12", "B3/S23-q4z"])
+@pytest.mark.parametrize("graine", [0, 1, 2])
+def test_comparaison_reference(nom_moteur, regle, graine):
+    """ Plateau (âges compris), statistiques et cases modifiées identiques à ceux du moteur de
+    référence pendant 20 générations """
+    if nom_moteur == "numpy":
+        pytest.importorskip("numpy")
+    reference, statut_reference = semer("python", regle, graine)
+    simulation, statut = semer(nom_moteur, regle, graine)
+    try:
+        assert statut == statut_reference
+        for generation in range(20):
+            attendu = moteur.avancer(reference)
+            resultat = moteur.avancer(simulation)
+            assert resultat["statut"] == attendu["statut"]
+            assert [list(ligne) for ligne in simulation["plateau"]] == reference["plateau"]
+            assert set(resultat["modifications"]) == set(attendu["modifications"])
+    finally:
+        moteur.terminer(simulation)
+
+########################################################################
+def test_chronometre():
+    """ Le chronomètre ne contient que les phases mesurées pendant le dernier cycle, y compris pour
+    un cycle rejoué sans recalcul """
+    simulation = moteur.creer_simulation({"MOTEUR": "parallele", "PROCESSUS": 2}, compiler_regle("B3/S23"), 20, 20)
+    for colonne in (8, 9, 10):
+        moteur.basculer_cellule(simulation, colonne, 9)
+    moteur.demarrer(simulation)
+    simulation["chronometre"] = {}
+    detecteur = periodes.creer_detecteur()
+    periodes.demarrer_detection(detecteur, simulation, periodes.PERIODES_REJEU)
+    try:
+        # Petite zone utile : retour au moteur de référence, qui mesure ses phases
+        periodes.avancer(simulation, detecteur, periodes.PERIODES_REJEU)
+        assert set(simulation["chronometre"]) == {"voisines", "regle", "detourage", "moteur"}
+        for generation in range(10):
+            periodes.avancer(simulation, detecteur, periodes.PERIODES_REJEU)
+        assert detecteur["cycle"] is not None
+        assert set(simulation["chronometre"]) == {"moteur"}
+    finally:
+        moteur.terminer(simulation)
+
+########################################################################
+@pytest.mark.parametrize("nom_moteur", ["hashlife", "creux"])
+def test_regle_b0_refusee(nom_moteur):
+    """ Les règles avec naissance à 0 voisine sont refusées sur plan infini """
+    with pytest.raises(ValueError):
+        moteur.creer_simulation({"MOTEUR": nom_moteur}, compiler_regle("B0123/S23"), 8, 8)
+    simulation = moteur.creer_simulation({"MOTEUR": nom_moteur}, compiler_regle("B3/S23"), 8, 8)
+    with pytest.raises(ValueError):
+        moteur.changer_regle(simulation, compiler_regle("B0/S8"))
+    assert simulation["regle"]["texte"] == "B3/S23"
+    moteur.creer_simulation({"MOTEUR": "python"}, compiler_regle("B0123/S23"), 8, 8)
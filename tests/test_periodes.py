@@ -0,0 +1,30 @@
+""" Tests de la détection des oscillateurs et des vaisseaux (periodes.py) """
+
+import pytest
+
+import moteur
+import periodes
+from bibliotheque import bibliotheque
+from regles import compiler_regle
+
+########################################################################
+@pytest.mark.parametrize("nom_moteur", ["python", "binaire", "tuiles", "creux"])
+@pytest.mark.parametrize("affichage", [True, False])
+@pytest.mark.parametrize("structure, periode, deplacement", [
+    ("Oscillateur : Clignotant", 2, (0, 0)),
+    ("Oscillateur : Pentadécathlon", 15, (0, 0)),
+    ("Vaisseau : Planeur", 4, (1, 1)),
+    ("Vaisseau : Poids plume (LWSS)  ", 4, (2, 0)),
+])
+def test_periode_detectee(nom_moteur, affichage, structure, periode, deplacement):
+    """ La période et le déplacement des oscillateurs et vaisseaux connus sont détectés """
+    simulation = moteur.creer_simulation({"MOTEUR": nom_moteur}, compiler_regle("B3/S23"), 60, 60, affichage)
+    moteur.coller_structure(simulation, bibliotheque[structure], 25, 25)
+    moteur.demarrer(simulation)
+    detecteur = periodes.creer_detecteur()
+    periodes.demarrer_detection(detecteur, simulation)
+    for generation in range(2 * periode):
+        periodes.avancer(simulation, detecteur)
+    assert detecteur["periode"] is not None
+    assert detecteur["periode"]["periode"] == periode
+    assert detecteur["periode"]["deplacement"] == deplacement
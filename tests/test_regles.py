@@ -0,0 +1,94 @@
+""" Tests de la compilation des règles (regles.py) """
+
+import pytest
+
+from regles import BIT_CENTRAL, CONFIGURATIONS_HENSEL, LETTRES_HENSEL, VOISINES_HENSEL, classer_voisinages, compiler_regle, indexer
+
+# Quelques configurations de Hensel bien connues (https://conwaylife.com/wiki/Isotropic_non-totalistic_rule)
+N, NE, E, SE, S, SO, O, NO = VOISINES_HENSEL
+CONNUES = {
+    "1c": (NE,), "1e": (N,),
+    "2a": (N, NE), "2c": (NO, NE), "2e": (N, E), "2i": (N, S), "2k": (N, SO), "2n": (NE, SO),
+    "3a": (NO, N, O), "3c": (NO, NE, SE), "3e": (N, E, O), "3i": (NO, N, NE), "3y": (NO, NE, S),
+    "4c": (NO, NE, SE, SO), "4e": (N, E, S, O), "4i": (NO, N, SO, S), "4t": (NO, N, NE, S), "4z": (NO, N, S, SE)
+}
+
+########################################################################
+def transition(regle, vivante, cases):
+    """ Retourne l'état suivant de la cellule centrale pour les voisines indiquées """
+    index = indexer(cases) | (1 << BIT_CENTRAL if vivante else 0)
+    return regle["voisinage"][index]
+
+########################################################################
+def test_lettres_connues():
+    """ Les configurations bien connues reçoivent la bonne lettre, dans toutes leurs orientations """
+    lettres = classer_voisinages()
+    for nom, cases in CONNUES.items():
+        assert len(cases) == int(nom[0])
+        for dx, dy in ((1, 1), (-1, 1), (1, -1), (-1, -1)):
+            for echange in (False, True):
+                transformees = [(x * dx, y * dy) if not echange else (y * dx, x * dy) for x, y in cases]
+                assert lettres[indexer(transformees)] == nom[1], nom
+
+########################################################################
+def test_partition_et_complements():
+    """ Chaque configuration de 1 à 7 voisines a une lettre, le nombre de classes est celui de la
+    notation de Hensel, et celles de 5 à 7 voisines sont les compléments de celles de 3 à 1 """
+    lettres = classer_voisinages()
+    nombres = {1: 2, 2: 6, 3: 10, 4: 13, 5: 10, 6: 6, 7: 2}
+    for nombre, nb_lettres in nombres.items():
+        assert len(CONFIGURATIONS_HENSEL[nombre]) == nb_lettres
+    for voisines in range(256):
+        cases = [VOISINES_HENSEL[rang] for rang in range(8) if voisines >> rang & 1]
+        complement = [VOISINES_HENSEL[rang] for rang in range(8) if not voisines >> rang & 1]
+        lettre = lettres[indexer(cases)]
+        if len(cases) in (0, 8):
+            assert lettre == ""
+        else:
+            assert lettre in LETTRES_HENSEL[:nombres[len(cases)]]
+        if len(cases) >= 5:
+            assert lettre == lettres[indexer(complement)]
+        assert lettres[indexer(cases) | (1 << BIT_CENTRAL)] == lettre
+
+########################################################################
+def test_regle_hensel_b2_a_s12():
+    """ B2-a/S12 : naissance à 2 voisines sauf adjacentes, survie à 1 ou 2 voisines """
+    regle = compiler_regle("B2-a/S12")
+    assert not regle["totalistique"]
+    assert transition(regle, False, CONNUES["2a"]) == 0
+    for nom in ("2c", "2e", "2i", "2k", "2n"):
+        assert transition(regle, False, CONNUES[nom]) == 1
+    assert transition(regle, False, CONNUES["3i"]) == 0
+    assert transition(regle, True, CONNUES["1c"]) == 1
+    assert transition(regle, True, CONNUES["2a"]) == 1
+    assert transition(regle, True, CONNUES["3e"]) == 0
+    assert transition(regle, True, ()) == 0
+
+########################################################################
+def test_regle_hensel_exclusions():
+    """ B3/S23-q4z : survie à 2 voisines, à 3 sauf q, et à 4 en z uniquement """
+    regle = compiler_regle("B3/S23-q4z")
+    assert regle["survie"] == [2, 3, 4]
+    lettres = classer_voisinages()
+    for voisines in range(256):
+        cases = [VOISINES_HENSEL[rang] for rang in range(8) if voisines >> rang & 1]
+        lettre = lettres[indexer(cases)]
+        attendu = len(cases) == 2 or (len(cases) == 3 and lettre != "q") or (len(cases) == 4 and lettre == "z")
+        assert transition(regle, True, cases) == attendu
+        assert transition(regle, False, cases) == (len(cases) == 3)
+
+########################################################################
+@pytest.mark.parametrize("texte", ["B3/S23", "b3/s23", "23/3", " B3 / S23 ", "S23/B3"])
+def test_notations_conway(texte):
+    """ Les différentes notations du jeu de la vie donnent la même règle totalistique """
+    regle = compiler_regle(texte)
+    assert regle["totalistique"]
+    assert regle["table"] == [[0, 0, 0, 1, 0, 0, 0, 0, 0], [0, 0, 1, 1, 0, 0, 0, 0, 0]]
+    assert regle["voisinage"] == compiler_regle("B3/S23")["voisinage"]
+
+########################################################################
+@pytest.mark.parametrize("texte", ["", "vie", "B3S23", "B9/S23", "B3/S2x", "B2z/S23", "B1e/S8a", "B3/S23/G", "S23/B3x"])
+def test_regles_invalides(texte):
+    """ Les règles mal formées ou aux lettres de Hensel inconnues lèvent ValueError """
+    with pytest.raises(ValueError):
+        compiler_regle(texte)
@@ -3,15 +3,16 @@
 Titre: Le jeu de la Vie
 Auteur: Hubert Tournier
 Création: 29/04/2020
-Version: 1.1 (16/05/2020)
+Version: 1.2 (17/10/2026)
 Description:
 - Une implémentation du jeu de la Vie (https://fr.wikipedia.org/wiki/Jeu_de_la_vie)
-- Ayant pour objectifs la lisibilité (vocation pédagogique - pas d'algorithme sophistiqué type
-  HashLife), donner un exemple d'utilisation de PyGame(https://www.pygame.org/) dans un programme
-  (projet) fonctionnellement assez complet (fichier de configuration, sauvegardes, multi-modes,
-  etc.) mais avec une interface homme-machine minimaliste uniquement dans le bandeau de fenêtre
-  (challenge !), l'idée étant d'utiliser ultérieurement un framework GUI PyGame tel que Simple Game
-  Code (https://program.sambull.org/sgc/)
+- Ayant pour objectifs la lisibilité (vocation pédagogique - les algorithmes sophistiqués type
+  HashLife sont à part dans des moteurs d'évolution optionnels), donner un exemple d'utilisation
+  de PyGame (https://www.pygame.org/) dans un programme (projet) fonctionnellement assez complet
+  (fichier de configuration, sauvegardes, multi-modes, etc.) mais avec une interface homme-machine
+  minimaliste uniquement dans le bandeau de fenêtre (challenge !), l'idée étant d'utiliser
+  ultérieurement un framework GUI PyGame tel que Simple Game Code
+  (https://program.sambull.org/sgc/)
 Crédits:
 - En mémoire de John Horton Conway, 1937-2020 (https://fr.wikipedia.org/wiki/John_Horton_Conway)
 - Le livre "Récréations informatiques", bibliothèque Pour la Science, diffusion Belin, qui m'a fait
@@ -37,22 +38,85 @@ Version 1.1:
   règle des naissances et survies
 - OPTIMISATION: Ne faire évoluer ou détourer que la zone utile de la grille de jeu
 - PRESENTATION: Amélioration conformité PEP8
+Version 1.2:
+- OPTIMISATION: Moteur d'évolution vectorisé optionnel avec NumPy (MOTEUR = numpy)
+- OPTIMISATION: Moteur d'évolution sur plateau compacté en bits (MOTEUR = binaire)
+- FONCTIONNALITE: Moteur d'évolution HashLife sur plan infini, par pas de 2^k générations
+  (MOTEUR = hashlife, PAS_HASHLIFE = k, CACHE_HASHLIFE = nombre maximum de noeuds)
+- FONCTIONNALITE: Moteur d'évolution creux sur plan infini, au coût proportionnel à la population
+  (MOTEUR = creux), le plateau devenant une fenêtre déplaçable avec les flèches
+- OPTIMISATION: Moteur d'évolution par tuiles ne recalculant et ne redessinant que les tuiles
+  modifiées à la génération précédente et leurs voisines (MOTEUR = tuiles)
+- OPTIMISATION: Moteur d'évolution multi-processus par bandes horizontales (MOTEUR = parallele,
+  PROCESSUS = nombre de processus, SEUIL_PARALLELE = taille de zone utile minimale)
+- OPTIMISATION: Ne redessiner à chaque génération que les cellules nées, mortes ou devenues âgées
+- OPTIMISATION: Dessin des cellules par copie d'images précalculées et de la grille vide
+- OPTIMISATION: Dessin par tableau de pixels pour les cases de 1 à 3 pixels (si NumPy est installé)
+- FONCTIONNALITE: Exécution de simulations sans affichage ni PyGame (vie_lot.py), le fichier de
+  configuration et le chargement/sauvegarde des structures étant déplacés dans des modules séparés
+- FONCTIONNALITE: Interface commune aux moteurs d'évolution (moteur.py), importable sans PyGame, les
+  moteurs n'étant importés qu'à leur utilisation
+- OPTIMISATION: Calcul des générations dans une tâche d'arrière-plan à pas fixe, l'affichage de la
+  dernière génération calculée et les événements étant traités 60 fois par seconde
+- FONCTIONNALITE: Vitesse maximale (CYCLE_DE_VIE = 0 ou touche +) sans dessin des générations
+  intermédiaires
+- OPTIMISATION: Règle du jeu compilée une seule fois en tables de transition communes à tous les
+  moteurs d'évolution (regles.py)
+- FONCTIONNALITE: Règles isotropes non totalistiques en notation de Hensel (ex : REGLE = B2-a/S12),
+  adoption de la règle de l'en-tête des fichiers .rle
+- OPTIMISATION: Lecture des fichiers .rle par séquences sans développer les suites de cellules,
+  chargement des seules cellules vivantes dans vie_lot.py, écriture des fichiers ligne par ligne
+- FONCTIONNALITE: Sauvegarde au format Run Length Encoded (fichiers .rle, vie_lot.py -o)
+- OPTIMISATION: Sauvegarde de la dernière partie en arrière-plan, fichiers écrits en une fois dans
+  un fichier temporaire renommé ensuite (jamais de fichier tronqué)
+- OPTIMISATION: Catalogue persistant des fichiers de la bibliothèque (_catalogue_.json) mis à jour
+  en ne relisant que les fichiers ajoutés ou modifiés, parcours instantané en mode Fichier et
+  dernières structures chargées gardées en mémoire (catalogue.py)
+- OPTIMISATION: Cache binaire des structures lues (lignes compactées en bits relues par mmap, sans
+  analyse du texte) et précalcul en parallèle du catalogue et du cache de toute la bibliothèque
+  (python3 catalogue.py), les fichiers illisibles étant signalés et ignorés
+- OPTIMISATION: Installation de la base de formes en arrière-plan, le jeu restant utilisable,
+  avec reprise des téléchargements interrompus (requêtes HTTP Range), vérification facultative de
+  l'empreinte SHA-256 et décompression en flux (installation.py, URL_BIBLIOTHEQUE et
+  EMPREINTE_BIBLIOTHEQUE)
+- OPTIMISATION: Structures de la base de formes lues directement dans l'archive conservée, grâce à
+  l'index de son répertoire central, sans la décompresser en milliers de petits fichiers
+  (EXTRAIRE_BIBLIOTHEQUE = 1 pour la décompresser)
+- FONCTIONNALITE: Mesure des durées par génération du comptage des voisines, de la règle, du
+  détourage, du moteur d'évolution, de l'affichage et des événements (mesures.py), affichées sur
+  la grille de jeu (touche M) et exportées aux formats CSV et JSON (touche X) en mode évolution, ou
+  avec vie_lot.py --mesures
+- FONCTIONNALITE: Banc d'essai reproductible des moteurs d'évolution et de l'affichage sur des
+  structures de la bibliothèque interne et de la base de formes, à plusieurs tailles de plateau
+  (générations par seconde, pic de mémoire, durée d'affichage), avec historique des résultats au
+  format JSON Lines comparés aux précédents (banc_essai.py)
+- FONCTIONNALITE: Détection des oscillateurs et vaisseaux par empreinte glissante des générations
+  (periodes.py), période et déplacement affichés dans le bandeau, avec arrêt de l'évolution ou
+  rejeu du cycle des oscillateurs sans recalcul au choix (PERIODES), et arrêt de vie_lot.py dès
+  la première période détectée (option -p)
+- FONCTIONNALITE: Historique des générations passées en mémoire bornée (historique.py), sous forme
+  d'images clés compressées et des écarts des générations suivantes, parcouru en pause avec les
+  touches Gauche, Droite, PgPréc, PgSuiv, Début et Fin pour reprendre l'évolution à n'importe
+  laquelle sans la recalculer depuis le début (MEMOIRE_HISTORIQUE dans vie.cfg)
+- FONCTIONNALITE: Aller à une génération saisie (touche G) en avance rapide, sans dessiner le
+  plateau ni le bandeau à chaque génération, avec affichage de la progression, interruption
+  possible (Espace) et un seul affichage à la fin, ou par l'historique si elle y est gardée
+- OPTIMISATION: Collage de structure, vidage, comptage des cellules et détourage par tranches de
+  lignes (ou opérations NumPy) au lieu de boucles sur chaque case, avec découpage aux bords du
+  plateau calculé une fois, et un seul affichage du plateau à la restauration de la dernière partie
+- CORRECTION: Sauvegarde d'une grille de jeu vide et chargement d'un fichier sans ligne
+- CORRECTION: Affichage des avertissements et erreurs de chargement de fichiers
 """
 
 import ctypes
 import os
 import platform
-import re
-import shutil
 import sys
+import threading
 import time
-import zipfile
 
 # les imports suivants nécessitent l'installation de composants
 # supplémentaires
-# pip install --trusted-host pypi.org --trusted-host pypi.python.org
-#             --trusted-host files.pythonhosted.org requests
-import requests
 import pygame
 import pygame.locals as GAME_GLOBALS
 import pygame.event as GAME_EVENTS
@@ -60,6 +124,25 @@ import pygame.time as GAME_TIME
 
 from langues import *
 from bibliotheque import *
+from configuration import charger_ou_creer_fichier_de_configuration
+from fichiers import charger_fichier_plaintext, charger_position_dans_fichier_plaintext, sauvegarder_fichier
+from catalogue import charger_catalogue, charger_cellules, charger_structure, mettre_a_jour_catalogue, sauvegarder_catalogue
+from installation import creer_installation, est_installee
+from historique import bornes_historique, creer_historique, demarrer_historique, historiser_generation, restituer_generation, tronquer_historique
+from mesures import PHASES, ajouter_duree, creer_mesures, enregistrer_generation, exporter_mesures, resumer_mesures
+from periodes import PERIODES_ARRET, creer_detecteur, demarrer_detection
+from regles import REGLE_CONWAY, compiler_regle
+from moteur_python import CELLULE_MORTE, CELLULE_NAISSANTE
+import moteur
+import periodes
+
+# le moteur NumPy et l'affichage par tableau de pixels sont optionnels
+# pip install numpy
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
 
 ### Constantes #########################################################
 MODE_EDITION = 0
@@ -69,12 +152,19 @@ MODE_SAISIE = 3
 MODE_CONFIRMATION = 4
 MODE_FICHIER = 5
 MODE_PAUSE = 6
+MODE_GENERATION = 7
+MODE_AVANCE = 8
 
 RESOLUTION_FULL_HD = 1920 # pixels de largeur
 HAUTEUR_BANDEAU_FENETRE = 37 # pixels
 HAUTEUR_MENU_WINDOWS = 54 # pixels
 HAUTEUR_RESERVEE = HAUTEUR_BANDEAU_FENETRE + HAUTEUR_MENU_WINDOWS # pixels
 EPAISSEUR_LIGNE = 1 # pixels
+LARGEUR_CASE_PIXELS = 3 # pixels, largeur de case maximale de l'affichage par tableau de pixels
+IMAGES_PAR_SECONDE = 60 # rafraîchissements de l'affichage
+RAFRAICHISSEMENT_VITESSE_MAXIMALE = 250 # millisecondes entre deux affichages du plateau à vitesse maximale
+RAFRAICHISSEMENT_AVANCE = 250 # millisecondes entre deux affichages de la progression de l'avance rapide
+ATTENTE_CALCUL = 0.01 # secondes, attente maximale de la tâche de calcul entre deux vérifications
 
 NOIR = (0, 0, 0)
 ROUGE = (255, 0, 0)
@@ -82,84 +172,19 @@ VERT = (0, 255, 0)
 BLEU = (0, 0, 255)
 BLANC = (255, 255, 255)
 
-# Valeurs des cases
-CELLULE_MORTE = 0
-CELLULE_NAISSANTE = 1
-# et n = âge de la cellule
-
-FICHIER_CONFIGURATION = "vie.cfg"
 REPERTOIRE_SAUVEGARDE = "bibli"
 TAILLE_NOM_FICHIER = 64 # caractères
+TAILLE_GENERATION = 12 # chiffres
+TAILLE_POLICE_MESURES = 20 # pixels
+GENERATIONS_MESURES = 100 # générations résumées par l'affichage des mesures
+PAS_HISTORIQUE = 100 # générations parcourues d'un coup dans l'historique
 
 ### Bibliothèque de fonctions ##########################################
 
-########################################################################
-def charger_ou_creer_fichier_de_configuration():
-    """ Retourne les paramètres de configuration définis par l'utilisateur dans un fichier """
-    parametres = \
-    {
-        "LANGUE" : "fr",
-        "LARGEUR_CASE" : 9, # pixels
-        "CYCLE_DE_VIE" : 250, # ticks d'horloge
-        "REGLE" : "B3/S23", # en notation B/S (https://www.conwaylife.com/wiki/Rulestring)
-        "DEBUG" : False
-    }
-
-    if os.path.isfile(FICHIER_CONFIGURATION):
-        fichier = open(FICHIER_CONFIGURATION, "r")
-        for ligne_fichier in fichier:
-            expression = re.match(r'^\s*(?P<cle>\w*)\s*=\s*(?P<valeur>[^\s#]*)', ligne_fichier)
-            if expression is not None:
-                cle_valeur = expression.groupdict()
-                if cle_valeur["cle"] is not None and cle_valeur["valeur"] is not None:
-                    if cle_valeur["cle"] == "LANGUE":
-                        parametres["LANGUE"] = cle_valeur["valeur"]
-                    elif cle_valeur["cle"] == "LARGEUR_CASE":
-                        parametres["LARGEUR_CASE"] = int(cle_valeur["valeur"])
-                    elif cle_valeur["cle"] == "CYCLE_DE_VIE":
-                        parametres["CYCLE_DE_VIE"] = int(cle_valeur["valeur"])
-                    elif cle_valeur["cle"] == "REGLE":
-                        parametres["REGLE"] = cle_valeur["valeur"]
-                    elif cle_valeur["cle"] == "DEBUG":
-                        if cle_valeur["valeur"] == "1":
-                            parametres["DEBUG"] = True
-                        else:
-                            parametres["DEBUG"] = False
-    else:
-        fichier = open(FICHIER_CONFIGURATION, "w")
-        fichier.write("# Code de langue parmi 'fr' ou 'en'\n")
-        fichier.write("# Language code between 'fr' or 'en'\n")
-        fichier.write("LANGUE = fr\n")
-        fichier.write("#LANGUE = en\n")
-        fichier.write("\n")
-        fichier.write("# Largeur de cellule en pixels (les valeurs impaires sont préférables)\n")
-        fichier.write("# Cell width in pixels (odd values are better)\n")
-        fichier.write("LARGEUR_CASE = 9\n")
-        fichier.write("#LARGEUR_CASE = 15\n")
-        fichier.write("#LARGEUR_CASE = 19\n")
-        fichier.write("\n")
-        fichier.write("# Cycle de vie en ticks d'horloge (plus petit = plus rapide)\n")
-        fichier.write("# Life cycle in clock ticks (smaller = faster)\n")
-        fichier.write("#CYCLE_DE_VIE = 125\n")
-        fichier.write("CYCLE_DE_VIE = 250\n")
-        fichier.write("#CYCLE_DE_VIE = 500\n")
-        fichier.write("\n")
-        fichier.write("# Règle du jeu en notation B/S (nombre de cellules voisines pour B=naissance/S=survie)\n")
-        fichier.write("# Game's rule in B/S notation (number of neighbouring cells for B=birth/S=survival)\n")
-        fichier.write("REGLE = B3/S23 # John Horton Conway's game of Life\n")
-        fichier.write("#REGLE = B36/S23 # Nathan Thompson's HighLife\n")
-        fichier.write("#REGLE = B3678/S34678 # Nathan Thompson's day & night\n")
-        fichier.write("\n")
-        fichier.write("# Mode de débogage\n")
-        fichier.write("# Debug mode\n")
-        fichier.write("DEBUG = 0 # off\n")
-        fichier.write("#DEBUG = 1 # on\n")
-    fichier.close()
-    return parametres
-
 ########################################################################
 def initialiser_bibliotheque():
-    """ Crée et peuple le répertoire bibliothèque """
+    """ Crée le répertoire bibliothèque et lance si besoin l'installation de la base de formes, dont
+    l'état est retourné (None si elle est déjà installée) """
     if not os.path.exists(REPERTOIRE_SAUVEGARDE):
         os.makedirs(REPERTOIRE_SAUVEGARDE)
 
@@ -176,63 +201,36 @@ def initialiser_bibliotheque():
         fichier.write("OOO\n")
         fichier.close()
 
-    # Téléchargement de la pattern collection depuis le site LifeWiki
-    if not os.path.isfile(REPERTOIRE_SAUVEGARDE + "/_README_.txt"):
-        print("\n" + texte1[parametres["LANGUE"]]["TELECHARGEMENT"])
-        print("...")
-        chrono_1 = time.time()
-        url = 'http://www.conwaylife.com/patterns/all.zip'
-        chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + url.split('/')[-1]
-        requete_http = requests.get(url, stream=True)
-        with open(chemin_fichier, 'wb') as fichier:
-            shutil.copyfileobj(requete_http.raw, fichier)
-        chrono_2 = time.time()
-        print(texte1[parametres["LANGUE"]]["TERMINE"] + str(chrono_2 - chrono_1) + texte1[parametres["LANGUE"]]["SECONDES"])
-
-        # Décompression
-        print("\n" + texte1[parametres["LANGUE"]]["DECOMPRESSION"])
-        print("...")
-        chrono_1 = time.time()
-        with zipfile.ZipFile(chemin_fichier) as fichier_zip:
-            fichier_zip.extractall(REPERTOIRE_SAUVEGARDE)
-        os.remove(chemin_fichier)
-
-        # élimination des doublons entre fichiers .cells et .rle
-        liste_fichiers = [f for f in os.listdir(REPERTOIRE_SAUVEGARDE) if os.path.isfile(os.path.join(REPERTOIRE_SAUVEGARDE, f)) and f.lower().endswith(".cells")]
-        for nom_fichier in liste_fichiers:
-            nom_sans_extension = nom_fichier[:-6]
-            chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + nom_sans_extension + ".rle"
-            if os.path.isfile(chemin_fichier):
-                os.remove(chemin_fichier)
-        chrono_2 = time.time()
-        print(texte1[parametres["LANGUE"]]["TERMINE"] + str(chrono_2 - chrono_1) + texte1[parametres["LANGUE"]]["SECONDES"] + "\n")
+    # Téléchargement et installation de la pattern collection du site LifeWiki en arrière-plan
+    if est_installee(REPERTOIRE_SAUVEGARDE, parametres["URL_BIBLIOTHEQUE"], parametres["EXTRAIRE_BIBLIOTHEQUE"]):
+        return None
+    installation = creer_installation(REPERTOIRE_SAUVEGARDE, parametres["URL_BIBLIOTHEQUE"], parametres["EMPREINTE_BIBLIOTHEQUE"], parametres["EXTRAIRE_BIBLIOTHEQUE"], parametres["LANGUE"])
+    installation["tache"].start()
+    return installation
 
 ########################################################################
-def dessiner_grille():
-    """ Dessine la grille de jeu sans l'afficher """
-    fenetre.fill(BLANC)
+def creer_fond():
+    """ Retourne une surface contenant la grille de jeu vide """
+    fond = pygame.Surface((largeur_fenetre, hauteur_fenetre)).convert()
+    fond.fill(BLANC)
 
     # Dessin des barres verticales
     for i in range(nb_colonnes + 1):
         x = (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) * i
-        pygame.draw.line(fenetre, NOIR, (x, 0), (x, hauteur_fenetre - 1), EPAISSEUR_LIGNE)
+        pygame.draw.line(fond, NOIR, (x, 0), (x, hauteur_fenetre - 1), EPAISSEUR_LIGNE)
 
     # Dessin des barres horizontales
     for j in range(nb_lignes + 1):
         y = (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) * j
-        pygame.draw.line(fenetre, NOIR, (0, y), (largeur_fenetre - 1, y), EPAISSEUR_LIGNE)
+        pygame.draw.line(fond, NOIR, (0, y), (largeur_fenetre - 1, y), EPAISSEUR_LIGNE)
+
+    return fond
 
 ########################################################################
-def dessiner_cellule(colonne, ligne):
-    """ Dessine une cellule dans la grille de jeu sans l'afficher """
-    if plateau[ligne][colonne] == CELLULE_MORTE:
-        couleur = BLANC
-    elif plateau[ligne][colonne] == CELLULE_NAISSANTE:
-        couleur = VERT
-    else:
-        couleur = BLEU
-    x_centre = (colonne * (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE)) + parametres["LARGEUR_CASE"] // 2
-    y_centre = (ligne * (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE)) + parametres["LARGEUR_CASE"] // 2
+def creer_sprites():
+    """ Retourne les images d'une case pour une cellule morte, naissante ou âgée """
+    x_centre = parametres["LARGEUR_CASE"] // 2 - EPAISSEUR_LIGNE
+    y_centre = parametres["LARGEUR_CASE"] // 2 - EPAISSEUR_LIGNE
     rayon = parametres["LARGEUR_CASE"] // 2
     if parametres["LARGEUR_CASE"] % 2 != 0:
         x_centre += 1
@@ -240,7 +238,85 @@ def dessiner_cellule(colonne, ligne):
     else:
         rayon -= 1
     epaisseur = 0 # Cercle plein
-    pygame.draw.circle(fenetre, couleur, (x_centre, y_centre), rayon, epaisseur)
+
+    sprites = []
+    for couleur in (BLANC, VERT, BLEU):
+        sprite = pygame.Surface((parametres["LARGEUR_CASE"], parametres["LARGEUR_CASE"])).convert()
+        if parametres["LARGEUR_CASE"] <= LARGEUR_CASE_PIXELS:
+            # Les cercles seraient invisibles ou méconnaissables : la case est remplie
+            sprite.fill(couleur)
+        else:
+            sprite.fill(BLANC)
+            pygame.draw.circle(sprite, couleur, (x_centre, y_centre), rayon, epaisseur)
+        sprites.append(sprite)
+    return sprites
+
+########################################################################
+def creer_pixels():
+    """ Retourne de quoi convertir la grille de jeu en tableau de pixels pour les petites cases
+    (palette des couleurs, n° de colonne et de ligne de chaque pixel ou -1 pour la grille), ou None """
+    if numpy is None or parametres["LARGEUR_CASE"] > LARGEUR_CASE_PIXELS:
+        return None
+    pas = parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE
+    colonnes = numpy.arange(largeur_fenetre)
+    colonnes = numpy.where(colonnes % pas < EPAISSEUR_LIGNE, -1, colonnes // pas)
+    lignes = numpy.arange(hauteur_fenetre)
+    lignes = numpy.where(lignes % pas < EPAISSEUR_LIGNE, -1, lignes // pas)
+    return {
+        # Couleurs au format de la fenêtre indexées par l'état des cellules (mortes, naissantes,
+        # âgées), puis de la grille
+        "palette": numpy.array([fenetre.map_rgb(couleur) for couleur in (BLANC, VERT, BLEU, NOIR)], dtype=numpy.uint32),
+        "colonnes": colonnes,
+        "lignes": lignes
+    }
+
+########################################################################
+def position_case(colonne, ligne):
+    """ Retourne la position en pixels de l'intérieur d'une case de la grille de jeu """
+    return (
+        colonne * (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) + EPAISSEUR_LIGNE,
+        ligne * (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) + EPAISSEUR_LIGNE
+    )
+
+########################################################################
+def sprite_cellule(colonne, ligne):
+    """ Retourne l'image correspondant à l'état d'une cellule """
+    # Les cellules âgées de plus d'une génération sont toutes de la même couleur
+    return sprites[min(plateau[ligne][colonne], CELLULE_NAISSANTE + 1)]
+
+########################################################################
+def dessiner_pixels(x_1, y_1, x_2, y_2):
+    """ Dessine les cases de la zone indiquée de la grille de jeu par tableau de pixels sans les
+    afficher et retourne le rectangle dessiné """
+    pas = parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE
+    if parametres["MOTEUR"] == "numpy":
+        cases = plateau[y_1:y_2 + 1, x_1:x_2 + 1]
+    else:
+        cases = numpy.array([ligne[x_1:x_2 + 1] for ligne in plateau[y_1:y_2 + 1]])
+
+    # Etats des cellules, bordés d'une colonne et d'une ligne de grille atteintes par l'indice -1
+    etats = numpy.full((x_2 - x_1 + 2, y_2 - y_1 + 2), 3, dtype=numpy.uint8)
+    etats[:-1, :-1] = numpy.minimum(cases, CELLULE_NAISSANTE + 1).T
+
+    # Agrandissement des cases à leur taille en pixels par indexation
+    rectangle = pygame.Rect(position_case(x_1, y_1), ((x_2 - x_1 + 1) * pas - EPAISSEUR_LIGNE, (y_2 - y_1 + 1) * pas - EPAISSEUR_LIGNE))
+    colonnes = pixels["colonnes"][rectangle.left:rectangle.right]
+    lignes = pixels["lignes"][rectangle.top:rectangle.bottom]
+    colonnes = numpy.where(colonnes < 0, -1, colonnes - x_1)
+    lignes = numpy.where(lignes < 0, -1, lignes - y_1)
+    image = pixels["palette"][etats].take(colonnes, axis=0).take(lignes, axis=1)
+    pygame.surfarray.blit_array(fenetre.subsurface(rectangle), image)
+    return rectangle
+
+########################################################################
+def dessiner_grille():
+    """ Dessine la grille de jeu sans l'afficher """
+    fenetre.blit(fond, (0, 0))
+
+########################################################################
+def dessiner_cellule(colonne, ligne):
+    """ Dessine une cellule dans la grille de jeu sans l'afficher """
+    fenetre.blit(sprite_cellule(colonne, ligne), position_case(colonne, ligne))
 
 ########################################################################
 def afficher_ecran():
@@ -251,11 +327,35 @@ def afficher_ecran():
 def afficher_plateau():
     """ Affiche la grille de jeu avec ses cellules """
     dessiner_grille()
+    if pixels is not None:
+        dessiner_pixels(0, 0, nb_colonnes - 1, nb_lignes - 1)
+        afficher_ecran()
+        return
+
+    # Les cellules mortes figurant déjà sur la grille vide, seules les vivantes sont dessinées
+    images = []
     for ligne in range(nb_lignes):
         for colonne in range(nb_colonnes):
-            dessiner_cellule(colonne, ligne)
+            if plateau[ligne][colonne] != CELLULE_MORTE:
+                images.append((sprite_cellule(colonne, ligne), position_case(colonne, ligne)))
+    fenetre.blits(images, False)
     afficher_ecran()
 
+########################################################################
+def afficher_cellules(cellules):
+    """ Affiche les cellules indiquées de la grille de jeu en ne mettant à jour que leurs cases """
+    if pixels is not None:
+        # Les cases englobant les cellules indiquées sont dessinées d'un bloc
+        if cellules:
+            colonnes = [colonne for colonne, ligne in cellules]
+            lignes = [ligne for colonne, ligne in cellules]
+            pygame.display.update(dessiner_pixels(min(colonnes), min(lignes), max(colonnes), max(lignes)))
+        return
+
+    rectangles = fenetre.blits([(sprite_cellule(colonne, ligne), position_case(colonne, ligne)) for colonne, ligne in cellules])
+    if rectangles:
+        pygame.display.update(rectangles)
+
 ########################################################################
 def deplacer_encadre(encadre):
     """ Retourne un objet rect encadrant la nouvelle structure """
@@ -290,626 +390,771 @@ def afficher_bandeau_evolution():
         commandes = texte2[parametres["LANGUE"]][libelles]["MODE_EVOLUTION"]
     else: # if mode == MODE_PAUSE:
         commandes = texte2[parametres["LANGUE"]][libelles]["MODE_PAUSE"]
+    if parametres["CYCLE_DE_VIE"] == 0:
+        vitesse = texte1[parametres["LANGUE"]]["VITESSE_MAXIMALE"]
+    else:
+        vitesse = str(parametres["CYCLE_DE_VIE"])
+    statut = calcul["statut"]
+
+    # Période et déplacement (vaisseaux) de la configuration si elle se répète
+    cycle = ""
+    if calcul["periode"] is not None:
+        cycle = "  " + texte2[parametres["LANGUE"]][libelles]["PERIODE"] + "=" + str(calcul["periode"]["periode"])
+        if calcul["periode"]["deplacement"] != (0, 0):
+            cycle += " " + texte2[parametres["LANGUE"]][libelles]["DEPLACEMENT"] + "=" + str(calcul["periode"]["deplacement"]).replace(" ", "")
 
     if libelles == "long":
         afficher_bandeau(commandes + "  "
-                         + texte2[parametres["LANGUE"]][libelles]["VITESSE"] + "=" + str(parametres["CYCLE_DE_VIE"]) + "  "
-                         + texte2[parametres["LANGUE"]][libelles]["GENERATION"] + "=" + str(generation) + "  "
+                         + texte2[parametres["LANGUE"]][libelles]["VITESSE"] + "=" + vitesse + "  "
+                         + texte2[parametres["LANGUE"]][libelles]["GENERATION"] + "=" + str(calcul["generation"]) + "  "
                          + texte2[parametres["LANGUE"]][libelles]["POPULATION"] + "=" + str(statut["population"]) + " ("
-                         + texte1[parametres["LANGUE"]]["POP_MINIMUM"] + "=" + str(population_min) + "  "
-                         + texte1[parametres["LANGUE"]]["POP_MAXIMUM"] + "=" + str(population_max) + ")  "
+                         + texte1[parametres["LANGUE"]]["POP_MINIMUM"] + "=" + str(calcul["population_min"]) + "  "
+                         + texte1[parametres["LANGUE"]]["POP_MAXIMUM"] + "=" + str(calcul["population_max"]) + ")  "
                          + texte2[parametres["LANGUE"]][libelles]["NAISSANCES"] + "=" + str(statut["naissances"]) + "  "
                          + texte2[parametres["LANGUE"]][libelles]["SURVIE"] + "=" + str(statut["survie"]) + "  "
-                         + texte2[parametres["LANGUE"]][libelles]["DECES"] + "=" + str(statut["deces"]))
+                         + texte2[parametres["LANGUE"]][libelles]["DECES"] + "=" + str(statut["deces"])
+                         + cycle)
     else:
         afficher_bandeau(commandes + " "
-                         + texte2[parametres["LANGUE"]][libelles]["COURT_VITESSE"] + "=" + str(parametres["CYCLE_DE_VIE"]) + " "
-                         + texte2[parametres["LANGUE"]][libelles]["COURT_GENERATION"] + "=" + str(generation) + " "
+                         + texte2[parametres["LANGUE"]][libelles]["COURT_VITESSE"] + "=" + vitesse + " "
+                         + texte2[parametres["LANGUE"]][libelles]["COURT_GENERATION"] + "=" + str(calcul["generation"]) + " "
                          + texte2[parametres["LANGUE"]][libelles]["COURT_POPULATION"] + "=" + str(statut["population"]) + " ["
-                         + str(population_min) + "-"
-                         + str(population_max) + "] "
+                         + str(calcul["population_min"]) + "-"
+                         + str(calcul["population_max"]) + "] "
                          + texte2[parametres["LANGUE"]][libelles]["COURT_NAISSANCES"] + "=" + str(statut["naissances"]) + " "
                          + texte2[parametres["LANGUE"]][libelles]["COURT_SURVIE"] + "=" + str(statut["survie"]) + " "
-                         + texte2[parametres["LANGUE"]][libelles]["COURT_DECES"] + "=" + str(statut["deces"]))
+                         + texte2[parametres["LANGUE"]][libelles]["COURT_DECES"] + "=" + str(statut["deces"])
+                         + cycle)
 
 ########################################################################
-def compter_cellules():
-    """ Retourne le nombre de cellules dans la grille de jeu """
-    nb_cellules = 0
-    for ligne in range(nb_lignes):
-        for colonne in range(nb_colonnes):
-            if not plateau[ligne][colonne] == CELLULE_MORTE:
-                nb_cellules += 1
-    return nb_cellules
+def afficher_bandeau_avance():
+    """ Affiche dans le bandeau de la fenêtre de jeu la progression de l'avance rapide """
+    generation = calcul["generation"]
+    objectif = calcul["objectif"]
+    if objectif is None:
+        return
+    progression = 100 * (generation - calcul["depart"]) // max(objectif - calcul["depart"], 1)
+    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_AVANCE"]
+                     + texte2[parametres["LANGUE"]][libelles]["GENERATION"] + "=" + str(generation) + "/" + str(objectif)
+                     + " (" + str(progression) + "%)")
+
+########################################################################
+def afficher_bandeau_fichier(nom_fichier, regle_structure):
+    """ Affiche le bandeau de la fenêtre de jeu en mode fichier, avec la règle de la structure """
+    if regle_structure is None:
+        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_FICHIER"] + nom_fichier)
+    else:
+        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_FICHIER"] + nom_fichier + " (" + regle_structure + ")")
+
+########################################################################
+def adopter_regle(texte):
+    """ Remplace la règle du jeu par celle indiquée si elle est reconnue """
+    if texte == parametres["REGLE"]:
+        return
+    try:
+        regle = compiler_regle(texte)
+    except ValueError:
+        print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["REGLE_INCONNUE"] + texte)
+        return
+    try:
+        moteur.changer_regle(simulation, regle)
+    except ValueError:
+        print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["REGLE_B0"] + texte)
+        return
+    parametres["REGLE"] = texte
 
 ########################################################################
 def vider_plateau():
     """ Affiche la grille de jeu après en avoir retiré toutes les cellules """
-    for ligne in range(nb_lignes):
-        for colonne in range(nb_colonnes):
-            plateau[ligne][colonne] = CELLULE_MORTE
+    moteur.vider(simulation)
     afficher_plateau()
 
 ########################################################################
-def ligne_vivante(ligne, x_1, x_2):
-    """ Retourne un booléen indiquant si la ligne spécifiée contient au moins une cellule vivante """
-    for colonne in range(x_1, x_2 + 1):
-        if plateau[ligne][colonne] != CELLULE_MORTE:
-            return True
-    return False
+def coller_structure(structure, colonne_plateau, ligne_plateau):
+    """ Affiche la grille de jeu après y avoir recopié une structure à la position indiquée """
+    moteur.coller_structure(simulation, structure, colonne_plateau, ligne_plateau)
+    afficher_plateau()
 
 ########################################################################
-def colonne_vivante(colonne, y_1, y_2):
-    """ Retourne un booléen indiquant si la colonne spécifiée contient au moins une cellule vivante """
-    for ligne in range(y_1, y_2 + 1):
-        if plateau[ligne][colonne] != CELLULE_MORTE:
-            return True
-    return False
+def coller_cellules(cellules, colonne_plateau, ligne_plateau):
+    """ Affiche la grille de jeu après y avoir fait naître les cellules (colonne, ligne) d'une
+    structure à la position indiquée """
+    moteur.coller_cellules(simulation, cellules, colonne_plateau, ligne_plateau)
+    afficher_plateau()
 
 ########################################################################
-def detourer_plateau(x_1, y_1, x_2, y_2):
-    """ Retourne la zone utile de la grille de jeu """
-    zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
-    for colonne in range(x_1, x_2 + 1):
-        if colonne_vivante(colonne, y_1, y_2):
-            zone_utile["X_1"] = colonne
-            break
-    if zone_utile["X_1"] == -1:
-        # Rien à sauvegarder !
-        return zone_utile
-    for colonne in range(x_2, x_1 - 1, -1):
-        if colonne_vivante(colonne, y_1, y_2):
-            zone_utile["X_2"] = colonne
-            break
-    for ligne in range(y_1, y_2 + 1):
-        if ligne_vivante(ligne, x_1, x_2):
-            zone_utile["Y_1"] = ligne
-            break
-    for ligne in range(y_2, y_1 - 1, -1):
-        if ligne_vivante(ligne, x_1, x_2):
-            zone_utile["Y_2"] = ligne
-            break
-    return zone_utile
-
-########################################################################
-def evolution(zone_utile):
-    """ Applique la règle d'évolution configurée à la grille de jeu """
-    chrono_1 = time.time()
-
-    population = 0
-    naissances = 0
-    survie = 0
-    deces = 0
-
-    # Créer un tableau pour compter les cellules voisines
-    voisines = []
-    for i in range(nb_lignes):
-        ligne = []
-        for j in range(nb_colonnes):
-            ligne.append(0)
-        voisines.append(ligne.copy())
-
-    # Le peupler en une seule passe, sans réexaminer plusieurs fois une
-    # même cellule et en ne parcourant que la zone utile
-    for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1):
-        for colonne in range(zone_utile["X_1"], zone_utile["X_2"] + 1):
-            if plateau[ligne][colonne] != CELLULE_MORTE:
-                if ligne > 0:
-                    if colonne > 0:
-                        voisines[ligne - 1][colonne - 1] += 1
-                    voisines[ligne - 1][colonne] += 1
-                    if colonne < nb_colonnes - 1:
-                        voisines[ligne - 1][colonne + 1] += 1
-                if colonne > 0:
-                    voisines[ligne][colonne - 1] += 1
-                if colonne < nb_colonnes - 1:
-                    voisines[ligne][colonne + 1] += 1
-                if ligne < nb_lignes - 1:
-                    if colonne > 0:
-                        voisines[ligne + 1][colonne - 1] += 1
-                    voisines[ligne + 1][colonne] += 1
-                    if colonne < nb_colonnes - 1:
-                        voisines[ligne + 1][colonne + 1] += 1
-
-    # Implémentation de la règle du jeu indiquée dans la zone utile
-    # avec une marge supplémentaire d'une colonne/ligne
-    ligne_depart = zone_utile["Y_1"] - 1
-    if ligne_depart < 0:
-        ligne_depart = 0
-    ligne_arrivee = zone_utile["Y_2"] + 1
-    if ligne_arrivee >= nb_lignes:
-        ligne_arrivee = nb_lignes - 1
-    colonne_depart = zone_utile["X_1"] - 1
-    if colonne_depart < 0:
-        colonne_depart = 0
-    colonne_arrivee = zone_utile["X_2"] + 1
-    if colonne_arrivee >= nb_colonnes:
-        colonne_arrivee = nb_colonnes - 1
-    for ligne in range(ligne_depart, ligne_arrivee + 1):
-        for colonne in range(colonne_depart, colonne_arrivee + 1):
-            if plateau[ligne][colonne] == CELLULE_MORTE:
-                if voisines[ligne][colonne] in regle_naissance:
-                    plateau[ligne][colonne] = CELLULE_NAISSANTE
-                    population += 1
-                    naissances += 1
-            else:
-                if voisines[ligne][colonne] in regle_survie:
-                    plateau[ligne][colonne] += 1
-                    population += 1
-                    survie += 1
-                else:
-                    plateau[ligne][colonne] = CELLULE_MORTE
-                    deces += 1
+def deplacer_fenetre(touche):
+    """ Affiche la grille de jeu après avoir déplacé d'un quart d'écran la fenêtre sur l'univers
+    (la tâche de calcul devant être arrêtée ou son verrou détenu) """
+    if touche == pygame.K_LEFT:
+        moteur.deplacer(simulation, -(nb_colonnes // 4), 0)
+    elif touche == pygame.K_RIGHT:
+        moteur.deplacer(simulation, nb_colonnes // 4, 0)
+    elif touche == pygame.K_UP:
+        moteur.deplacer(simulation, 0, -(nb_lignes // 4))
+    elif touche == pygame.K_DOWN:
+        moteur.deplacer(simulation, 0, nb_lignes // 4)
+    calcul["modifications"].clear()
+    calcul["plateau_modifie"] = False
     afficher_plateau()
 
-    # Redéfinition de la zone utile
-    zone_utile = detourer_plateau(colonne_depart, ligne_depart, colonne_arrivee, ligne_arrivee)
+########################################################################
+def revenir_generation(generation):
+    """ Affiche une génération gardée dans l'historique (la tâche de calcul devant être arrêtée ou
+    son verrou détenu) """
+    if bornes_historique(historique) is None:
+        return
+    resultat = restituer_generation(historique, simulation, generation)
+    calcul["statut"] = resultat["statut"]
+    calcul["generation"] = simulation["generation"]
+    calcul["periode"] = None
+    calcul["modifications"].update(resultat["modifications"])
+    calcul["nouveau"] = True
+
+########################################################################
+def reprendre_evolution():
+    """ Remet l'évolution en marche (la tâche de calcul devant être arrêtée ou son verrou détenu) """
+    if historique["affichee"] is not None:
+        # L'évolution reprend à la génération affichée, les suivantes étant oubliées
+        tronquer_historique(historique)
+        moteur.reprendre(simulation, simulation["generation"])
+        demarrer_detection(detecteur, simulation, parametres["PERIODES"])
+    calcul["actif"] = True
+
+########################################################################
+def atteindre_generation(generation):
+    """ Affiche la génération indiquée si elle est gardée dans l'historique, ou la calcule en avance
+    rapide et retourne un booléen indiquant si c'est le cas (la tâche de calcul devant être arrêtée
+    ou son verrou détenu) """
+    bornes = bornes_historique(historique)
+    if (bornes is not None and generation <= bornes[1]) or generation <= simulation["generation"]:
+        revenir_generation(generation)
+        return False
+    calcul["objectif"] = generation
+    calcul["depart"] = simulation["generation"]
+    reprendre_evolution()
+    return True
 
-    chrono_2 = time.time()
+########################################################################
+def evolution():
+    """ Applique la règle d'évolution configurée à la grille de jeu """
+    # Les oscillateurs et vaisseaux sont détectés au passage (et le cycle des oscillateurs
+    # éventuellement rejoué sans recalcul)
+    resultat = periodes.avancer(simulation, detecteur, parametres["PERIODES"])
+    historiser_generation(historique, simulation, resultat)
+
+    # Les durées des phases mesurées par le moteur d'évolution sont enregistrées dans les mesures
+    duree = simulation["chronometre"]["moteur"]
+    enregistrer_generation(mesures, simulation["generation"], simulation["chronometre"])
     if parametres["DEBUG"]:
-        print(texte1[parametres["LANGUE"]]["CYCLE_EVOLUTION"] + str(chrono_2 - chrono_1) + texte1[parametres["LANGUE"]]["SECONDES"])
+        print(texte1[parametres["LANGUE"]]["CYCLE_EVOLUTION"] + str(duree / 1e9) + texte1[parametres["LANGUE"]]["SECONDES"])
+        if parametres["MOTEUR"] == "hashlife":
+            cache = simulation["module"].statistiques(simulation["univers"])
+            print(texte1[parametres["LANGUE"]]["CACHE_HASHLIFE"]
+                  + texte1[parametres["LANGUE"]]["NOEUDS"] + "=" + str(cache["noeuds"]) + " "
+                  + texte1[parametres["LANGUE"]]["RESULTATS"] + "=" + str(cache["resultats"]) + " "
+                  + texte1[parametres["LANGUE"]]["TAUX_SUCCES"] + "=" + str(round(cache["taux_succes"] * 100, 1)) + "% "
+                  + texte1[parametres["LANGUE"]]["COLLECTES"] + "=" + str(cache["collectes"]) + " "
+                  + texte1[parametres["LANGUE"]]["MEMOIRE"] + "=" + str(cache["memoire"] // 1024) + " Ko")
+
+    return resultat
 
-    return {
-        "statut": {"population": population, "naissances": naissances, "survie": survie, "deces": deces},
-        "zone_utile": zone_utile
-        }
+########################################################################
+def sauvegarder_derniere_partie(zone_utile, sauvegarde_precedente):
+    """ Sauvegarde en arrière-plan la configuration de départ de la partie et retourne la tâche de
+    sauvegarde """
+    # Seule la recopie de la zone utile est faite ici, le plateau évoluant dès le retour
+    structure = [list(plateau[ligne][zone_utile["X_1"]:zone_utile["X_2"] + 1]) for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1)]
+    zone_structure = {"X_1": 0, "Y_1": 0, "X_2": zone_utile["X_2"] - zone_utile["X_1"], "Y_2": zone_utile["Y_2"] - zone_utile["Y_1"]}
+    if sauvegarde_precedente is not None:
+        sauvegarde_precedente.join()
+
+    nom_fichier = texte1[parametres["LANGUE"]]["DERNIERE_PARTIE"]
+    chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + nom_fichier + ".cells"
+    sauvegarde = threading.Thread(target=sauvegarder_fichier, args=(chemin_fichier, nom_fichier, structure, zone_structure, (zone_utile["X_1"], zone_utile["Y_1"])))
+    sauvegarde.start()
+    return sauvegarde
 
 ########################################################################
-def sauvegarder_fichier(chemin_fichier):
-    """ Sauvegarde la zone utile de la grille de jeu dans un fichier au format Plain Text """
-    if not os.path.exists(REPERTOIRE_SAUVEGARDE):
-        os.makedirs(REPERTOIRE_SAUVEGARDE)
-    fichier = open(chemin_fichier, "w")
-    fichier.write("!Name: " + nom_fichier + "\n")
-    fichier.write("!Position: " + str(zone_utile["X_1"]) + "," + str(zone_utile["Y_1"]) + "\n")
-    fichier.write("!\n")
-    for ligne in range(zone_utile["Y_1"], zone_utile["Y_2"] + 1):
-        for colonne in range(zone_utile["X_1"], zone_utile["X_2"] + 1):
-            if plateau[ligne][colonne] == CELLULE_MORTE:
-                fichier.write(".")
-            else:
-                fichier.write("O")
-        fichier.write("\n")
-    fichier.close()
-
-########################################################################
-def charger_fichier_plaintext(chemin_fichier):
-    """ Retourne la structure contenue dans un fichier au format Plain Text (.cells) """
-    structure = []
-    no_ligne = 0
-    max_colonnes = 0
-    fichier = open(chemin_fichier, "r")
-    for ligne_fichier in fichier:
-        no_ligne += 1
-        ligne_fichier = ligne_fichier.strip()
-        if not ligne_fichier.startswith("!"):
-            if len(ligne_fichier) > max_colonnes:
-                max_colonnes = len(ligne_fichier)
-            ligne = []
-            for caractere in ligne_fichier:
-                if caractere == '.':
-                    ligne.append(CELLULE_MORTE)
-                elif caractere == "O":
-                    ligne.append(CELLULE_NAISSANTE)
-                elif caractere == "*":
-                    ligne.append(CELLULE_NAISSANTE)
-                    print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["FICHIER"] + "=" + chemin_fichier + " " + texte1[parametres["LANGUE"]]["no_ligne"] + "=" + str(no_ligne) + " " + texte1[parametres["LANGUE"]]["LIGNE"] + "=" + ligne_fichier)
-                else:
-                    print(texte1[parametres["LANGUE"]]["ERREUR"] + ": " + texte1[parametres["LANGUE"]]["FICHIER"] + "=" + chemin_fichier + " " + texte1[parametres["LANGUE"]]["no_ligne"] + "=" + str(no_ligne) + " " + texte1[parametres["LANGUE"]]["LIGNE"] + "=" + ligne_fichier)
-                    break
-            structure.append(ligne.copy())
-    fichier.close()
-
-    # Certains fichiers du LifeWiki ne respectent pas la spécification sur
-    # https://www.conwaylife.com/wiki/Plaintext et ne mentionnent pas les cellules mortes en fin de
-    # ligne, ni les lignes composées uniquement de cellules mortes
-    # Maintenant que l'on connaît la largeur maximale de la structure on les rajoute
-    for ligne in range(len(structure)):
-        cellules_manquantes = max_colonnes - len(structure[ligne])
-        if cellules_manquantes > 0:
-            for i in range(cellules_manquantes):
-                structure[ligne].append(CELLULE_MORTE)
-
-    return structure
-
-########################################################################
-def charger_position_dans_fichier_plaintext(chemin_fichier):
-    """ Retourne la position indiquée dans un fichier au format Plain Text """
-    position = (0, 0)
-    fichier = open(chemin_fichier, "r")
-    for ligne_fichier in fichier:
-        ligne_fichier = ligne_fichier.strip()
-        if ligne_fichier.startswith("!Position: "):
-            resultat = ligne_fichier.split(" ")[1].split(",")
-            position = (int(resultat[0]), int(resultat[1]))
-    fichier.close()
-    return position
-
-########################################################################
-def charger_fichier_run_length_encoded(chemin_fichier):
-    """ Retourne la structure contenue dans un fichier au format Run Length Encoded (.rle) """
-    structure = []
-    ligne = []
-    nb_cellules = 0
-    nb_lignes = 0
-    nombre = 0
-    fin = False
-    no_ligne = 0
-    fichier = open(chemin_fichier, "r")
-    for ligne_fichier in fichier:
-        no_ligne += 1
-        ligne_fichier = ligne_fichier.strip()
-        if ligne_fichier == "" or ligne_fichier.startswith("#"):
+def creer_calcul():
+    """ Retourne l'état partagé entre la boucle d'affichage et la tâche de calcul des générations """
+    calcul = {
+        "verrou": threading.Lock(),
+        "actif": False, # évolution en marche
+        "termine": False,
+        "statut": {"population": 0, "naissances": 0, "survie": 0, "deces": 0},
+        "generation": 1,
+        "population_min": 0,
+        "population_max": 0,
+        "periode": None, # cycle détecté (période et déplacement) si la configuration se répète
+        "objectif": None, # génération à atteindre en avance rapide
+        "depart": 1, # génération de départ de l'avance rapide
+        "nouveau": False, # génération pas encore affichée
+        "modifications": set(), # cases à redessiner
+        "plateau_modifie": False # plateau à réafficher en entier (vitesse maximale)
+    }
+    calcul["tache"] = threading.Thread(target=calculer, args=(calcul,), daemon=True)
+    return calcul
+
+########################################################################
+def calculer(calcul):
+    """ Calcule les générations en arrière-plan à pas fixe, ou au plus vite si le cycle de vie est nul
+    (exécuté dans la tâche de calcul) """
+    echeance = time.perf_counter()
+    while not calcul["termine"]:
+        cycle = parametres["CYCLE_DE_VIE"] / 1000
+        if calcul["objectif"] is not None:
+            cycle = 0
+        attente = echeance - time.perf_counter()
+        if cycle > 0 and attente > 0:
+            time.sleep(min(attente, ATTENTE_CALCUL))
             continue
-        elif ligne_fichier.startswith("x"):
-            expression = re.match(r'^\s*x\s*=\s*(?P<x>\d*)\s*,\s*y\s*=\s*(?P<y>\d*)(\s*,\s*rule\s*=\s*(?P<rule>[bB]\d*/[sS]\d*))?', ligne_fichier)
-            if expression is not None:
-                en_tete = expression.groupdict()
-                largeur_structure = int(en_tete["x"])
-                hauteur_structure = int(en_tete["y"])
-            else:
-                print(texte1[parametres["LANGUE"]]["ERREUR"] + ": " + texte1[parametres["LANGUE"]]["FICHIER"] + "=" + chemin_fichier + " " + texte1[parametres["LANGUE"]]["no_ligne"] + "=" + str(no_ligne) + " " + texte1[parametres["LANGUE"]]["LIGNE"] + "=" + ligne_fichier)
+
+        # Evolution s'il reste une cellule en vie et qu'on ne soit pas arrivé en stase
+        with calcul["verrou"]:
+            statut = calcul["statut"]
+            evolue = calcul["actif"] and calcul["population_min"] > 0 and not (statut["naissances"] == 0 and statut["deces"] == 0) \
+                     and not (parametres["PERIODES"] == PERIODES_ARRET and calcul["periode"] is not None)
+            avance = calcul["objectif"] is not None
+            if evolue:
+                resultat = evolution()
+                statut = resultat["statut"]
+                calcul["statut"] = statut
+                calcul["generation"] = simulation["generation"]
+                calcul["population_min"] = min(calcul["population_min"], statut["population"])
+                calcul["population_max"] = max(calcul["population_max"], statut["population"])
+                calcul["periode"] = detecteur["periode"]
+                # En avance rapide, rien n'est dessiné avant la fin, et à vitesse maximale, les
+                # générations intermédiaires ne sont pas dessinées
+                if not avance and cycle == 0:
+                    calcul["plateau_modifie"] = True
+                    calcul["nouveau"] = True
+                elif not avance:
+                    calcul["modifications"].update(resultat["modifications"])
+                    calcul["nouveau"] = True
+            if avance and (not evolue or simulation["generation"] >= calcul["objectif"]):
+                # Génération atteinte (ou évolution arrêtée avant) : le plateau est dessiné une fois
+                calcul["objectif"] = None
+                calcul["actif"] = False
+                calcul["modifications"].clear()
+                calcul["plateau_modifie"] = True
+                calcul["nouveau"] = True
+
+        if evolue:
+            # Pas fixe, sans chercher à rattraper plus d'un cycle de retard
+            echeance = max(echeance + cycle, time.perf_counter() - cycle)
+            # Laisse la main à la boucle d'affichage entre deux générations
+            time.sleep(0)
         else:
-            for caractere in ligne_fichier:
-                if caractere in (' ', '\\t'):
-                    continue
-                elif caractere >= "0" and caractere <= "9":
-                    nombre = (nombre * 10) + int(caractere)
-                elif caractere in ('b', 'B'):
-                    if nombre == 0:
-                        nombre = 1
-                    for i in range(nombre):
-                        ligne.append(CELLULE_MORTE)
-                        nb_cellules += 1
-                    nombre = 0
-                elif caractere in ('o', 'O'):
-                    if nombre == 0:
-                        nombre = 1
-                    for i in range(nombre):
-                        ligne.append(CELLULE_NAISSANTE)
-                        nb_cellules += 1
-                    nombre = 0
-                elif caractere == '$':
-                    if nombre == 0:
-                        nombre = 1
-                    for j in range(nombre):
-                        for i in range(nb_cellules, largeur_structure):
-                            ligne.append(CELLULE_MORTE)
-                        nb_cellules = 0
-                        structure.append(ligne.copy())
-                        ligne = []
-                        nb_lignes = nb_lignes + 1
-                    nombre = 0
-                elif caractere == '!':
-                    for i in range(nb_cellules, largeur_structure):
-                        ligne.append(CELLULE_MORTE)
-                    nb_cellules = 0
-                    structure.append(ligne.copy())
-                    ligne = []
-                    nb_lignes = nb_lignes + 1
-                    for j in range(nb_lignes, hauteur_structure):
-                        for i in range(largeur_structure):
-                            ligne.append(CELLULE_MORTE)
-                        structure.append(ligne.copy())
-                        ligne = []
-                    fin = True
-                    break
-                else:
-                    print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["FICHIER"] + "=" + chemin_fichier + " " + texte1[parametres["LANGUE"]]["no_ligne"] + "=" + str(no_ligne) + " " + texte1[parametres["LANGUE"]]["LIGNE"] + "=" + ligne_fichier)
-                    break
-        if fin:
-            break
-    fichier.close()
-    return structure
-
-########################################################################
-def charger_fichier(chemin_fichier):
-    """ Retourne la structure contenue dans un fichier """
-    if chemin_fichier.lower().endswith(".cells"):
-        return charger_fichier_plaintext(chemin_fichier)
-    elif chemin_fichier.lower().endswith(".rle"):
-        return charger_fichier_run_length_encoded(chemin_fichier)
+            time.sleep(ATTENTE_CALCUL)
+            echeance = time.perf_counter()
+
+########################################################################
+def afficher_calcul(dernier_affichage):
+    """ Affiche la dernière génération calculée et retourne l'heure du dernier affichage complet du
+    plateau """
+    # Si une génération est en cours de calcul, on affichera la suivante
+    if not calcul["verrou"].acquire(blocking=False):
+        return dernier_affichage
+    debut = time.perf_counter_ns()
+    try:
+        nouveau = calcul["nouveau"]
+        if calcul["nouveau"]:
+            calcul["nouveau"] = False
+            afficher_bandeau_evolution()
+        if calcul["modifications"]:
+            # Seules les cases dont la couleur a changé sont redessinées
+            afficher_cellules(list(calcul["modifications"]))
+            calcul["modifications"].clear()
+        horloge = GAME_TIME.get_ticks()
+        if calcul["plateau_modifie"] \
+        and (parametres["CYCLE_DE_VIE"] > 0 or mode == MODE_PAUSE or horloge - dernier_affichage >= RAFRAICHISSEMENT_VITESSE_MAXIMALE):
+            calcul["plateau_modifie"] = False
+            afficher_plateau()
+            dernier_affichage = horloge
+            nouveau = True
+        if police_mesures is not None and nouveau:
+            afficher_mesures()
+    finally:
+        calcul["verrou"].release()
+    if mode == MODE_EVOLUTION:
+        ajouter_duree(mesures, "affichage", time.perf_counter_ns() - debut)
+    return dernier_affichage
+
+########################################################################
+def afficher_mesures():
+    """ Affiche en haut à gauche de la grille de jeu la durée moyenne de chaque phase des dernières
+    générations """
+    resume = resumer_mesures(mesures, GENERATIONS_MESURES)
+    lignes = [str(resume["generations"]) + " " + texte1[parametres["LANGUE"]]["GENERATIONS"]]
+    for phase in PHASES:
+        lignes.append(texte1[parametres["LANGUE"]]["MESURE_" + phase.upper()] + " : " + format(resume[phase] / 1e6, ".3f") + " ms")
+    images = [police_mesures.render(ligne, True, BLANC, NOIR) for ligne in lignes]
+    hauteur = police_mesures.get_linesize()
+    cadre = pygame.Rect(0, 0, max(image.get_width() for image in images) + 2 * EPAISSEUR_LIGNE, len(images) * hauteur + 2 * EPAISSEUR_LIGNE)
+    fenetre.fill(NOIR, cadre)
+    fenetre.blits([(image, (EPAISSEUR_LIGNE, EPAISSEUR_LIGNE + rang * hauteur)) for rang, image in enumerate(images)], False)
+    pygame.display.update(cadre)
+
+########################################################################
+def exporter_mesures_partie():
+    """ Sauvegarde les durées des phases des dernières générations aux formats CSV et JSON dans le
+    répertoire de sauvegarde """
+    chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + texte1[parametres["LANGUE"]]["MESURES"]
+    contexte = {
+        "moteur": parametres["MOTEUR"],
+        "regle": parametres["REGLE"],
+        "colonnes": nb_colonnes,
+        "lignes": nb_lignes,
+        "cycle_de_vie": parametres["CYCLE_DE_VIE"]
+    }
+    exporter_mesures(chemin_fichier + ".csv", mesures)
+    exporter_mesures(chemin_fichier + ".json", mesures, contexte)
 
 ### Programme principal ################################################
 
-# Création du fichier de configuration et du répertoire de sauvegarde
-parametres = charger_ou_creer_fichier_de_configuration()
-initialiser_bibliotheque()
-
-# Fenêtre positionnée en haut à gauche de l'écran (à faire avant l'initialisation de PyGame)
-# décalée du bandeau de fenêtre
-os.environ['SDL_VIDEO_WINDOW_POS'] = "0," + str(HAUTEUR_BANDEAU_FENETRE)
-
-pygame.init()
-
-# Initialisation de l'écran et de la fenêtre de jeu
-if platform.system() == "Windows":
-    # La fonction suivante évite que Windows ne mette la fenêtre à l'échelle ce qui fausse les calculs de pixels
-    ctypes.windll.user32.SetProcessDPIAware()
-    largeur_ecran = ctypes.windll.user32.GetSystemMetrics(0)
-    hauteur_ecran = ctypes.windll.user32.GetSystemMetrics(1)
-    ecran = (largeur_ecran, hauteur_ecran)
-else:
-    ecran = pygame.display.Info()
-    largeur_ecran = ecran.current_w
-    hauteur_ecran = ecran.current_h
-largeur_fenetre = largeur_ecran
-hauteur_fenetre = hauteur_ecran - HAUTEUR_RESERVEE
-if largeur_ecran >= RESOLUTION_FULL_HD:
-    libelles = "long"
-else:
-    libelles = "court"
-
-# Initialisation du plateau de jeu
-nb_colonnes = ((largeur_fenetre + EPAISSEUR_LIGNE) // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-nb_lignes = ((hauteur_fenetre + EPAISSEUR_LIGNE) // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-plateau = []
-for i in range(nb_lignes):
-    ligne = []
-    for j in range(nb_colonnes):
-        ligne.append(0)
-    plateau.append(ligne.copy())
-
-# Initialisation de l'interface graphique
-# et redimensionnement de la fenêtre au nombre de cases affichables
-mode = MODE_EDITION
-largeur_fenetre = EPAISSEUR_LIGNE + (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) * nb_colonnes
-hauteur_fenetre = EPAISSEUR_LIGNE + (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) * nb_lignes
-fenetre = pygame.display.set_mode((largeur_fenetre, hauteur_fenetre))
-afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
-afficher_plateau()
-
-# Initialisation de la règle du jeu
-expression = re.match(r'^B(?P<naissance>\d*)/S(?P<survie>\d*)$', parametres["REGLE"])
-regle = expression.groupdict()
-regle_naissance = []
-for caractere in regle["naissance"]:
-    regle_naissance.append(int(caractere))
-regle_survie = []
-for caractere in regle["survie"]:
-    regle_survie.append(int(caractere))
-
-# Boucle principale du programme
-programme_termine = False
-derniere_evolution = GAME_TIME.get_ticks()
-encadre = (0, 0, 1, 1)
-zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
-while not programme_termine:
-
-    horloge = GAME_TIME.get_ticks()
-    # Evolution si le moment est venu, qu'il reste une cellule en vie et qu'on ne soit pas arrivé en stase
-    if mode == MODE_EVOLUTION and horloge - derniere_evolution > parametres["CYCLE_DE_VIE"] and population_min > 0 and not (statut["naissances"] == 0 and statut["deces"] == 0):
-        derniere_evolution = horloge
-        generation += 1
-        resultat = evolution(zone_utile)
-        statut = resultat["statut"]
-        zone_utile = resultat["zone_utile"]
-        if statut["population"] < population_min:
-            population_min = statut["population"]
-        elif statut["population"] > population_max:
-            population_max = statut["population"]
-        afficher_bandeau_evolution()
-
-    for event in GAME_EVENTS.get():
-        if event.type == pygame.MOUSEMOTION:
-            position_souris = event.pos
-            if mode == MODE_BIBLIOTHEQUE or mode == MODE_FICHIER:
-                encadre = deplacer_encadre(encadre)
-
-        if event.type == pygame.MOUSEBUTTONUP:
-            colonne = (position_souris[0] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-            ligne = (position_souris[1] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-            if mode == MODE_EDITION:
-                if plateau[ligne][colonne] == CELLULE_MORTE:
-                    plateau[ligne][colonne] = CELLULE_NAISSANTE
-                else:
-                    plateau[ligne][colonne] = CELLULE_MORTE
-                dessiner_cellule(colonne, ligne)
-                afficher_ecran()
-
-        if event.type == pygame.KEYDOWN:
-
-            if event.type == GAME_GLOBALS.QUIT: # Quitter
-                programme_termine = True
+# Protection nécessaire au moteur parallèle : sous Windows, ses processus de calcul réimportent ce
+# module
+if __name__ == "__main__":
+    # Création du fichier de configuration et du répertoire de sauvegarde
+    parametres = charger_ou_creer_fichier_de_configuration()
+    if parametres["MOTEUR"] == "numpy" and numpy is None:
+        print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["MOTEUR_INDISPONIBLE"] + parametres["MOTEUR"])
+        parametres["MOTEUR"] = "python"
+    installation = initialiser_bibliotheque()
+    catalogue = charger_catalogue(REPERTOIRE_SAUVEGARDE, parametres["LANGUE"])
+
+    # Fenêtre positionnée en haut à gauche de l'écran (à faire avant l'initialisation de PyGame)
+    # décalée du bandeau de fenêtre
+    os.environ['SDL_VIDEO_WINDOW_POS'] = "0," + str(HAUTEUR_BANDEAU_FENETRE)
+
+    pygame.init()
+
+    # Initialisation de l'écran et de la fenêtre de jeu
+    if platform.system() == "Windows":
+        # La fonction suivante évite que Windows ne mette la fenêtre à l'échelle ce qui fausse les calculs de pixels
+        ctypes.windll.user32.SetProcessDPIAware()
+        largeur_ecran = ctypes.windll.user32.GetSystemMetrics(0)
+        hauteur_ecran = ctypes.windll.user32.GetSystemMetrics(1)
+        ecran = (largeur_ecran, hauteur_ecran)
+    else:
+        ecran = pygame.display.Info()
+        largeur_ecran = ecran.current_w
+        hauteur_ecran = ecran.current_h
+    largeur_fenetre = largeur_ecran
+    hauteur_fenetre = hauteur_ecran - HAUTEUR_RESERVEE
+    if largeur_ecran >= RESOLUTION_FULL_HD:
+        libelles = "long"
+    else:
+        libelles = "court"
+
+    # Initialisation du plateau de jeu
+    nb_colonnes = ((largeur_fenetre + EPAISSEUR_LIGNE) // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+    nb_lignes = ((hauteur_fenetre + EPAISSEUR_LIGNE) // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+    # Sur plan infini, le plateau est une fenêtre sur l'univers du moteur d'évolution
+    try:
+        regle = compiler_regle(parametres["REGLE"])
+    except ValueError:
+        print(texte1[parametres["LANGUE"]]["ERREUR"] + ": " + texte1[parametres["LANGUE"]]["REGLE_INCONNUE"] + parametres["REGLE"])
+        parametres["REGLE"] = REGLE_CONWAY
+        regle = compiler_regle(parametres["REGLE"])
+    try:
+        moteur.verifier_regle(parametres["MOTEUR"], regle)
+    except ValueError:
+        print(texte1[parametres["LANGUE"]]["ERREUR"] + ": " + texte1[parametres["LANGUE"]]["REGLE_B0"] + parametres["REGLE"])
+        parametres["REGLE"] = REGLE_CONWAY
+        regle = compiler_regle(parametres["REGLE"])
+    simulation = moteur.creer_simulation(parametres, regle, nb_lignes, nb_colonnes)
+    plateau = simulation["plateau"]
+
+    # Durées des phases des dernières générations, affichées à la demande sur la grille de jeu
+    mesures = creer_mesures()
+    simulation["chronometre"] = {}
+    # Empreintes des dernières générations pour détecter les oscillateurs et vaisseaux
+    detecteur = creer_detecteur()
+    # Générations passées, pour revenir en arrière pendant une pause
+    historique = creer_historique(parametres["MEMOIRE_HISTORIQUE"] * 1024 * 1024)
+
+    # Initialisation de l'interface graphique
+    # et redimensionnement de la fenêtre au nombre de cases affichables
+    mode = MODE_EDITION
+    largeur_fenetre = EPAISSEUR_LIGNE + (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) * nb_colonnes
+    hauteur_fenetre = EPAISSEUR_LIGNE + (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE) * nb_lignes
+    fenetre = pygame.display.set_mode((largeur_fenetre, hauteur_fenetre))
+    fond = creer_fond()
+    sprites = creer_sprites()
+    pixels = creer_pixels()
+    police_mesures = None # police de l'affichage des mesures, si elles sont affichées
+    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
+    afficher_plateau()
 
-            if event.key == pygame.K_ESCAPE: # Changer de mode
+    # Les générations sont calculées en arrière-plan, la boucle principale se contentant d'afficher
+    # la dernière à la fréquence de rafraîchissement et de traiter les événements
+    calcul = creer_calcul()
+    calcul["tache"].start()
+
+    # Boucle principale du programme
+    programme_termine = False
+    horloge = GAME_TIME.Clock()
+    dernier_affichage = GAME_TIME.get_ticks()
+    derniere_progression = dernier_affichage # dernier affichage de la progression de l'avance rapide
+    encadre = (0, 0, 1, 1)
+    zone_utile = {"X_1": -1, "Y_1": -1, "X_2": nb_colonnes, "Y_2": nb_lignes}
+    sauvegarde = None # tâche de sauvegarde de la dernière partie
+    while not programme_termine:
+
+        if mode == MODE_AVANCE:
+            if calcul["objectif"] is None:
+                # Fin de l'avance rapide, la génération atteinte étant affichée en pause
+                mode = MODE_PAUSE
+            elif GAME_TIME.get_ticks() - derniere_progression >= RAFRAICHISSEMENT_AVANCE:
+                afficher_bandeau_avance()
+                derniere_progression = GAME_TIME.get_ticks()
+
+        if mode == MODE_EVOLUTION or mode == MODE_PAUSE:
+            dernier_affichage = afficher_calcul(dernier_affichage)
+
+        debut_evenements = time.perf_counter_ns()
+        for event in GAME_EVENTS.get():
+            if event.type == pygame.MOUSEMOTION:
+                position_souris = event.pos
+                if mode == MODE_BIBLIOTHEQUE or mode == MODE_FICHIER:
+                    encadre = deplacer_encadre(encadre)
+
+            if event.type == pygame.MOUSEBUTTONUP:
+                colonne = (position_souris[0] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+                ligne = (position_souris[1] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
                 if mode == MODE_EDITION:
-                    mode = MODE_EVOLUTION
-                    generation = 1
-                    nb_cellules = compter_cellules()
-                    statut = {"population": nb_cellules, "naissances": nb_cellules, "survie": 0, "deces": 0}
-                    population_min = nb_cellules
-                    population_max = nb_cellules
-                    afficher_bandeau_evolution()
-
-                    # Si la configuration de départ n'est pas vide, on la note au cas où elle serait intéressante
-                    zone_utile = detourer_plateau(0, 0, nb_colonnes - 1, nb_lignes - 1)
-                    if zone_utile["X_1"] != -1:
-                        nom_fichier = texte1[parametres["LANGUE"]]["DERNIERE_PARTIE"]
-                        sauvegarder_fichier(REPERTOIRE_SAUVEGARDE + "/" + texte1[parametres["LANGUE"]]["DERNIERE_PARTIE"] + ".cells")
-                else:
-                    mode = MODE_EDITION
-                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
-                    pygame.draw.rect(fenetre, NOIR, encadre, 1)
+                    moteur.basculer_cellule(simulation, colonne, ligne)
+                    dessiner_cellule(colonne, ligne)
                     afficher_ecran()
 
-            if mode == MODE_EDITION:
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_BIBLIOTHEQUE"]: # Sélectionner un motif dans la bibliothèque interne
-                    mode = MODE_BIBLIOTHEQUE
-                    indice = 0
-                    cle = list(bibliotheque)[indice]
-                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_BIBLIOTHEQUE"] + cle)
-                    hauteur_structure = len(bibliotheque[cle])
-                    largeur_structure = len(bibliotheque[cle][0])
-                    encadre = deplacer_encadre((0, 0, 1, 1))
-
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_FICHIER"]: # Sélectionner un fichier
-                    mode = MODE_FICHIER
-                    listeFichiers = [f for f in os.listdir(REPERTOIRE_SAUVEGARDE) if os.path.isfile(os.path.join(REPERTOIRE_SAUVEGARDE, f)) and (f.lower().endswith(".cells") or f.lower().endswith(".rle"))]
-                    indice = 0
-                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_FICHIER"] + listeFichiers[indice])
-                    structure = charger_fichier(REPERTOIRE_SAUVEGARDE + "/" + listeFichiers[indice])
-                    hauteur_structure = len(structure)
-                    largeur_structure = len(structure[0])
-                    encadre = deplacer_encadre((0, 0, 1, 1))
-
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_QUITTER"]: # Quitter
+            if event.type == pygame.KEYDOWN:
+
+                if event.type == GAME_GLOBALS.QUIT: # Quitter
                     programme_termine = True
 
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_SAUVEGARDER"]: # Sauvegarder le plateau au format PlainText (https://conwaylife.com/wiki/Plaintext)
-                    zone_utile = detourer_plateau(0, 0, nb_colonnes - 1, nb_lignes - 1)
-                    mode = MODE_SAISIE
-                    nom_fichier = ""
-                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_SAISIE"])
-
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_RESTAURER"]: # Restaurer le plateau de la dernière partie s'il existe
-                    chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + texte1[parametres["LANGUE"]]["DERNIERE_PARTIE"] + ".cells"
-                    if os.path.isfile(chemin_fichier):
-                        structure = charger_fichier_plaintext(chemin_fichier)
-                        position = charger_position_dans_fichier_plaintext(chemin_fichier)
-                        vider_plateau()
-                        for ligne in range(len(structure)):
-                            for colonne in range(len(structure[ligne])):
-                                if ligne + position[1] < nb_lignes and colonne + position[0] < nb_colonnes:
-                                    plateau[ligne + position[1]][colonne + position[0]] = structure[ligne][colonne]
-                        afficher_plateau()
-
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_VIDER"]: # Vider le plateau
-                    vider_plateau()
-
-            elif mode == MODE_SAISIE:
-                if (event.unicode >= "A" and event.unicode <= "Z") \
-                or (event.unicode >= "a" and event.unicode <= "z") \
-                or (event.unicode >= "0" and event.unicode <= "9") \
-                or event.unicode == ' ' \
-                or event.unicode == '-' \
-                or event.unicode == '_':
-                    if len(nom_fichier) < TAILLE_NOM_FICHIER:
-                        nom_fichier += event.unicode
-                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_SAISIE"] + nom_fichier)
-
-                if event.key == pygame.K_BACKSPACE:
-                    if len(nom_fichier) > 1:
-                        nom_fichier = nom_fichier[:-1]
-                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_SAISIE"] + nom_fichier)
-
-                if event.key == pygame.K_RETURN:
-                    # Sauvegarde avec demande de confirmation en cas d'écrasement
-                    chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + nom_fichier + ".cells"
-                    if not os.path.isfile(chemin_fichier):
-                        sauvegarder_fichier(chemin_fichier)
+                if event.key == pygame.K_ESCAPE: # Changer de mode
+                    if mode == MODE_EDITION:
+                        mode = MODE_EVOLUTION
+                        statut = moteur.demarrer(simulation)
+                        demarrer_detection(detecteur, simulation, parametres["PERIODES"])
+                        demarrer_historique(historique, simulation)
+
+                        # Si la configuration de départ n'est pas vide, on la note au cas où elle serait intéressante
+                        zone_utile = simulation["zone_utile"]
+                        if zone_utile["X_1"] != -1:
+                            sauvegarde = sauvegarder_derniere_partie(zone_utile, sauvegarde)
+
+                        with calcul["verrou"]:
+                            calcul["statut"] = statut
+                            calcul["generation"] = simulation["generation"]
+                            calcul["population_min"] = statut["population"]
+                            calcul["population_max"] = statut["population"]
+                            calcul["periode"] = None
+                            calcul["actif"] = True
+                        afficher_bandeau_evolution()
+                    else:
+                        # Arrêt de la tâche de calcul et affichage de la dernière génération calculée
+                        with calcul["verrou"]:
+                            calcul["actif"] = False
+                            calcul["objectif"] = None
+                            calcul["modifications"].clear()
+                            calcul["plateau_modifie"] = False
+                            afficher_plateau()
                         mode = MODE_EDITION
                         afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
-                    else:
-                        mode = MODE_CONFIRMATION
-                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_CONFIRMATION"])
-
-            elif mode == MODE_CONFIRMATION:
-                if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_CONFIRMATION"]: # confirmer
-                    sauvegarder_fichier(chemin_fichier)
-                mode = MODE_EDITION
-                afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
-
-            elif mode == MODE_BIBLIOTHEQUE:
-                if event.key == pygame.K_UP or event.key == pygame.K_LEFT \
-                or event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
-                    if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
-                        indice -= 1
-                    if event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
-                        indice += 1
-                    if indice < 0:
-                        indice = len(list(bibliotheque)) - 1
-                    elif indice == len(list(bibliotheque)):
-                        indice = 0
+                        pygame.draw.rect(fenetre, NOIR, encadre, 1)
+                        afficher_ecran()
 
-                    cle = list(bibliotheque)[indice]
-                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_BIBLIOTHEQUE"] + cle)
-                    hauteur_structure = len(bibliotheque[cle])
-                    largeur_structure = len(bibliotheque[cle][0])
-                    encadre = deplacer_encadre(encadre)
+                if mode == MODE_EDITION:
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_BIBLIOTHEQUE"]: # Sélectionner un motif dans la bibliothèque interne
+                        mode = MODE_BIBLIOTHEQUE
+                        indice = 0
+                        cle = list(bibliotheque)[indice]
+                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_BIBLIOTHEQUE"] + cle)
+                        hauteur_structure = len(bibliotheque[cle])
+                        largeur_structure = len(bibliotheque[cle][0])
+                        encadre = deplacer_encadre((0, 0, 1, 1))
+
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_FICHIER"]: # Sélectionner un fichier
+                        mode = MODE_FICHIER
+                        # Catalogue préparé par la tâche d'installation de la base de formes
+                        if installation is not None and installation["catalogue"] is not None:
+                            catalogue = installation["catalogue"]
+                            installation = None
+                        # Seuls les fichiers ajoutés ou modifiés depuis la dernière fois sont relus
+                        if mettre_a_jour_catalogue(catalogue, REPERTOIRE_SAUVEGARDE, parametres["LANGUE"]):
+                            sauvegarder_catalogue(catalogue, REPERTOIRE_SAUVEGARDE)
+                        listeFichiers = catalogue["noms"]
+                        indice = 0
+                        description = catalogue["fichiers"][listeFichiers[indice]]
+                        regle_structure = description["regle"]
+                        afficher_bandeau_fichier(listeFichiers[indice], regle_structure)
+                        hauteur_structure = description["hauteur"]
+                        largeur_structure = description["largeur"]
+                        encadre = deplacer_encadre((0, 0, 1, 1))
+
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_QUITTER"]: # Quitter
+                        programme_termine = True
+
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_SAUVEGARDER"]: # Sauvegarder le plateau au format PlainText (https://conwaylife.com/wiki/Plaintext)
+                        zone_utile = moteur.detourer(simulation)
+                        mode = MODE_SAISIE
+                        nom_fichier = ""
+                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_SAISIE"])
+
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_RESTAURER"]: # Restaurer le plateau de la dernière partie s'il existe
+                        chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + texte1[parametres["LANGUE"]]["DERNIERE_PARTIE"] + ".cells"
+                        if sauvegarde is not None:
+                            sauvegarde.join()
+                        if os.path.isfile(chemin_fichier):
+                            structure = charger_fichier_plaintext(chemin_fichier, parametres["LANGUE"])
+                            position = charger_position_dans_fichier_plaintext(chemin_fichier)
+                            # Un seul affichage du plateau, après le collage
+                            moteur.vider(simulation)
+                            coller_structure(structure, position[0], position[1])
+
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_VIDER"]: # Vider le plateau
+                        vider_plateau()
 
-                if event.key == pygame.K_RETURN:
-                    # Collage de la structure à la position de la souris
-                    colonne_plateau = (position_souris[0] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-                    ligne_plateau = (position_souris[1] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-                    cle = list(bibliotheque)[indice]
-                    for ligne in range(len(bibliotheque[cle])):
-                        for colonne in range(len(bibliotheque[cle][ligne])):
-                            if ligne + ligne_plateau < nb_lignes and colonne + colonne_plateau < nb_colonnes:
-                                plateau[ligne + ligne_plateau][colonne + colonne_plateau] = bibliotheque[cle][ligne][colonne]
-                    afficher_plateau()
-
-            elif mode == MODE_FICHIER:
-                if event.key == pygame.K_UP or event.key == pygame.K_LEFT \
-                or event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT \
-                or event.key == pygame.K_PAGEUP or event.key == pygame.K_PAGEDOWN \
-                or event.key == pygame.K_HOME or event.key == pygame.K_END:
-                    page = len(listeFichiers) // 20 # 5% de la liste
-                    if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
-                        indice -= 1
-                    elif event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
-                        indice += 1
-                    elif event.key == pygame.K_PAGEUP:
-                        if indice > page:
-                            indice -= page
+                    if event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT) \
+                    and parametres["MOTEUR"] == "creux": # Déplacer la fenêtre sur le plan infini
+                        deplacer_fenetre(event.key)
+
+                elif mode == MODE_SAISIE:
+                    if (event.unicode >= "A" and event.unicode <= "Z") \
+                    or (event.unicode >= "a" and event.unicode <= "z") \
+                    or (event.unicode >= "0" and event.unicode <= "9") \
+                    or event.unicode == ' ' \
+                    or event.unicode == '-' \
+                    or event.unicode == '_':
+                        if len(nom_fichier) < TAILLE_NOM_FICHIER:
+                            nom_fichier += event.unicode
+                            afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_SAISIE"] + nom_fichier)
+
+                    if event.key == pygame.K_BACKSPACE:
+                        if len(nom_fichier) > 1:
+                            nom_fichier = nom_fichier[:-1]
+                            afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_SAISIE"] + nom_fichier)
+
+                    if event.key == pygame.K_RETURN:
+                        # Sauvegarde avec demande de confirmation en cas d'écrasement
+                        chemin_fichier = REPERTOIRE_SAUVEGARDE + "/" + nom_fichier + ".cells"
+                        if not os.path.isfile(chemin_fichier):
+                            sauvegarder_fichier(chemin_fichier, nom_fichier, plateau, zone_utile)
+                            mode = MODE_EDITION
+                            afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
                         else:
+                            mode = MODE_CONFIRMATION
+                            afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_CONFIRMATION"])
+
+                elif mode == MODE_CONFIRMATION:
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_CONFIRMATION"]: # confirmer
+                        # Le fichier écrasé peut être celui de la dernière partie
+                        if sauvegarde is not None:
+                            sauvegarde.join()
+                        sauvegarder_fichier(chemin_fichier, nom_fichier, plateau, zone_utile)
+                    mode = MODE_EDITION
+                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_EDITION"])
+
+                elif mode == MODE_BIBLIOTHEQUE:
+                    if event.key == pygame.K_UP or event.key == pygame.K_LEFT \
+                    or event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
+                        if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
+                            indice -= 1
+                        if event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
+                            indice += 1
+                        if indice < 0:
+                            indice = len(list(bibliotheque)) - 1
+                        elif indice == len(list(bibliotheque)):
                             indice = 0
-                    elif event.key == pygame.K_PAGEDOWN:
-                        if indice < len(listeFichiers) - page:
-                            indice += page
-                        else:
+
+                        cle = list(bibliotheque)[indice]
+                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_BIBLIOTHEQUE"] + cle)
+                        hauteur_structure = len(bibliotheque[cle])
+                        largeur_structure = len(bibliotheque[cle][0])
+                        encadre = deplacer_encadre(encadre)
+
+                    if event.key == pygame.K_RETURN:
+                        # Collage de la structure à la position de la souris
+                        colonne_plateau = (position_souris[0] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+                        ligne_plateau = (position_souris[1] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+                        cle = list(bibliotheque)[indice]
+                        coller_structure(bibliotheque[cle], colonne_plateau, ligne_plateau)
+
+                elif mode == MODE_FICHIER:
+                    if event.key == pygame.K_UP or event.key == pygame.K_LEFT \
+                    or event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT \
+                    or event.key == pygame.K_PAGEUP or event.key == pygame.K_PAGEDOWN \
+                    or event.key == pygame.K_HOME or event.key == pygame.K_END:
+                        page = len(listeFichiers) // 20 # 5% de la liste
+                        if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
+                            indice -= 1
+                        elif event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
+                            indice += 1
+                        elif event.key == pygame.K_PAGEUP:
+                            if indice > page:
+                                indice -= page
+                            else:
+                                indice = 0
+                        elif event.key == pygame.K_PAGEDOWN:
+                            if indice < len(listeFichiers) - page:
+                                indice += page
+                            else:
+                                indice = len(listeFichiers) - 1
+                        elif event.key == pygame.K_HOME:
+                            indice = 0
+                        elif event.key == pygame.K_END:
                             indice = len(listeFichiers) - 1
-                    elif event.key == pygame.K_HOME:
-                        indice = 0
-                    elif event.key == pygame.K_END:
-                        indice = len(listeFichiers) - 1
-                    if indice < 0:
-                        indice = len(listeFichiers) - 1
-                    elif indice == len(listeFichiers):
-                        indice = 0
+                        if indice < 0:
+                            indice = len(listeFichiers) - 1
+                        elif indice == len(listeFichiers):
+                            indice = 0
 
-                    afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_FICHIER"] + listeFichiers[indice])
-                    structure = charger_fichier(REPERTOIRE_SAUVEGARDE + "/" + listeFichiers[indice])
-                    hauteur_structure = len(structure)
-                    largeur_structure = len(structure[0])
-                    encadre = deplacer_encadre(encadre)
+                        # Les dimensions de la structure sont connues sans relire le fichier
+                        description = catalogue["fichiers"][listeFichiers[indice]]
+                        regle_structure = description["regle"]
+                        afficher_bandeau_fichier(listeFichiers[indice], regle_structure)
+                        hauteur_structure = description["hauteur"]
+                        largeur_structure = description["largeur"]
+                        encadre = deplacer_encadre(encadre)
+
+                    if event.key == pygame.K_RETURN:
+                        # Collage de la structure à la position de la souris
+                        colonne_plateau = (position_souris[0] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+                        ligne_plateau = (position_souris[1] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
+                        if description["format"] == "rle" \
+                        and (parametres["MOTEUR"] in ("creux", "hashlife") or largeur_structure * hauteur_structure > nb_lignes * nb_colonnes):
+                            # Structure lue sous forme de coordonnées, sans cases mortes : sur plan
+                            # infini, ou quand elle est plus grande que le plateau
+                            cellules = charger_cellules(catalogue, REPERTOIRE_SAUVEGARDE, listeFichiers[indice], parametres["LANGUE"])
+                            coller_cellules(cellules, colonne_plateau, ligne_plateau)
+                        else:
+                            structure = charger_structure(catalogue, REPERTOIRE_SAUVEGARDE, listeFichiers[indice], parametres["LANGUE"])
+                            coller_structure(structure, colonne_plateau, ligne_plateau)
+                        if regle_structure is not None:
+                            adopter_regle(regle_structure)
+
+                elif mode == MODE_PAUSE:
+                    if event.key == pygame.K_SPACE: # Remettre l'évolution en marche
+                        mode = MODE_EVOLUTION
+                        with calcul["verrou"]:
+                            reprendre_evolution()
+                        afficher_bandeau_evolution()
 
-                if event.key == pygame.K_RETURN:
-                    # Collage de la structure à la position de la souris
-                    colonne_plateau = (position_souris[0] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-                    ligne_plateau = (position_souris[1] // (parametres["LARGEUR_CASE"] + EPAISSEUR_LIGNE))
-                    for ligne in range(len(structure)):
-                        for colonne in range(len(structure[ligne])):
-                            if ligne + ligne_plateau < nb_lignes and colonne + colonne_plateau < nb_colonnes:
-                                plateau[ligne + ligne_plateau][colonne + colonne_plateau] = structure[ligne][colonne]
-                    afficher_plateau()
-
-            elif mode == MODE_PAUSE:
-                if event.key == pygame.K_SPACE: # Remettre l'évolution en marche
-                    mode = MODE_EVOLUTION
-                    afficher_bandeau_evolution()
-
-            else: # if mode == MODE_EVOLUTION
-                if event.unicode == "+": # Accélérer l'évolution
-                    parametres["CYCLE_DE_VIE"] //= 2
-                    if parametres["CYCLE_DE_VIE"] == 0: # Jusqu'à un tick d'horloge maximum
-                        parametres["CYCLE_DE_VIE"] = 1
-                    else:
+                    if event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT) \
+                    and parametres["MOTEUR"] in ("creux", "hashlife"): # Déplacer la fenêtre sur le plan infini
+                        with calcul["verrou"]:
+                            deplacer_fenetre(event.key)
+
+                    elif event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_PAGEUP, pygame.K_PAGEDOWN, pygame.K_HOME, pygame.K_END): # Parcourir l'historique
+                        with calcul["verrou"]:
+                            generation = simulation["generation"]
+                            if event.key == pygame.K_LEFT:
+                                generation -= 1
+                            elif event.key == pygame.K_RIGHT:
+                                generation += 1
+                            elif event.key == pygame.K_PAGEUP:
+                                generation -= PAS_HISTORIQUE
+                            elif event.key == pygame.K_PAGEDOWN:
+                                generation += PAS_HISTORIQUE
+                            elif event.key == pygame.K_HOME:
+                                generation = 0
+                            else:
+                                generation = sys.maxsize
+                            revenir_generation(generation)
+
+                elif mode == MODE_EVOLUTION:
+                    if event.unicode == "+": # Accélérer l'évolution
+                        if parametres["CYCLE_DE_VIE"] > 0: # Jusqu'à la vitesse maximale (cycle de vie nul)
+                            parametres["CYCLE_DE_VIE"] //= 2
+                            afficher_bandeau_evolution()
+
+                    if event.unicode == "-": # Ralentir l'évolution
+                        parametres["CYCLE_DE_VIE"] = max(parametres["CYCLE_DE_VIE"] * 2, 1)
                         afficher_bandeau_evolution()
 
-                if event.unicode == "-": # Ralentir l'évolution
-                    parametres["CYCLE_DE_VIE"] *= 2
-                    afficher_bandeau_evolution()
+                    if event.key == pygame.K_SPACE: # Mettre l'évolution en pause
+                        mode = MODE_PAUSE
+                        with calcul["verrou"]:
+                            calcul["actif"] = False
+                        afficher_bandeau_evolution()
+
+                    if event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT) \
+                    and parametres["MOTEUR"] in ("creux", "hashlife"): # Déplacer la fenêtre sur le plan infini
+                        with calcul["verrou"]:
+                            deplacer_fenetre(event.key)
+
+                elif mode == MODE_GENERATION:
+                    if event.unicode >= "0" and event.unicode <= "9":
+                        if len(generation_saisie) < TAILLE_GENERATION:
+                            generation_saisie += event.unicode
+                            afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_GENERATION"] + generation_saisie)
+
+                    if event.key == pygame.K_BACKSPACE:
+                        if generation_saisie:
+                            generation_saisie = generation_saisie[:-1]
+                            afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_GENERATION"] + generation_saisie)
+
+                    if event.key == pygame.K_RETURN:
+                        mode = MODE_PAUSE
+                        if generation_saisie:
+                            with calcul["verrou"]:
+                                if atteindre_generation(int(generation_saisie)):
+                                    mode = MODE_AVANCE
+                        if mode == MODE_AVANCE:
+                            afficher_bandeau_avance()
+                            derniere_progression = GAME_TIME.get_ticks()
+                        else:
+                            afficher_bandeau_evolution()
+
+                elif mode == MODE_AVANCE:
+                    if event.key == pygame.K_SPACE: # Interrompre l'avance rapide
+                        with calcul["verrou"]:
+                            if calcul["objectif"] is not None:
+                                calcul["objectif"] = None
+                                calcul["actif"] = False
+                                calcul["plateau_modifie"] = True
+                                calcul["nouveau"] = True
+
+                if mode == MODE_EVOLUTION or mode == MODE_PAUSE:
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_GENERATION"]: # Aller à une génération
+                        with calcul["verrou"]:
+                            calcul["actif"] = False
+                        mode = MODE_GENERATION
+                        generation_saisie = ""
+                        afficher_bandeau(texte2[parametres["LANGUE"]][libelles]["MODE_GENERATION"])
+
+                if mode == MODE_EVOLUTION or mode == MODE_PAUSE:
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_MESURES"]: # Afficher ou masquer les mesures
+                        with calcul["verrou"]:
+                            if police_mesures is None:
+                                police_mesures = pygame.font.Font(None, TAILLE_POLICE_MESURES)
+                                afficher_mesures()
+                            else:
+                                # Les cases masquées par les mesures sont redessinées
+                                police_mesures = None
+                                afficher_plateau()
+
+                    if event.unicode.lower() == texte1[parametres["LANGUE"]]["TOUCHE_EXPORTER"]: # Exporter les mesures aux formats CSV et JSON
+                        exporter_mesures_partie()
+
+            if event.type == pygame.QUIT:
+                programme_termine = True
 
-                if event.key == pygame.K_SPACE: # Mettre l'évolution en pause
-                    mode = MODE_PAUSE
-                    afficher_bandeau_evolution()
+        if mode == MODE_EVOLUTION:
+            ajouter_duree(mesures, "evenements", time.perf_counter_ns() - debut_evenements)
 
-        if event.type == pygame.QUIT:
-            programme_termine = True
+        horloge.tick(IMAGES_PAR_SECONDE)
 
-pygame.quit()
-sys.exit()
+    calcul["termine"] = True
+    calcul["tache"].join()
+    if sauvegarde is not None:
+        sauvegarde.join()
+    moteur.terminer(simulation)
+    pygame.quit()
+    sys.exit()
 """
 ### Idées d'améliorations ##############################################
 - cycle de vie en centièmes de secondes plutôt qu'en ticks d'horloge pour ceux qui veulent aller
@@ -933,9 +1178,8 @@ sys.exit()
             - fermé (comme actuellement)
             - fermé électrique (tue toutes les cellules qui touche le bord)
             - ouvert
-                - passer à un stockage relatif plutôt que matriciel
-                    - par exemple: matrice à partir du coin supérieur gauche sur un plateau infini
-                      et troué
+                - passer à un stockage relatif plutôt que matriciel (fait avec les moteurs
+                  creux et hashlife)
 - plus d'options d'édition
     - mode sélection de zone
         - couper, coller
@@ -951,8 +1195,8 @@ sys.exit()
     - avec calcul de hachage de la structure originelle
     - et détecteur de configurations intéressantes:
         - oscillateurs (calculer hash configuration initiale et courante et indiquer période si
-          égalité)
-        - vaisseaux (idem si position de départ et d'arrivée différente)
+          égalité) (fait pour le plateau courant dans periodes.py)
+        - vaisseaux (idem si position de départ et d'arrivée différente) (idem)
     => objectifs:
         - identifier une liste de valeurs de hachage
           de "natures mortes" et "d'oscillateurs" ne nécessitant pas de recalcul
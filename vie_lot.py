@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+""" Exécution de simulations sans affichage
+Titre : Le jeu de la Vie
+Auteur : Hubert Tournier
+Création : 17/10/2026
+Version : 1.2 (17/10/2026)
+Description :
+- Charge une structure depuis un fichier .cells ou .rle, la fait évoluer du nombre de générations
+  demandé avec la règle et le moteur d'évolution du fichier de configuration (ou ceux indiqués),
+  puis sauvegarde la structure finale au format Plain Text (ou Run Length Encoded si le fichier
+  de sortie a l'extension .rle) et les statistiques de chaque génération au format CSV
+- N'importe pas PyGame, ce qui permet d'enchaîner les simulations sur un serveur sans écran
+- Sur les moteurs à plateau borné, la structure est entourée d'une marge de cases mortes
+- L'évolution peut s'arrêter dès que la configuration se répète (oscillateur ou vaisseau, option
+  --periode), la période et le déplacement détectés étant alors affichés
+- Les durées des phases de chaque génération peuvent être exportées au format CSV ou JSON pour
+  comparer les moteurs d'évolution (option --mesures)
+Utilisation :
+  python3 vie_lot.py structure.rle -g 1000 -o finale.cells -s statistiques.csv
+  python3 vie_lot.py structure.rle -g 1000 -m binaire --mesures binaire.json
+"""
+
+import argparse
+import csv
+import os
+import time
+
+from langues import *
+from configuration import FICHIER_CONFIGURATION, charger_ou_creer_fichier_de_configuration
+from fichiers import charger_cellules_run_length_encoded, charger_fichier, charger_regle_dans_fichier, sauvegarder_fichier
+from mesures import creer_mesures, enregistrer_generation, exporter_mesures
+from periodes import PERIODES_ARRET, creer_detecteur, demarrer_detection
+from regles import compiler_regle
+import moteur
+from moteur import CELLULE_MORTE, MOTEURS
+import periodes
+
+MARGE = 100 # cases
+COLONNES_STATISTIQUES = ("generation", "population", "naissances", "survie", "deces")
+
+########################################################################
+def charger_structure(chemin_fichier, langue):
+    """ Retourne la largeur, la hauteur et la liste des coordonnées (colonne, ligne) des cellules
+    vivantes de la structure contenue dans un fichier, ou None """
+    if chemin_fichier.lower().endswith(".rle"):
+        # Lecture directe des cellules vivantes, sans développer les cellules mortes
+        return charger_cellules_run_length_encoded(chemin_fichier, langue)
+    structure = charger_fichier(chemin_fichier, langue)
+    if structure is None:
+        return None
+    cellules = []
+    for ligne, cases in enumerate(structure):
+        for colonne, case in enumerate(cases):
+            if case != CELLULE_MORTE:
+                cellules.append((colonne, ligne))
+    return (len(structure[0]) if structure else 0), len(structure), cellules
+
+########################################################################
+def simuler(structure, parametres, nb_generations, marge=MARGE, mesures=None, arret_periode=False):
+    """ Fait évoluer une structure (largeur, hauteur et liste des coordonnées de ses cellules
+    vivantes) et retourne la structure finale, sa position par rapport à la structure initiale, la
+    liste des numéros de génération et statuts de chaque génération et le cycle détecté si
+    l'évolution s'est arrêtée dès que la configuration se répétait (sinon None). Les durées des
+    phases de chaque génération sont enregistrées dans les mesures si elles sont fournies """
+    regle = compiler_regle(parametres["REGLE"])
+    largeur, hauteur, cellules = structure
+    simulation = moteur.creer_simulation(parametres, regle, hauteur + 2 * marge, largeur + 2 * marge, affichage=False)
+    moteur.coller_cellules(simulation, cellules, marge, marge)
+    if mesures is not None:
+        simulation["chronometre"] = {}
+
+    # Evolution jusqu'à la génération demandée ou l'extinction
+    statut = moteur.demarrer(simulation)
+    detecteur = creer_detecteur()
+    if arret_periode:
+        demarrer_detection(detecteur, simulation, PERIODES_ARRET)
+    statuts = [(simulation["generation"], statut)]
+    while simulation["generation"] + simulation["generations_par_cycle"] <= nb_generations + 1 and statut["population"] > 0 \
+    and detecteur["periode"] is None:
+        statut = periodes.avancer(simulation, detecteur, PERIODES_ARRET)["statut"]
+        statuts.append((simulation["generation"], statut))
+        if mesures is not None:
+            enregistrer_generation(mesures, simulation["generation"], simulation["chronometre"])
+
+    structure_finale, position = moteur.extraire_structure(simulation)
+    moteur.terminer(simulation)
+    if structure_finale:
+        position = (position[0] - marge, position[1] - marge)
+    return structure_finale, position, statuts, detecteur["periode"]
+
+########################################################################
+def sauvegarder_statistiques(chemin_fichier, statuts):
+    """ Sauvegarde les statuts de chaque génération dans un fichier au format CSV """
+    with open(chemin_fichier, "w", newline="") as fichier:
+        ecriture = csv.writer(fichier)
+        ecriture.writerow(COLONNES_STATISTIQUES)
+        for generation, statut in statuts:
+            ecriture.writerow([generation] + [statut[cle] for cle in COLONNES_STATISTIQUES[1:]])
+
+### Programme principal ################################################
+
+# Protection nécessaire au moteur parallèle : sous Windows, ses processus de calcul réimportent ce
+# module
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Le jeu de la Vie, sans affichage")
+    analyseur.add_argument("structure", help="fichier .cells ou .rle de la structure initiale")
+    analyseur.add_argument("-g", "--generations", type=int, default=100, help="nombre de générations (défaut : 100)")
+    analyseur.add_argument("-o", "--sortie", help="fichier .cells ou .rle de la structure finale (défaut : <structure>.finale.cells)")
+    analyseur.add_argument("-s", "--statistiques", help="fichier CSV des statistiques (défaut : <structure>.statistiques.csv)")
+    analyseur.add_argument("-r", "--regle", help="règle du jeu en notation B/S ou de Hensel (défaut : celle du fichier .rle, sinon de la configuration)")
+    analyseur.add_argument("-m", "--moteur", choices=MOTEURS, help="moteur d'évolution (défaut : celui de la configuration)")
+    analyseur.add_argument("-c", "--configuration", default=FICHIER_CONFIGURATION, help="fichier de configuration (défaut : " + FICHIER_CONFIGURATION + ")")
+    analyseur.add_argument("--marge", type=int, default=MARGE, help="cases mortes autour de la structure sur plateau borné (défaut : " + str(MARGE) + ")")
+    analyseur.add_argument("-p", "--periode", action="store_true", help="arrêter l'évolution dès que la configuration se répète (oscillateur ou vaisseau, sauf moteur hashlife)")
+    analyseur.add_argument("--mesures", help="fichier CSV ou JSON (extension .json) des durées des phases de chaque génération")
+    arguments = analyseur.parse_args()
+
+    # Le fichier de configuration n'est pas créé s'il n'existe pas
+    parametres = charger_ou_creer_fichier_de_configuration(arguments.configuration, creer=False)
+    if arguments.moteur is not None:
+        parametres["MOTEUR"] = arguments.moteur
+    if parametres["MOTEUR"] == "numpy":
+        try:
+            moteur.charger_moteur("numpy")
+        except ImportError:
+            print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["MOTEUR_INDISPONIBLE"] + parametres["MOTEUR"])
+            parametres["MOTEUR"] = "python"
+
+    structure = charger_structure(arguments.structure, parametres["LANGUE"])
+    if structure is None:
+        analyseur.error(texte1[parametres["LANGUE"]]["FICHIER"] + "=" + arguments.structure)
+
+    # Règle de la ligne de commande, sinon de l'en-tête du fichier, sinon de la configuration
+    regle_structure = charger_regle_dans_fichier(arguments.structure)
+    if arguments.regle is not None:
+        parametres["REGLE"] = arguments.regle
+    elif regle_structure is not None:
+        try:
+            compiler_regle(regle_structure)
+            parametres["REGLE"] = regle_structure
+        except ValueError:
+            print(texte1[parametres["LANGUE"]]["AVERTISSEMENT"] + ": " + texte1[parametres["LANGUE"]]["REGLE_INCONNUE"] + regle_structure)
+    try:
+        regle = compiler_regle(parametres["REGLE"])
+    except ValueError:
+        analyseur.error(texte1[parametres["LANGUE"]]["REGLE_INCONNUE"] + parametres["REGLE"])
+    try:
+        moteur.verifier_regle(parametres["MOTEUR"], regle)
+    except ValueError:
+        analyseur.error(texte1[parametres["LANGUE"]]["REGLE_B0"] + parametres["REGLE"])
+
+    nom_structure = os.path.splitext(os.path.basename(arguments.structure))[0]
+    if arguments.sortie is None:
+        arguments.sortie = nom_structure + ".finale.cells"
+    if arguments.statistiques is None:
+        arguments.statistiques = nom_structure + ".statistiques.csv"
+
+    # Toutes les générations sont gardées dans l'historique des mesures
+    mesures = creer_mesures(max(arguments.generations, 1)) if arguments.mesures is not None else None
+    chrono_1 = time.time()
+    structure, position, statuts, periode = simuler(structure, parametres, arguments.generations, arguments.marge, mesures, arguments.periode)
+    chrono_2 = time.time()
+    if periode is not None:
+        print(texte1[parametres["LANGUE"]]["PERIODE_DETECTEE"] + str(periode["generation"]) + " : "
+              + texte2[parametres["LANGUE"]]["long"]["PERIODE"] + "=" + str(periode["periode"]) + " "
+              + texte2[parametres["LANGUE"]]["long"]["DEPLACEMENT"] + "=" + str(periode["deplacement"]).replace(" ", ""))
+    if parametres["DEBUG"]:
+        print(texte1[parametres["LANGUE"]]["TERMINE"] + str(chrono_2 - chrono_1) + texte1[parametres["LANGUE"]]["SECONDES"])
+
+    # Zone couvrant toute la structure finale (sans ligne si elle s'est éteinte)
+    zone_utile = {"X_1": 0, "Y_1": 0, "X_2": len(structure[0]) - 1 if structure else -1, "Y_2": len(structure) - 1}
+    sauvegarder_fichier(arguments.sortie, nom_structure, structure, zone_utile, position, parametres["REGLE"])
+    sauvegarder_statistiques(arguments.statistiques, statuts)
+    if mesures is not None:
+        exporter_mesures(arguments.mesures, mesures, {"structure": nom_structure, "moteur": parametres["MOTEUR"], "regle": parametres["REGLE"]})